@@ -6,11 +6,14 @@ Architecture
 Phase 1 – Discovery (plain Python, deterministic)
   NewsDiscoveryAgent  →  list[DiscoveredNews]   (DuckDuckGo News, no LLM)
 
-Phase 2 – Processing (CrewAI crew, per article)
-  ContentWriterAgent  →  fetches source HTML, writes polished article (LLM)
-  ImageResearcherAgent →  finds specific, high-quality image (LLM + DDG + Wikipedia)
-
-Phase 3 – Persistence (plain Python, deterministic)
+Phase 2 – Processing (staged through the ingest_items queue, resumable)
+  fetched             →  source page prefetched and parsed
+  ContentWriterAgent  →  reads the prefetched source, writes polished article
+                         (LLM, AGENT_MAX_CONCURRENCY in parallel)
+  Image resolution    →  source og:image → keyword DDG search → Wikipedia
+                         → ImageResearcherAgent (LLM, only when all else fails)
+
+Phase 3 – Persistence (plain Python, deterministic, single writer thread)
   Save article + image to database via SQLAlchemy
 
 Why CrewAI?
@@ -24,8 +27,10 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from typing import Optional
 
 from pydantic import BaseModel
@@ -37,19 +42,51 @@ from app.database import SessionLocal
 from app.models import News, generate_slug
 from .auto_publish import (
     StoryDraft,
+    MAX_SOURCE_CHARS,
     OPENAI_API_KEY,
     OPENAI_MODEL,
+    ParsedArticle,
     _download_image,
-    _fetch_article_assets,
+    _extract_image_url,
+    _extract_search_keywords,
+    _fetch_article_html,
     _fetch_wikipedia_image,
+    _parse_article_html,
     _generate_unique_slug,
     _source_exists,
     _story_exists,
+    _canonical_url,
     _clean_title,
+    openai_rate_limiter,
 )
+from . import ingest_queue, jobs
+from .near_duplicate import find_near_duplicate, is_near_duplicate, record_fingerprint, story_fingerprint
+from .rate_limit import RateLimiter
+from .token_budget import budget_excerpt
 
 logger = logging.getLogger(__name__)
 
+# Crews processed in parallel. External services are protected by the shared
+# rate limiters below rather than by fixed sleeps between articles.
+AGENT_MAX_CONCURRENCY = max(1, int(os.getenv("AGENT_MAX_CONCURRENCY", "3")))
+# Source pages prefetched in parallel ahead of the writer crews.
+AGENT_FETCH_CONCURRENCY = max(1, int(os.getenv("INGEST_FETCH_CONCURRENCY", "8")))
+AGENT_PIPELINE = "agent"
+# DuckDuckGo has no published limit; a few requests in a burst, then ~1 every 2 s.
+ddg_rate_limiter = RateLimiter(float(os.getenv("DDG_RPM_LIMIT", "30")), burst=3)
+# Raw discovery results keyed by (query, region, max_results) → (results, expires_at).
+DDG_CACHE_TTL_SECS = int(os.getenv("DDG_CACHE_TTL_SECS", "900"))
+_discovery_cache: dict[tuple[str, str, int], tuple[list[dict], float]] = {}
+_discovery_cache_lock = threading.Lock()
+# A single-agent crew is charged up front for its worst case (max_iter=3).
+_CREW_LLM_CALLS = 3
+_CREW_TOKEN_ESTIMATE = 4000
+
+# Source pages the orchestrator already fetched, keyed by URL, so the writer
+# agent's fetch_article call does not download and parse them a second time.
+_prefetched_articles: dict[str, ParsedArticle] = {}
+_prefetched_lock = threading.Lock()
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Topic buckets – DDG picks the sources, no RSS feeds needed
 # ──────────────────────────────────────────────────────────────────────────────
@@ -106,21 +143,56 @@ class ArticleFetcherTool(BaseTool):
 
     def _run(self, url: str) -> str:
         try:
-            html, resolved_url, _ = _fetch_article_assets(url.strip())
-            if not html:
+            url = url.strip()
+            with _prefetched_lock:
+                article = _prefetched_articles.get(url)
+            if article is None:
+                article_html, _ = _fetch_article_html(url)
+                article = _parse_article_html(article_html)
+            if not article.text:
                 return "Could not fetch article content."
-            # Return plain text (BeautifulSoup strips HTML for the LLM)
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, "html.parser")
-            for tag in soup(["script", "style", "nav", "header", "footer", "aside"]):
-                tag.decompose()
-            text = soup.get_text(separator="\n", strip=True)
-            return text[:6000]  # cap to avoid token overflow
+            # Token-budgeted body paragraphs; raw page text only when none were found
+            excerpt = budget_excerpt(article.paragraphs, model=OPENAI_MODEL)
+            logger.info(
+                "[ArticleFetcherTool] %s: %d/%d tokens, %d/%d paragraphs",
+                url, excerpt.tokens, excerpt.budget,
+                excerpt.paragraphs_used, excerpt.paragraphs_total,
+            )
+            return excerpt.text or article.text[:MAX_SOURCE_CHARS]
         except Exception as exc:
             logger.warning("[ArticleFetcherTool] failed for %s: %s", url, exc)
             return "Could not fetch article content."
 
 
+def _search_ddg_image(query: str) -> str:
+    """Return the first sizeable DuckDuckGo Images hit for query, or empty string."""
+    try:
+        from duckduckgo_search import DDGS
+        ddg_rate_limiter.acquire()
+        with DDGS() as ddgs:
+            hits = list(
+                ddgs.images(
+                    query.strip(),
+                    max_results=15,
+                    safesearch="off",
+                    type_image="photo",
+                )
+            )
+        for hit in hits:
+            img_url = hit.get("image", "")
+            if not img_url or not img_url.startswith("http"):
+                continue
+            w = hit.get("width") or 0
+            h = hit.get("height") or 0
+            if (w and w < 400) or (h and h < 300):
+                continue
+            logger.info("[DDGImageSearchTool] found: %s", img_url)
+            return img_url
+    except Exception as exc:
+        logger.warning("[DDGImageSearchTool] failed for '%s': %s", query, exc)
+    return ""
+
+
 class DDGImageSearchTool(BaseTool):
     name: str = "search_image_ddg"
     description: str = (
@@ -131,30 +203,7 @@ class DDGImageSearchTool(BaseTool):
     )
 
     def _run(self, query: str) -> str:
-        try:
-            from duckduckgo_search import DDGS
-            with DDGS() as ddgs:
-                hits = list(
-                    ddgs.images(
-                        query.strip(),
-                        max_results=15,
-                        safesearch="off",
-                        type_image="photo",
-                    )
-                )
-            for hit in hits:
-                img_url = hit.get("image", "")
-                if not img_url or not img_url.startswith("http"):
-                    continue
-                w = hit.get("width") or 0
-                h = hit.get("height") or 0
-                if (w and w < 400) or (h and h < 300):
-                    continue
-                logger.info("[DDGImageSearchTool] found: %s", img_url)
-                return img_url
-        except Exception as exc:
-            logger.warning("[DDGImageSearchTool] failed for '%s': %s", query, exc)
-        return ""
+        return _search_ddg_image(query)
 
 
 class WikipediaImageTool(BaseTool):
@@ -179,59 +228,89 @@ class WikipediaImageTool(BaseTool):
 # Phase 1 – News Discovery (plain Python, deterministic, no LLM cost)
 # ──────────────────────────────────────────────────────────────────────────────
 
+def _search_news(query: str, region: str, max_results: int) -> list[dict]:
+    """
+    Raw DuckDuckGo News results for query, served from a short-lived
+    in-process cache when the same query ran recently (e.g. an admin re-run
+    shortly after the scheduled one).
+    """
+    key = (query, region, max_results)
+    now = time.monotonic()
+    with _discovery_cache_lock:
+        cached = _discovery_cache.get(key)
+    if cached is not None and cached[1] > now:
+        logger.info("[Discovery] cache hit for '%s'", query)
+        return cached[0]
+
+    from duckduckgo_search import DDGS
+    ddg_rate_limiter.acquire()
+    with DDGS() as ddgs:
+        raw = list(ddgs.news(query, max_results=max_results, region=region, safesearch="off"))
+
+    with _discovery_cache_lock:
+        _discovery_cache[key] = (raw, now + DDG_CACHE_TTL_SECS)
+        for stale in [k for k, (_, expires_at) in _discovery_cache.items() if expires_at <= now]:
+            _discovery_cache.pop(stale, None)
+    return raw
+
+
 class NewsDiscoveryAgent:
     """
     Searches DuckDuckGo News for each topic bucket.
     No LLM involved – this is fast, cheap, and deterministic.
+
+    Buckets are queried concurrently under the shared DDG rate limiter, so
+    discovery takes roughly as long as the slowest single query. URLs are
+    deduplicated across buckets by canonical form, in bucket order.
     """
 
+    region = "in-en"
+
     def run(self, max_per_bucket: int = 5) -> list[DiscoveredNews]:
         try:
-            from duckduckgo_search import DDGS
+            import duckduckgo_search  # noqa: F401
         except ImportError:
             logger.error("duckduckgo-search not installed. Run: pip install duckduckgo-search")
             return []
 
+        with ThreadPoolExecutor(max_workers=len(_TOPIC_BUCKETS), thread_name_prefix="discovery") as pool:
+            futures = [
+                pool.submit(_search_news, bucket["query"], self.region, max_per_bucket * 3)
+                for bucket in _TOPIC_BUCKETS
+            ]
+
         results: list[DiscoveredNews] = []
         seen_urls: set[str] = set()
 
-        for bucket in _TOPIC_BUCKETS:
-            bucket_results: list[DiscoveredNews] = []
+        for bucket, future in zip(_TOPIC_BUCKETS, futures):
             try:
-                with DDGS() as ddgs:
-                    raw = list(
-                        ddgs.news(
-                            bucket["query"],
-                            max_results=max_per_bucket * 3,
-                            region="in-en",
-                            safesearch="off",
-                        )
-                    )
+                raw = future.result()
+            except Exception as exc:
+                logger.warning("[Discovery] topic='%s' failed: %s", bucket["topic"], exc)
+                continue
 
-                for item in raw:
-                    url = item.get("url", "").strip()
-                    if not url or url in seen_urls:
-                        continue
-                    seen_urls.add(url)
-                    bucket_results.append(
-                        DiscoveredNews(
-                            title=item.get("title", "").strip(),
-                            url=url,
-                            body=item.get("body", "").strip(),
-                            source=item.get("source", "").strip(),
-                            topic=bucket["topic"],
-                            tags=list(bucket["tags"]),
-                        )
+            bucket_results: list[DiscoveredNews] = []
+            for item in raw:
+                url = item.get("url", "").strip()
+                canonical = _canonical_url(url)
+                if not url or canonical in seen_urls:
+                    continue
+                seen_urls.add(canonical)
+                bucket_results.append(
+                    DiscoveredNews(
+                        title=item.get("title", "").strip(),
+                        url=url,
+                        body=item.get("body", "").strip(),
+                        source=item.get("source", "").strip(),
+                        topic=bucket["topic"],
+                        tags=list(bucket["tags"]),
                     )
-                    if len(bucket_results) >= max_per_bucket:
-                        break
+                )
+                if len(bucket_results) >= max_per_bucket:
+                    break
 
-                logger.info("[Discovery] topic='%s' found=%d", bucket["topic"], len(bucket_results))
-                results.extend(bucket_results)
-                time.sleep(1.5)
-
-            except Exception as exc:
-                logger.warning("[Discovery] topic='%s' failed: %s", bucket["topic"], exc)
+            logger.info("[Discovery] topic='%s' found=%d", bucket["topic"], len(bucket_results))
+            results.extend(bucket_results)
 
         return results
 
@@ -248,20 +327,8 @@ def _build_llm() -> LLM:
     )
 
 
-def _run_article_crew(item: DiscoveredNews) -> tuple[Optional[ArticleOutput], Optional[str]]:
-    """
-    Run a two-agent CrewAI crew for one article.
-
-    Returns
-    -------
-    (ArticleOutput, image_url) or (None, None) on failure.
-    image_url may be None if no image was found.
-    """
-    llm = _build_llm()
-
-    # ── Agents ──────────────────────────────────────────────────────────────
-
-    content_writer = Agent(
+def _build_content_writer(llm: LLM) -> Agent:
+    return Agent(
         role="Senior News Journalist",
         goal=(
             "Write accurate, engaging, and well-structured news articles "
@@ -281,7 +348,9 @@ def _run_article_crew(item: DiscoveredNews) -> tuple[Optional[ArticleOutput], Op
         allow_delegation=False,
     )
 
-    image_researcher = Agent(
+
+def _build_image_researcher(llm: LLM) -> Agent:
+    return Agent(
         role="Visual Content Researcher",
         goal=(
             "Find the single most relevant, high-quality image for each news article. "
@@ -300,9 +369,9 @@ def _run_article_crew(item: DiscoveredNews) -> tuple[Optional[ArticleOutput], Op
         allow_delegation=False,
     )
 
-    # ── Tasks ────────────────────────────────────────────────────────────────
 
-    write_task = Task(
+def _build_write_task(item: DiscoveredNews, agent: Agent) -> Task:
+    return Task(
         description=(
             f"Write a full news article about the following story.\n\n"
             f"Headline: {item.title}\n"
@@ -326,11 +395,13 @@ def _run_article_crew(item: DiscoveredNews) -> tuple[Optional[ArticleOutput], Op
             '  "content": "<p>Paragraph one...</p><p>Paragraph two...</p>"\n'
             '}'
         ),
-        agent=content_writer,
+        agent=agent,
         output_pydantic=ArticleOutput,
     )
 
-    image_task = Task(
+
+def _build_image_task(item: DiscoveredNews, agent: Agent) -> Task:
+    return Task(
         description=(
             f"Find a relevant, high-quality image for this news article.\n\n"
             f"Title: {item.title}\n"
@@ -346,20 +417,55 @@ def _run_article_crew(item: DiscoveredNews) -> tuple[Optional[ArticleOutput], Op
         expected_output=(
             "A single direct image URL starting with 'http', or the string 'none'."
         ),
-        agent=image_researcher,
-        context=[write_task],
+        agent=agent,
     )
 
-    # ── Crew ─────────────────────────────────────────────────────────────────
 
-    crew = Crew(
-        agents=[content_writer, image_researcher],
-        tasks=[write_task, image_task],
-        process=Process.sequential,
-        verbose=False,
-    )
+class ArticleCrewFactory:
+    """
+    Builds the LLM client and agents once per pipeline run; only the Tasks and
+    the Crew wrapping them are created per article.
+
+    CrewAI agents keep execution state while a crew runs, so each worker
+    thread gets its own agents (built on first use, then reused for every
+    article that thread processes) rather than sharing one set across
+    concurrent crews.
+    """
 
+    def __init__(self, llm: Optional[LLM] = None):
+        self.llm = llm or _build_llm()
+        self._local = threading.local()
+
+    def _agents(self) -> tuple[Agent, Agent]:
+        agents = getattr(self._local, "agents", None)
+        if agents is None:
+            agents = (_build_content_writer(self.llm), _build_image_researcher(self.llm))
+            self._local.agents = agents
+        return agents
+
+    def _crew(self, agent: Agent, task: Task) -> Crew:
+        return Crew(agents=[agent], tasks=[task], process=Process.sequential, verbose=False)
+
+    def build_writer(self, item: DiscoveredNews) -> tuple[Crew, Task]:
+        content_writer, _ = self._agents()
+        task = _build_write_task(item, content_writer)
+        return self._crew(content_writer, task), task
+
+    def build_image_researcher(self, item: DiscoveredNews) -> tuple[Crew, Task]:
+        _, image_researcher = self._agents()
+        task = _build_image_task(item, image_researcher)
+        return self._crew(image_researcher, task), task
+
+
+def _run_article_crew(
+    item: DiscoveredNews,
+    factory: Optional[ArticleCrewFactory] = None,
+) -> Optional[ArticleOutput]:
+    """Run the ContentWriter crew for one article. Returns None on failure."""
     try:
+        crew, write_task = (factory or ArticleCrewFactory()).build_writer(item)
+
+        openai_rate_limiter.acquire(tokens=_CREW_TOKEN_ESTIMATE, requests=_CREW_LLM_CALLS)
         crew.kickoff()
 
         # Parse article output
@@ -370,16 +476,59 @@ def _run_article_crew(item: DiscoveredNews) -> tuple[Optional[ArticleOutput], Op
             raw = write_task.output.raw or "{}"
             data = json.loads(raw)
             article_out = ArticleOutput(**data)
+        return article_out
 
-        # Parse image URL
-        image_url_raw = (image_task.output.raw or "").strip()
-        image_url = image_url_raw if image_url_raw.startswith("http") else None
+    except Exception as exc:
+        logger.exception("[CrewAI] crew failed for '%s': %s", item.title, exc)
+        return None
+
+
+def _run_image_crew(
+    item: DiscoveredNews,
+    factory: Optional[ArticleCrewFactory] = None,
+) -> Optional[str]:
+    """Ask the ImageResearcher agent for an image URL. Last resort — costs LLM calls."""
+    try:
+        crew, image_task = (factory or ArticleCrewFactory()).build_image_researcher(item)
+
+        openai_rate_limiter.acquire(tokens=_CREW_TOKEN_ESTIMATE, requests=_CREW_LLM_CALLS)
+        crew.kickoff()
 
-        return article_out, image_url
+        image_url_raw = (image_task.output.raw or "").strip()
+        return image_url_raw if image_url_raw.startswith("http") else None
 
     except Exception as exc:
-        logger.exception("[CrewAI] crew failed for '%s': %s", item.title, exc)
-        return None, None
+        logger.exception("[CrewAI] image crew failed for '%s': %s", item.title, exc)
+        return None
+
+
+def _resolve_image(
+    item: DiscoveredNews,
+    article: Optional[ParsedArticle],
+    factory: ArticleCrewFactory,
+) -> tuple[Optional[bytes], Optional[str], Optional[str]]:
+    """
+    Find and download an image, cheapest strategy first: the source page's
+    og:image / lead image, a deterministic entity keyword search on DDG,
+    Wikipedia, and only then the LLM image agent.
+    """
+    query = _extract_search_keywords(item.title, item.tags)
+    strategies = (
+        ("source page", lambda: _extract_image_url({}, article)),
+        ("keyword search", lambda: _search_ddg_image(query) if query else ""),
+        ("wikipedia", lambda: _fetch_wikipedia_image(item.title, item.tags)),
+        ("image agent", lambda: _run_image_crew(item, factory)),
+    )
+    for label, find_url in strategies:
+        image_url = find_url()
+        if not image_url:
+            continue
+        image = _download_image(image_url)
+        if image[0]:
+            logger.info("[Image] '%s' resolved via %s: %s", item.title, label, image_url)
+            return image
+    logger.info("[Image] no image found for '%s'", item.title)
+    return None, None, None
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -394,15 +543,16 @@ def _persist(
     image_data: Optional[bytes],
     image_filename: Optional[str],
     image_mimetype: Optional[str],
-) -> bool:
+    fingerprint: Optional[list[str]] = None,
+) -> Optional[News]:
     if _source_exists(db, source_url):
         logger.info("[Persist] skipping existing source: %s", source_url)
-        return False
+        return None
 
     base_slug = generate_slug(article.title)
     if _story_exists(db, article.title, base_slug):
         logger.info("[Persist] skipping existing title: %s", article.title)
-        return False
+        return None
 
     news = News(
         title=_clean_title(article.title),
@@ -416,93 +566,272 @@ def _persist(
         image_mimetype=image_mimetype,
     )
     db.add(news)
+    if fingerprint is not None:
+        db.flush()
+        record_fingerprint(db, fingerprint, news.id, source_url)
     db.commit()
     db.refresh(news)
     logger.info("[Persist] published: %s", article.title)
-    return True
+    return news
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Orchestrator
 # ──────────────────────────────────────────────────────────────────────────────
 
+def _queued_news(item: ingest_queue.QueuedItem) -> DiscoveredNews:
+    payload = item.payload
+    return DiscoveredNews(
+        title=payload["title"],
+        url=item.source_url,
+        body=payload.get("body", ""),
+        source=payload.get("source", ""),
+        topic=item.topic,
+        tags=list(payload.get("tags", [])),
+    )
+
+
+def _queued_article(item: ingest_queue.QueuedItem) -> Optional[ParsedArticle]:
+    data = item.payload.get("article")
+    if not data:
+        return None
+    return ParsedArticle(
+        meta_description=data["meta_description"],
+        image_urls=tuple(data["image_urls"]),
+        paragraphs=tuple(data["paragraphs"]),
+        text=data["text"],
+    )
+
+
+def _fetch_queued_item(item: ingest_queue.QueuedItem) -> Optional[ParsedArticle]:
+    """Prefetch the source page. A failure is not fatal: the writer's tool retries it."""
+    try:
+        article_html, _ = _fetch_article_html(item.source_url)
+        return _parse_article_html(article_html)
+    except Exception as exc:
+        logger.warning("[Orchestrator] could not prefetch %s: %s", item.source_url, exc)
+        return None
+
+
+def _write_queued_item(item: ingest_queue.QueuedItem, factory: ArticleCrewFactory) -> ArticleOutput:
+    news_item = _queued_news(item)
+    article = _queued_article(item)
+    if article is not None:
+        with _prefetched_lock:
+            _prefetched_articles[item.source_url] = article
+    try:
+        article_out = _run_article_crew(news_item, factory)
+    finally:
+        with _prefetched_lock:
+            _prefetched_articles.pop(item.source_url, None)
+    if article_out is None:
+        raise RuntimeError(f"article crew produced no output for '{news_item.title}'")
+    return article_out
+
+
+def _image_queued_item(
+    item: ingest_queue.QueuedItem,
+    factory: ArticleCrewFactory,
+) -> tuple[Optional[bytes], Optional[str], Optional[str]]:
+    return _resolve_image(_queued_news(item), _queued_article(item), factory)
+
+
 class AgentOrchestrator:
     """
     Coordinates the full pipeline:
-      Discovery → CrewAI (write + image) → DB save
+      Discovery → fetch → CrewAI write → image → DB save
+
+    Discovered items go through the persistent ingest queue, so a restart
+    resumes from each item's last completed stage. Up to ``max_workers``
+    crews run concurrently; the calling thread records every outcome, so the
+    SQLAlchemy session never crosses threads. A topic never has more items
+    fetched or written than it has remaining quota.
     """
 
+    def __init__(self, max_workers: int = AGENT_MAX_CONCURRENCY):
+        self.max_workers = max(1, max_workers)
+
     def run(self, max_per_topic: int = 5) -> dict[str, int]:
         if not OPENAI_API_KEY:
             logger.error("[Orchestrator] OPENAI_API_KEY not set — aborting.")
-            return {"discovered": 0, "published": 0, "skipped": 0, "failed": 0}
+            return {"discovered": 0, "published": 0, "skipped": 0, "failed": 0, "retried": 0}
 
         stats: dict[str, int] = {
             "discovered": 0,
             "published": 0,
             "skipped": 0,
             "failed": 0,
+            "retried": 0,
         }
 
         # Phase 1: Discover news
-        items = NewsDiscoveryAgent().run(max_per_bucket=max_per_topic)
+        with jobs.track_stage("discover"):
+            items = NewsDiscoveryAgent().run(max_per_bucket=max_per_topic)
         stats["discovered"] = len(items)
         logger.info("[Orchestrator] discovered %d articles", len(items))
 
+        owner = ingest_queue.worker_id()
+        factory = ArticleCrewFactory()
+        published: dict[str, int] = {}
         db = SessionLocal()
-        topic_counts: dict[str, int] = {}
-
         try:
-            for item in items:
-                if topic_counts.get(item.topic, 0) >= max_per_topic:
-                    continue
+            ingest_queue.prune(db)
+            with jobs.track_stage("discover"):
+                self._enqueue(db, items, stats)
+            # Phases 2 and 3, one stage per pass, until nothing is claimable
+            while self._run_stages(db, owner, factory, max_per_topic, published, stats):
+                jobs.report_progress(stats)
+        finally:
+            db.close()
+
+        logger.info("[Orchestrator] run complete: %s", stats)
+        return stats
 
+    def _enqueue(self, db: Session, items: list[DiscoveredNews], stats: dict[str, int]) -> None:
+        fingerprints = ingest_queue.active_payload_values(db, AGENT_PIPELINE, "fingerprint")
+        for item in items:
+            try:
+                if ingest_queue.is_queued(db, AGENT_PIPELINE, item.url):
+                    continue  # queued by an earlier run; resumed or already finished
                 # Skip if source already in DB (fast check before LLM spend)
                 if _source_exists(db, item.url):
                     stats["skipped"] += 1
                     continue
+                # Same event from another outlet, already published or queued
+                fingerprint = story_fingerprint(_clean_title(item.title))
+                if any(is_near_duplicate(fingerprint, other) for other in fingerprints) or (
+                    find_near_duplicate(db, fingerprint) is not None
+                ):
+                    logger.info("[Orchestrator] skipping near-duplicate '%s'", item.title)
+                    stats["skipped"] += 1
+                    continue
+                payload = {
+                    "title": item.title,
+                    "body": item.body,
+                    "source": item.source,
+                    "tags": list(item.tags),
+                    "fingerprint": fingerprint,
+                }
+                if ingest_queue.enqueue(db, AGENT_PIPELINE, item.topic, item.url, payload):
+                    fingerprints.append(fingerprint)
+            except Exception as exc:
+                db.rollback()
+                logger.exception("[Orchestrator] could not queue '%s': %s", item.title, exc)
+
+    @staticmethod
+    def _topic_limits(
+        db: Session,
+        max_per_topic: int,
+        published: dict[str, int],
+        ahead: tuple[str, ...] = (),
+    ) -> dict[str, int]:
+        """Remaining quota per topic, less the items already in the ``ahead`` stages."""
+        in_progress = ingest_queue.active_counts(db, AGENT_PIPELINE, ahead) if ahead else {}
+        return {
+            topic: max(0, max_per_topic - published.get(topic, 0) - in_progress.get(topic, 0))
+            for topic in dict.fromkeys(bucket["topic"] for bucket in _TOPIC_BUCKETS)
+        }
 
-                logger.info("[Orchestrator] processing '%s' (%s)", item.title, item.topic)
-
+    def _run_stages(
+        self,
+        db: Session,
+        owner: str,
+        factory: ArticleCrewFactory,
+        max_per_topic: int,
+        published: dict[str, int],
+        stats: dict[str, int],
+    ) -> bool:
+        """Move every claimable item one stage forward. Returns False when nothing was claimable."""
+        progressed = False
+
+        def record_failure(item: ingest_queue.QueuedItem, error: Exception) -> None:
+            db.rollback()
+            logger.error("[Orchestrator] %s stage failed for %s: %s", item.stage, item.source_url, error)
+            # Only the final attempt counts as failed; earlier ones may still publish
+            if ingest_queue.fail(db, item, owner, error) == ingest_queue.FAILED:
+                stats["failed"] += 1
+            else:
+                stats["retried"] += 1
+
+        # Fetch: only as many sources as the topics can still use
+        with jobs.track_stage("fetch"):
+            limits = self._topic_limits(
+                db, max_per_topic, published, (ingest_queue.FETCHED, ingest_queue.DRAFTED, ingest_queue.IMAGED)
+            )
+            items = ingest_queue.claim(
+                db, AGENT_PIPELINE, ingest_queue.DISCOVERED, owner, sum(limits.values()), topic_limits=limits
+            )
+            for item, article, error in ingest_queue.process_stage(
+                items, _fetch_queued_item, AGENT_FETCH_CONCURRENCY, "agent-fetch"
+            ):
+                progressed = True
+                if error is not None:
+                    record_failure(item, error)
+                    continue
+                payload = {**item.payload, "article": asdict(article) if article is not None else None}
+                ingest_queue.advance(db, item, owner, ingest_queue.FETCHED, payload=payload)
+
+        # Write: at most max_workers crews, never more than a topic's remaining quota
+        with jobs.track_stage("write"):
+            limits = self._topic_limits(
+                db, max_per_topic, published, (ingest_queue.DRAFTED, ingest_queue.IMAGED)
+            )
+            items = ingest_queue.claim(
+                db, AGENT_PIPELINE, ingest_queue.FETCHED, owner, self.max_workers, topic_limits=limits
+            )
+            for item in items:
+                logger.info("[Orchestrator] processing '%s' (%s)", item.payload.get("title"), item.topic)
+            for item, article_out, error in ingest_queue.process_stage(
+                items, lambda queued: _write_queued_item(queued, factory), self.max_workers, "crew"
+            ):
+                progressed = True
+                if error is not None:
+                    record_failure(item, error)
+                    continue
+                payload = {**item.payload, "draft": article_out.model_dump()}
+                ingest_queue.advance(db, item, owner, ingest_queue.DRAFTED, payload=payload)
+
+        # Image
+        with jobs.track_stage("image"):
+            items = ingest_queue.claim(db, AGENT_PIPELINE, ingest_queue.DRAFTED, owner, self.max_workers * 2)
+            for item, image, error in ingest_queue.process_stage(
+                items, lambda queued: _image_queued_item(queued, factory), self.max_workers, "agent-image"
+            ):
+                progressed = True
+                if error is not None:
+                    record_failure(item, error)
+                    continue
+                ingest_queue.advance(db, item, owner, ingest_queue.IMAGED, image_asset=image)
+
+        # Phase 3: Persist to DB (single writer)
+        with jobs.track_stage("publish"):
+            limits = self._topic_limits(db, max_per_topic, published)
+            items = ingest_queue.claim(
+                db, AGENT_PIPELINE, ingest_queue.IMAGED, owner, sum(limits.values()), topic_limits=limits
+            )
+            for item in items:
+                progressed = True
+                img_data, img_fname, img_mime = item.image_asset
                 try:
-                    # Phase 2: CrewAI crew → article + image URL
-                    article_out, image_url = _run_article_crew(item)
-
-                    if article_out is None:
-                        stats["failed"] += 1
-                        continue
-
-                    # Download image bytes if we got a URL
-                    img_data, img_fname, img_mime = None, None, None
-                    if image_url:
-                        img_data, img_fname, img_mime = _download_image(image_url)
-
-                    # Phase 3: Persist to DB
-                    saved = _persist(
-                        db, article_out, item.url, item.tags,
+                    news = _persist(
+                        db, ArticleOutput(**item.payload["draft"]), item.source_url,
+                        list(item.payload.get("tags", [])),
                         img_data, img_fname, img_mime,
+                        fingerprint=item.payload.get("fingerprint"),
                     )
-
-                    if saved:
-                        stats["published"] += 1
-                        topic_counts[item.topic] = topic_counts.get(item.topic, 0) + 1
-                    else:
-                        stats["skipped"] += 1
-
-                    time.sleep(2)  # respect external services
-
                 except Exception as exc:
-                    db.rollback()
-                    stats["failed"] += 1
-                    logger.exception(
-                        "[Orchestrator] pipeline error for '%s': %s", item.title, exc
-                    )
+                    record_failure(item, exc)
+                    continue
 
-        finally:
-            db.close()
+                if news is not None:
+                    ingest_queue.advance(db, item, owner, ingest_queue.PUBLISHED, news_id=news.id)
+                    stats["published"] += 1
+                    published[item.topic] = published.get(item.topic, 0) + 1
+                else:
+                    ingest_queue.advance(db, item, owner, ingest_queue.SKIPPED)
+                    stats["skipped"] += 1
 
-        logger.info("[Orchestrator] run complete: %s", stats)
-        return stats
+        return progressed
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -5,27 +5,42 @@ import os
 import re
 import time
 import unicodedata
-from dataclasses import dataclass
-from typing import Iterable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Iterable, Iterator, Optional
 from urllib.parse import quote, urlparse
 
 import feedparser
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, Tag
 from requests import Response
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from app.database import SessionLocal
 from app.models import News, generate_slug
+from . import draft_cache, ingest_queue, jobs
+from .near_duplicate import find_near_duplicate, is_near_duplicate, record_fingerprint, story_fingerprint
+from .rate_limit import RateLimiter
+from .token_budget import SourceExcerpt, budget_excerpt, count_tokens
 
 logger = logging.getLogger(__name__)
 
+try:
+    import lxml  # noqa: F401
+
+    # lxml is several times faster than the pure-Python html.parser on
+    # multi-hundred-KB article pages.
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 REQUEST_TIMEOUT = 20
 MAX_IMAGE_BYTES = 10 * 1024 * 1024
 REQUEST_RETRY_DELAYS = (1, 2, 4)
 MAX_SOURCE_CHARS = 6000
-MAX_BODY_PARAGRAPHS = 8
+# Candidate pool handed to the token budgeter, which picks what fits the prompt.
+MAX_CANDIDATE_PARAGRAPHS = 24
 MIN_PARAGRAPH_LENGTH = 60
 USER_AGENT = (
     "Mozilla/5.0 (compatible; TheCloudMindBot/2.0; "
@@ -45,6 +60,21 @@ OPENAI_CHAT_COMPLETIONS_URL = os.getenv(
     "OPENAI_CHAT_COMPLETIONS_URL",
     "https://api.openai.com/v1/chat/completions",
 ).strip()
+# Drafting runs this many chat-completions requests in parallel, throttled by
+# a shared token bucket sized to the account's requests/tokens per minute.
+OPENAI_MAX_CONCURRENCY = max(1, int(os.getenv("OPENAI_MAX_CONCURRENCY", "4")))
+OPENAI_RPM_LIMIT = int(os.getenv("OPENAI_RPM_LIMIT", "500"))
+OPENAI_TPM_LIMIT = int(os.getenv("OPENAI_TPM_LIMIT", "200000"))
+DRAFT_COMPLETION_TOKENS = 900  # rough upper bound of a four-section JSON draft
+openai_rate_limiter = RateLimiter(OPENAI_RPM_LIMIT, OPENAI_TPM_LIMIT)
+# Staged ingest: source fetches (and image fallbacks) run on this many threads,
+# and each stage claims at most INGEST_BATCH_SIZE queued items per pass.
+INGEST_FETCH_CONCURRENCY = max(1, int(os.getenv("INGEST_FETCH_CONCURRENCY", "8")))
+INGEST_BATCH_SIZE = 20
+AUTO_PUBLISH_PIPELINE = "auto_publish"
+# Part of the draft cache key: bump whenever the drafting prompt or the way
+# its response is parsed changes, so stale cached drafts are not reused.
+DRAFT_PROMPT_VERSION = "1"
 SOURCE_NAME_MAP = {
     "techcrunch.com": "TechCrunch",
     "www.theverge.com": "The Verge",
@@ -79,6 +109,26 @@ class StoryDraft:
     content: str
 
 
+@dataclass(frozen=True)
+class DraftRequest:
+    """Inputs for one story draft, collected per run so drafting can fan out."""
+    topic: str
+    source_name: str
+    source_url: str
+    source_title: str
+    source_summary: str
+    article_text: str
+
+
+@dataclass(frozen=True)
+class ParsedArticle:
+    """Everything the pipelines need from one article page, extracted in a single parse."""
+    meta_description: str = ""
+    image_urls: tuple[str, ...] = ()
+    paragraphs: tuple[str, ...] = ()
+    text: str = ""
+
+
 FEEDS: tuple[FeedConfig, ...] = (
     FeedConfig(
         topic="ai",
@@ -117,6 +167,7 @@ FEEDS: tuple[FeedConfig, ...] = (
         tags=["Cricket", "IPL", "Sports", "Automation", "Analysis"],
     ),
 )
+_FEEDS_BY_URL = {feed.url: feed for feed in FEEDS}
 
 
 def _repair_mojibake(value: str) -> str:
@@ -133,7 +184,10 @@ def _repair_mojibake(value: str) -> str:
 
 
 def _clean_text(value: str) -> str:
-    text = BeautifulSoup(html.unescape(value or ""), "html.parser").get_text(" ")
+    text = html.unescape(value or "")
+    if "<" in text:
+        # Only markup needs a parser; plain text (the common case) skips it.
+        text = BeautifulSoup(text, "html.parser").get_text(" ")
     text = _repair_mojibake(text)
     text = re.sub(r"\s+", " ", text).strip()
     return text
@@ -162,22 +216,197 @@ def _summary_from_entry(entry: dict) -> str:
     return ""
 
 
-def _extract_meta_description(article_html: Optional[str]) -> str:
+# Subtrees skipped for excerpt paragraphs and for the plain page text; these
+# are the tags each consumer used to decompose(), which differ ("nav" only
+# for the text, "noscript"/"svg"/"form" only for paragraphs).
+_PARAGRAPH_NOISE_TAGS = frozenset({"script", "style", "noscript", "svg", "header", "footer", "form", "aside"})
+_TEXT_NOISE_TAGS = frozenset({"script", "style", "nav", "header", "footer", "aside"})
+_META_DESCRIPTION_KEYS = ("description", "og:description", "twitter:description")
+_META_IMAGE_KEYS = ("og:image", "twitter:image", "og:image:url")
+
+# Container priority, highest first. This mirrors the CSS selectors the
+# extractor used to run one select() at a time ("article p", "main p", ...,
+# bare "p"); a paragraph or image ranks by its best-matching ancestor.
+_PARAGRAPH_CONTAINERS = (
+    "article",
+    "main",
+    "[role=main]",
+    ".article-content",
+    ".story-body",
+    ".entry-content",
+    ".c-entry-content",
+    ".post-content",
+    ".post-body",
+    ".content",
+)
+_IMAGE_CONTAINERS = (
+    "article",
+    "main",
+    ".article-content",
+    ".story-body",
+    ".entry-content",
+    ".c-entry-content",
+    ".post-content",
+)
+_PARAGRAPH_RANKS = {selector: rank for rank, selector in enumerate(_PARAGRAPH_CONTAINERS)}
+_IMAGE_RANKS = {selector: rank for rank, selector in enumerate(_IMAGE_CONTAINERS)}
+
+
+def _container_rank(tag, ranks: dict[str, int], inherited: int) -> int:
+    rank = min(inherited, ranks.get(tag.name, inherited))
+    if tag.get("role") == "main":
+        rank = min(rank, ranks.get("[role=main]", rank))
+    for css_class in tag.get("class") or ():
+        rank = min(rank, ranks.get(f".{css_class}", rank))
+    return rank
+
+
+def _walk_article_body(soup, have_image: bool = False) -> tuple[list[str], list[str], str]:
+    """
+    Walk the parsed tree once, collecting ranked body paragraphs, ranked body
+    images and the page's plain text.
+
+    Paragraphs are deduplicated with a set and ordered by container rank,
+    then document order, up to MAX_CANDIDATE_PARAGRAPHS. The walk stops as
+    soon as the top-ranked container alone fills the candidate pool, an
+    image is known (``have_image`` when a meta tag already supplied one) and
+    the text cap is reached, since nothing later in the page can change the
+    result.
+    """
+    unranked_paragraph = len(_PARAGRAPH_CONTAINERS)
+    unranked_image = len(_IMAGE_CONTAINERS)
+    paragraph_buckets: list[list[str]] = [[] for _ in range(unranked_paragraph + 1)]
+    image_buckets: list[list[str]] = [[] for _ in range(unranked_image)]
+    lead_seen: set[str] = set()
+    text_parts: list[str] = []
+    text_chars = 0
+    complete = False
+
+    stack = [(soup, unranked_paragraph, unranked_image, False, False)]
+    while stack:
+        node, paragraph_rank, image_rank, in_noise, in_text_noise = stack.pop()
+
+        if type(node) is NavigableString:
+            if not in_text_noise and text_chars < MAX_SOURCE_CHARS:
+                stripped = node.strip()
+                if stripped:
+                    text_parts.append(stripped)
+                    text_chars += len(stripped) + 1
+            continue
+        if not isinstance(node, Tag):
+            continue
+
+        if node is not soup:
+            in_noise = in_noise or node.name in _PARAGRAPH_NOISE_TAGS
+            in_text_noise = in_text_noise or node.name in _TEXT_NOISE_TAGS
+            paragraph_rank = _container_rank(node, _PARAGRAPH_RANKS, paragraph_rank)
+            image_rank = _container_rank(node, _IMAGE_RANKS, image_rank)
+
+            if node.name == "p" and not in_noise:
+                text = _clean_text(node.get_text(" ", strip=True))
+                if text and not _is_noise_paragraph(text):
+                    paragraph_buckets[paragraph_rank].append(text)
+                    if paragraph_rank == 0:
+                        lead_seen.add(text)
+            elif node.name == "img" and image_rank < unranked_image and _is_likely_article_image(node):
+                src = node.get("src") or node.get("data-src") or ""
+                if src.startswith("http"):
+                    image_buckets[image_rank].append(src)
+
+            if (
+                len(lead_seen) >= MAX_CANDIDATE_PARAGRAPHS
+                and (have_image or image_buckets[0])
+                and text_chars >= MAX_SOURCE_CHARS
+            ):
+                complete = True
+                break
+
+        stack.extend(
+            (child, paragraph_rank, image_rank, in_noise, in_text_noise)
+            for child in reversed(node.contents)
+        )
+
+    if complete:
+        # Lower-ranked buckets were only partially walked; the lead alone decides.
+        paragraph_buckets = paragraph_buckets[:1]
+
+    paragraphs: list[str] = []
+    seen: set[str] = set()
+    for bucket in paragraph_buckets:
+        for text in bucket:
+            if text not in seen:
+                seen.add(text)
+                paragraphs.append(text)
+        if len(paragraphs) >= MAX_CANDIDATE_PARAGRAPHS:
+            break
+
+    images = [src for bucket in image_buckets for src in bucket]
+    return paragraphs[:MAX_CANDIDATE_PARAGRAPHS], images, "\n".join(text_parts)
+
+
+_P_OPEN_RE = re.compile(r"<p[\s>]", re.IGNORECASE)
+_P_CLOSE_RE = re.compile(r"</p\s*>", re.IGNORECASE)
+
+
+def _parser_for(article_html: str) -> str:
+    """
+    lxml, unless the page leaves <p> tags unclosed: lxml closes each one at
+    the next <p>, while html.parser nests them, so their paragraph text
+    differs. Those pages keep the legacy parser and its output.
+    """
+    if HTML_PARSER == "html.parser":
+        return HTML_PARSER
+    if len(_P_OPEN_RE.findall(article_html)) != len(_P_CLOSE_RE.findall(article_html)):
+        return "html.parser"
+    return HTML_PARSER
+
+
+def _parse_article_html(article_html: Optional[str]) -> ParsedArticle:
+    """
+    Parse an article page exactly once and pull out the meta description,
+    candidate images, body paragraphs and plain text used by every consumer.
+    """
     if not article_html:
-        return ""
-    soup = BeautifulSoup(article_html, "html.parser")
-    selectors = [
-        ("meta", {"name": "description"}),
-        ("meta", {"property": "og:description"}),
-        ("meta", {"name": "twitter:description"}),
-    ]
-    for tag_name, attrs in selectors:
-        tag = soup.find(tag_name, attrs=attrs)
-        if tag and tag.get("content"):
-            cleaned = _clean_text(tag["content"])
-            if cleaned:
-                return cleaned[:500]
-    return ""
+        return ParsedArticle()
+
+    soup = BeautifulSoup(article_html, _parser_for(article_html))
+
+    # Meta tags: first occurrence of each name/property wins, as with soup.find().
+    meta: dict[str, str] = {}
+    for tag in soup.find_all("meta"):
+        key = tag.get("property") or tag.get("name")
+        content = tag.get("content")
+        if key and content and key not in meta:
+            meta[key] = content
+
+    meta_description = ""
+    for key in _META_DESCRIPTION_KEYS:
+        cleaned = _clean_text(meta.get(key, ""))
+        if cleaned:
+            meta_description = cleaned[:500]
+            break
+
+    image_urls: list[str] = []
+    for key in _META_IMAGE_KEYS:
+        url = meta.get(key, "").strip()
+        if url and not _is_placeholder_image_url(url) and url not in image_urls:
+            image_urls.append(url)
+
+    paragraphs, body_images, text = _walk_article_body(soup, have_image=bool(image_urls))
+    for src in body_images:
+        if src not in image_urls:
+            image_urls.append(src)
+
+    return ParsedArticle(
+        meta_description=meta_description,
+        image_urls=tuple(image_urls),
+        paragraphs=tuple(paragraphs),
+        text=text,
+    )
+
+
+def _extract_meta_description(article: Optional[ParsedArticle]) -> str:
+    return article.meta_description if article else ""
 
 
 def _is_noise_paragraph(text: str) -> bool:
@@ -198,52 +427,6 @@ def _is_noise_paragraph(text: str) -> bool:
     return len(text) < MIN_PARAGRAPH_LENGTH or any(pattern in lowered for pattern in noise_patterns)
 
 
-def _extract_article_text(article_html: Optional[str]) -> str:
-    if not article_html:
-        return ""
-
-    soup = BeautifulSoup(article_html, "html.parser")
-    for tag in soup(["script", "style", "noscript", "svg", "header", "footer", "form", "aside"]):
-        tag.decompose()
-
-    paragraph_candidates: list[str] = []
-    selectors = [
-        "article p",
-        "main p",
-        "[role='main'] p",
-        ".article-content p",
-        ".story-body p",
-        ".entry-content p",
-        ".c-entry-content p",
-        ".post-content p",
-        ".post-body p",
-        ".content p",
-        "p",
-    ]
-
-    for selector in selectors:
-        for node in soup.select(selector):
-            text = _clean_text(node.get_text(" ", strip=True))
-            if not text or _is_noise_paragraph(text):
-                continue
-            if text not in paragraph_candidates:
-                paragraph_candidates.append(text)
-        if len(paragraph_candidates) >= MAX_BODY_PARAGRAPHS:
-            break
-
-    excerpt = []
-    total_chars = 0
-    for paragraph in paragraph_candidates:
-        if total_chars + len(paragraph) > MAX_SOURCE_CHARS:
-            break
-        excerpt.append(paragraph)
-        total_chars += len(paragraph)
-        if len(excerpt) >= MAX_BODY_PARAGRAPHS:
-            break
-
-    return "\n\n".join(excerpt)
-
-
 _MIN_IMAGE_DIMENSION = 200  # ignore tiny icons / tracking pixels
 
 
@@ -265,38 +448,10 @@ def _is_likely_article_image(tag) -> bool:
     return True
 
 
-def _extract_image_url(entry: dict, article_html: Optional[str]) -> Optional[str]:
-    if article_html:
-        soup = BeautifulSoup(article_html, "html.parser")
-
-        # 1. Meta tags — most reliable
-        for tag_name, attrs in [
-            ("meta", {"property": "og:image"}),
-            ("meta", {"name": "twitter:image"}),
-            ("meta", {"property": "og:image:url"}),
-        ]:
-            tag = soup.find(tag_name, attrs=attrs)
-            if tag and tag.get("content"):
-                url = tag["content"].strip()
-                if url and not _is_placeholder_image_url(url):
-                    return url
-
-        # 2. First sizeable image inside the article body
-        body_selectors = [
-            "article img",
-            "main img",
-            ".article-content img",
-            ".story-body img",
-            ".entry-content img",
-            ".c-entry-content img",
-            ".post-content img",
-        ]
-        for selector in body_selectors:
-            for img in soup.select(selector):
-                if _is_likely_article_image(img):
-                    src = img.get("src") or img.get("data-src") or ""
-                    if src and src.startswith("http"):
-                        return src
+def _extract_image_url(entry: dict, article: Optional[ParsedArticle]) -> Optional[str]:
+    # 1. Meta tags, then 2. the first sizeable image inside the article body
+    if article and article.image_urls:
+        return article.image_urls[0]
 
     # 3. RSS media items
     for key in ("media_content", "media_thumbnail"):
@@ -314,6 +469,35 @@ def _is_placeholder_image_url(image_url: str) -> bool:
     return parsed.netloc.lower() in PLACEHOLDER_IMAGE_HOSTS
 
 
+_TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "ocid", "cmpid", "ref", "ref_src",
+    "mc_cid", "mc_eid", "guccounter", "guce_referrer", "guce_referrer_sig", "ito",
+})
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Normalise a story URL for duplicate detection: https, lowercase host
+    without ``www.``, no fragment, no tracking parameters, sorted query,
+    and no trailing slash or ``/amp`` suffix.
+    """
+    parsed = urlparse((url or "").strip())
+    if not parsed.netloc:
+        return (url or "").strip()
+    host = parsed.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = re.sub(r"/amp/?$", "", parsed.path).rstrip("/") or "/"
+    query = "&".join(sorted(
+        part for part in parsed.query.split("&")
+        if part and not (
+            part.split("=", 1)[0].lower().startswith("utm_")
+            or part.split("=", 1)[0].lower() in _TRACKING_PARAMS
+        )
+    ))
+    return f"https://{host}{path}" + (f"?{query}" if query else "")
+
+
 def _extract_source_url_from_content(content: str) -> Optional[str]:
     match = re.search(r"Original source:\s*(https?://\S+)", content or "")
     return match.group(1).strip() if match else None
@@ -608,7 +792,7 @@ def _fetch_article_html(url: str) -> tuple[str, Optional[str]]:
 def _fetch_article_assets(
     source_url: Optional[str],
     entry: Optional[dict] = None,
-) -> tuple[Optional[str], Optional[str], tuple[bytes, str, str] | tuple[None, None, None]]:
+) -> tuple[Optional[ParsedArticle], Optional[str], tuple[bytes, str, str] | tuple[None, None, None]]:
     if not source_url:
         return None, None, (None, None, None)
 
@@ -618,11 +802,12 @@ def _fetch_article_assets(
         logger.warning("Failed to fetch article page %s: %s", source_url, exc)
         return None, source_url, (None, None, None)
 
-    image_url = _extract_image_url(entry or {}, article_html)
+    article = _parse_article_html(article_html)
+    image_url = _extract_image_url(entry or {}, article)
     image_asset = (None, None, None)
     if image_url:
         image_asset = _download_image(image_url)
-    return article_html, resolved_url, image_asset
+    return article, resolved_url, image_asset
 
 
 def _source_exists(db: Session, source_url: str) -> bool:
@@ -692,6 +877,11 @@ def _fallback_story_draft(
     )
 
 
+def _source_excerpt(article_text: str) -> SourceExcerpt:
+    """The token-budgeted part of a draft request's article text that goes into the prompt."""
+    return budget_excerpt(article_text.split("\n\n") if article_text else [], model=OPENAI_MODEL)
+
+
 def _generate_story_draft(
     *,
     topic: str,
@@ -700,7 +890,14 @@ def _generate_story_draft(
     source_title: str,
     source_summary: str,
     article_text: str,
+    fallback_on_error: bool = True,
 ) -> StoryDraft:
+    """
+    Draft a story with the chat-completions API. Without an API key or any
+    source text the fallback draft is used; when the request or its response
+    fails, too, unless fallback_on_error is False, in which case the error
+    is raised so the caller can retry.
+    """
     if not OPENAI_API_KEY:
         logger.warning("OPENAI_API_KEY is missing; using fallback story draft for %s", source_url)
         return _fallback_story_draft(
@@ -712,7 +909,8 @@ def _generate_story_draft(
             article_text=article_text,
         )
 
-    source_context = article_text[:MAX_SOURCE_CHARS] if article_text else source_summary
+    excerpt = _source_excerpt(article_text)
+    source_context = excerpt.text or source_summary
     if not source_context:
         return _fallback_story_draft(
             topic=topic,
@@ -723,6 +921,15 @@ def _generate_story_draft(
             article_text=article_text,
         )
 
+    # Not keyed on the title or summary: a refresh passes the previous draft's
+    # own title and summary in, which would change the key on every run.
+    cache_key = draft_cache.make_key(OPENAI_MODEL, DRAFT_PROMPT_VERSION, source_url, excerpt.text)
+    cached = draft_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Reusing cached draft for %s", source_url)
+        title, summary, content = cached
+        return StoryDraft(title=title, summary=summary, content=content)
+
     system_prompt = (
         "You are the lead editor for TheCloudMind.ai. Rewrite source reporting into an original, "
         "clean news analysis article. Do not copy source phrasing. Be factual, concise, and readable. "
@@ -779,6 +986,22 @@ Source excerpt:
         ],
     }
 
+    logger.info(
+        "Source excerpt for %s: %d/%d tokens, %d/%d paragraphs",
+        source_url,
+        excerpt.tokens,
+        excerpt.budget,
+        excerpt.paragraphs_used,
+        excerpt.paragraphs_total,
+    )
+    waited = openai_rate_limiter.acquire(
+        count_tokens(system_prompt, OPENAI_MODEL)
+        + count_tokens(user_prompt, OPENAI_MODEL)
+        + DRAFT_COMPLETION_TOKENS
+    )
+    if waited:
+        logger.info("OpenAI rate limiter delayed draft for %s by %.1fs", source_url, waited)
+
     try:
         response = _request_with_retries(
             "POST",
@@ -804,8 +1027,11 @@ Source excerpt:
         if len(sections) != 4:
             raise ValueError("Model returned an unexpected section count")
         content = _format_content(sections, source_name, source_url)
+        draft_cache.put(cache_key, OPENAI_MODEL, title, summary, content)
         return StoryDraft(title=title, summary=summary, content=content)
     except Exception as exc:
+        if not fallback_on_error:
+            raise
         logger.warning("OpenAI generation failed for %s: %s", source_url, exc)
         return _fallback_story_draft(
             topic=topic,
@@ -817,19 +1043,45 @@ Source excerpt:
         )
 
 
-def _build_story_from_source(
+def _draft_or_fallback(request: DraftRequest) -> StoryDraft:
+    try:
+        return _generate_story_draft(**asdict(request))
+    except Exception as exc:
+        logger.error("Drafting failed for %s, using fallback draft: %s", request.source_url, exc)
+        return _fallback_story_draft(**asdict(request))
+
+
+def _generate_story_drafts(draft_requests: list[DraftRequest]) -> list[StoryDraft]:
+    """
+    Draft a whole run's stories concurrently, in request order.
+
+    Up to OPENAI_MAX_CONCURRENCY requests are in flight at once; the shared
+    rate limiter inside _generate_story_draft keeps them within RPM/TPM.
+    A draft that fails gets the fallback draft without affecting the others.
+    """
+    if len(draft_requests) <= 1 or OPENAI_MAX_CONCURRENCY == 1:
+        return [_draft_or_fallback(request) for request in draft_requests]
+
+    workers = min(OPENAI_MAX_CONCURRENCY, len(draft_requests))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="story-draft") as pool:
+        futures = [pool.submit(_draft_or_fallback, request) for request in draft_requests]
+    return [future.result() for future in futures]
+
+
+def _draft_request_from_source(
     *,
     feed: FeedConfig,
     source_url: str,
     source_title: str,
     source_summary: str,
-    article_html: Optional[str],
-) -> StoryDraft:
-    meta_summary = _extract_meta_description(article_html)
-    article_text = _extract_article_text(article_html)
+    article: Optional[ParsedArticle],
+) -> DraftRequest:
+    meta_summary = _extract_meta_description(article)
+    # The whole candidate pool; _generate_story_draft fits it to the token budget.
+    article_text = "\n\n".join(article.paragraphs) if article else ""
     summary_seed = meta_summary or source_summary
     source_name = _extract_source_name_from_url(source_url, feed.source_name)
-    return _generate_story_draft(
+    return DraftRequest(
         topic=feed.topic,
         source_name=source_name,
         source_url=source_url,
@@ -839,46 +1091,85 @@ def _build_story_from_source(
     )
 
 
-def _create_news_item(db: Session, feed: FeedConfig, entry: dict) -> bool:
-    source_title = _clean_title(entry.get("title", ""))
-    if not source_title:
-        return False
-
+@dataclass(frozen=True)
+class _PendingStory:
+    """A fetched, not-yet-drafted feed entry waiting for the drafting stage."""
+    feed: FeedConfig
+    source_url: str
+    draft_request: DraftRequest
+    image_asset: tuple[bytes, str, str] | tuple[None, None, None]
+    fingerprint: list[str]
+
+
+def _is_near_duplicate_story(db: Session, fingerprint: list[str], title: str, pending: Iterable[list[str]] = ()) -> bool:
+    """Near-duplicate of a story in the current batch or one published recently."""
+    if any(is_near_duplicate(fingerprint, other) for other in pending):
+        logger.info("Skipping near-duplicate of a story in this batch: %s", title)
+        return True
+    news_id = find_near_duplicate(db, fingerprint)
+    if news_id is not None:
+        logger.info("Skipping near-duplicate of story %s: %s", news_id, title)
+        return True
+    return False
+
+
+def _fetch_pending_story(feed: FeedConfig, entry: dict, fingerprint: list[str]) -> Optional[_PendingStory]:
+    """Network half of preparing an entry: resolve, fetch and parse its source page. No DB access."""
     source_url = entry.get("link")
-    article_html = None
+    article = None
     if source_url:
-        article_html, source_url, image_asset = _fetch_article_assets(source_url, entry)
+        article, source_url, image_asset = _fetch_article_assets(source_url, entry)
     else:
         image_asset = (None, None, None)
 
     if not source_url:
         logger.warning("Skipping entry without source URL from %s", feed.source_name)
-        return False
-
-    if _source_exists(db, source_url):
-        logger.info("Skipping existing source story: %s", source_url)
-        return False
+        return None
 
-    draft = _build_story_from_source(
+    request = _draft_request_from_source(
         feed=feed,
         source_url=source_url,
-        source_title=source_title,
+        source_title=_clean_title(entry.get("title", "")),
         source_summary=_summary_from_entry(entry),
-        article_html=article_html,
+        article=article,
     )
+    return _PendingStory(
+        feed=feed,
+        source_url=source_url,
+        draft_request=request,
+        image_asset=image_asset,
+        fingerprint=fingerprint,
+    )
+
+
+def _with_fallback_image(
+    image_asset: tuple[bytes, str, str] | tuple[None, None, None],
+    title: str,
+    tags: list[str],
+) -> tuple[bytes, str, str] | tuple[None, None, None]:
+    # If the article page had no image, try Wikipedia as a fallback
+    if image_asset[0]:
+        return image_asset
+    wiki_url = _fetch_wikipedia_image(title, tags)
+    if wiki_url:
+        return _download_image(wiki_url)
+    return image_asset
+
+
+def _publish_news_item(db: Session, pending: _PendingStory, draft: StoryDraft) -> Optional[News]:
+    """Persist a drafted story whose image has already been resolved; None when it is a duplicate."""
+    feed = pending.feed
+    # Re-checked here: another entry in the same drafting batch may share the source.
+    if _source_exists(db, pending.source_url):
+        logger.info("Skipping existing source story: %s", pending.source_url)
+        return None
 
     base_slug = generate_slug(draft.title)
     if _story_exists(db, draft.title, base_slug):
         logger.info("Skipping existing story title: %s", draft.title)
-        return False
+        return None
 
-    image_data, image_filename, image_mimetype = image_asset
-
-    # If the article page had no image, try Wikipedia as a fallback
-    if not image_data:
-        wiki_url = _fetch_wikipedia_image(draft.title, list(feed.tags))
-        if wiki_url:
-            image_data, image_filename, image_mimetype = _download_image(wiki_url)
+    image_data, image_filename, image_mimetype = pending.image_asset
 
     news = News(
         title=draft.title,
@@ -892,10 +1183,12 @@ def _create_news_item(db: Session, feed: FeedConfig, entry: dict) -> bool:
         image_mimetype=image_mimetype,
     )
     db.add(news)
+    db.flush()
+    record_fingerprint(db, pending.fingerprint, news.id, pending.source_url)
     db.commit()
     db.refresh(news)
     logger.info("Published automated %s story from %s: %s", feed.topic, feed.source_name, draft.title)
-    return True
+    return news
 
 
 def refresh_automated_article_images(limit: int = 25) -> dict[str, int]:
@@ -905,8 +1198,6 @@ def refresh_automated_article_images(limit: int = 25) -> dict[str, int]:
         recent_news = db.query(News).order_by(News.created_at.desc()).limit(limit).all()
         for article in recent_news:
             tags = article.tags or []
-            if isinstance(tags, str):
-                tags = [tags]
             if "Automation" not in tags:
                 continue
 
@@ -920,9 +1211,6 @@ def refresh_automated_article_images(limit: int = 25) -> dict[str, int]:
                 image_data, image_filename, image_mimetype = image_asset
                 # Fall back to Wikipedia if source page had no image
                 if not image_data:
-                    tags = article.tags or []
-                    if isinstance(tags, str):
-                        tags = [tags]
                     wiki_url = _fetch_wikipedia_image(article.title, list(tags))
                     if wiki_url:
                         image_data, image_filename, image_mimetype = _download_image(wiki_url)
@@ -948,10 +1236,11 @@ def refresh_automated_article_content(limit: int = 25) -> dict[str, int]:
     db = SessionLocal()
     try:
         recent_news = db.query(News).order_by(News.created_at.desc()).limit(limit).all()
+
+        # Fetch every source first, then draft them all concurrently.
+        pending: list[tuple[News, DraftRequest, tuple]] = []
         for article in recent_news:
             tags = article.tags or []
-            if isinstance(tags, str):
-                tags = [tags]
             if "Automation" not in tags:
                 continue
 
@@ -968,15 +1257,23 @@ def refresh_automated_article_content(limit: int = 25) -> dict[str, int]:
             )
             stats["checked"] += 1
             try:
-                article_html, resolved_url, image_asset = _fetch_article_assets(source_url)
-                final_source_url = resolved_url or source_url
-                draft = _build_story_from_source(
+                parsed_article, resolved_url, image_asset = _fetch_article_assets(source_url)
+                request = _draft_request_from_source(
                     feed=feed,
-                    source_url=final_source_url,
+                    source_url=resolved_url or source_url,
                     source_title=article.title,
                     source_summary=article.summary,
-                    article_html=article_html,
+                    article=parsed_article,
                 )
+                pending.append((article, request, image_asset))
+            except Exception as exc:
+                stats["failed"] += 1
+                logger.exception("Failed to fetch automation source for article %s: %s", article.id, exc)
+
+        drafts = _generate_story_drafts([request for _, request, _ in pending])
+
+        for (article, _, image_asset), draft in zip(pending, drafts):
+            try:
                 article.title = draft.title
                 article.summary = draft.summary
                 article.content = draft.content
@@ -1005,29 +1302,214 @@ def _iter_entries(feed: FeedConfig, limit: int) -> Iterable[dict]:
     return parsed.entries[:limit]
 
 
+def _iter_topic_entries(topic: str, limit: int) -> Iterator[tuple[FeedConfig, dict]]:
+    """Yield a topic's entries feed by feed; later feeds are only fetched when needed."""
+    for feed in FEEDS:
+        if feed.topic != topic:
+            continue
+        for entry in _iter_entries(feed, limit):
+            yield feed, entry
+
+
+def _queued_entry(entry: dict) -> dict:
+    """The parts of a feedparser entry the later stages read, as plain JSON."""
+    queued = {key: entry.get(key) for key in ("title", "link", "summary", "description") if entry.get(key)}
+    for key in ("content", "media_content", "media_thumbnail"):
+        items = [
+            {k: v for k, v in dict(item).items() if isinstance(v, str)}
+            for item in entry.get(key) or []
+        ]
+        if items:
+            queued[key] = items
+    return queued
+
+
+def _enqueue_entry(db: Session, feed: FeedConfig, entry: dict, pending_fingerprints: list[list[str]]) -> bool:
+    """Queue a feed entry unless it was seen before or duplicates a known story."""
+    source_title = _clean_title(entry.get("title", ""))
+    source_url = entry.get("link")
+    if not source_title or not source_url:
+        return False
+    if ingest_queue.is_queued(db, AUTO_PUBLISH_PIPELINE, source_url):
+        return False
+
+    fingerprint = story_fingerprint(source_title)
+    if _is_near_duplicate_story(db, fingerprint, source_title, pending_fingerprints):
+        return False
+    queued = ingest_queue.enqueue(
+        db,
+        AUTO_PUBLISH_PIPELINE,
+        feed.topic,
+        source_url,
+        {"feed_url": feed.url, "entry": _queued_entry(entry), "fingerprint": fingerprint},
+    )
+    if queued:
+        pending_fingerprints.append(fingerprint)
+    return queued
+
+
+def _queued_feed(item: ingest_queue.QueuedItem) -> FeedConfig:
+    feed = _FEEDS_BY_URL.get(item.payload.get("feed_url", ""))
+    if feed is None:
+        raise ValueError(f"Feed {item.payload.get('feed_url')} is no longer configured")
+    return feed
+
+
+def _queued_pending_story(item: ingest_queue.QueuedItem) -> _PendingStory:
+    return _PendingStory(
+        feed=_queued_feed(item),
+        source_url=item.source_url,
+        draft_request=DraftRequest(**item.payload["draft_request"]),
+        image_asset=item.image_asset,
+        fingerprint=item.payload["fingerprint"],
+    )
+
+
+def _fetch_queued_entry(item: ingest_queue.QueuedItem) -> Optional[_PendingStory]:
+    return _fetch_pending_story(_queued_feed(item), item.payload["entry"], item.payload["fingerprint"])
+
+
+def _draft_queued_story(item: ingest_queue.QueuedItem) -> StoryDraft:
+    # API errors fail the attempt so the queue retries it; the last attempt falls back.
+    final_attempt = item.attempts + 1 >= ingest_queue.INGEST_MAX_ATTEMPTS
+    return _generate_story_draft(**item.payload["draft_request"], fallback_on_error=final_attempt)
+
+
+def _image_queued_story(item: ingest_queue.QueuedItem):
+    return _with_fallback_image(item.image_asset, item.payload["draft"]["title"], list(_queued_feed(item).tags))
+
+
+def _run_ingest_stages(db: Session, owner: str, stats: dict[str, int], max_per_topic: int) -> bool:
+    """
+    Move every claimable item one stage forward: fetch, draft, image, then
+    publish. Each stage has its own concurrency; outcomes are recorded on
+    this thread. Returns False when nothing was claimable.
+    """
+    progressed = False
+
+    def record_failure(item: ingest_queue.QueuedItem, error: Exception) -> None:
+        db.rollback()
+        logger.error("Auto-publish %s stage failed for %s: %s", item.stage, item.source_url, error)
+        ingest_queue.fail(db, item, owner, error)
+
+    with jobs.track_stage("fetch"):
+        items = ingest_queue.claim(db, AUTO_PUBLISH_PIPELINE, ingest_queue.DISCOVERED, owner, INGEST_BATCH_SIZE)
+        for item, pending, error in ingest_queue.process_stage(
+            items, _fetch_queued_entry, INGEST_FETCH_CONCURRENCY, "ingest-fetch"
+        ):
+            progressed = True
+            if error is not None:
+                record_failure(item, error)
+            elif pending is None or _source_exists(db, pending.source_url):
+                logger.info("Skipping existing source story: %s", item.source_url)
+                ingest_queue.advance(db, item, owner, ingest_queue.SKIPPED)
+            else:
+                ingest_queue.advance(
+                    db,
+                    item,
+                    owner,
+                    ingest_queue.FETCHED,
+                    payload={**item.payload, "draft_request": asdict(pending.draft_request)},
+                    image_asset=pending.image_asset,
+                    source_url=pending.source_url,
+                )
+
+    with jobs.track_stage("draft"):
+        items = ingest_queue.claim(db, AUTO_PUBLISH_PIPELINE, ingest_queue.FETCHED, owner, INGEST_BATCH_SIZE)
+        for item, draft, error in ingest_queue.process_stage(
+            items, _draft_queued_story, OPENAI_MAX_CONCURRENCY, "story-draft"
+        ):
+            progressed = True
+            if error is not None:
+                record_failure(item, error)
+            else:
+                ingest_queue.advance(
+                    db, item, owner, ingest_queue.DRAFTED, payload={**item.payload, "draft": asdict(draft)}
+                )
+
+    with jobs.track_stage("image"):
+        items = ingest_queue.claim(db, AUTO_PUBLISH_PIPELINE, ingest_queue.DRAFTED, owner, INGEST_BATCH_SIZE)
+        for item, image_asset, error in ingest_queue.process_stage(
+            items, _image_queued_story, INGEST_FETCH_CONCURRENCY, "ingest-image"
+        ):
+            progressed = True
+            if error is not None:
+                record_failure(item, error)
+            else:
+                ingest_queue.advance(db, item, owner, ingest_queue.IMAGED, image_asset=image_asset)
+
+    # Published serially on this thread; drafts over a topic's quota wait for the next run.
+    with jobs.track_stage("publish"):
+        remaining = {topic: max_per_topic - count for topic, count in stats.items()}
+        items = ingest_queue.claim(
+            db, AUTO_PUBLISH_PIPELINE, ingest_queue.IMAGED, owner, INGEST_BATCH_SIZE, topic_limits=remaining
+        )
+        for item in items:
+            progressed = True
+            try:
+                news = _publish_news_item(db, _queued_pending_story(item), StoryDraft(**item.payload["draft"]))
+            except Exception as exc:
+                record_failure(item, exc)
+                continue
+            if news is None:
+                ingest_queue.advance(db, item, owner, ingest_queue.SKIPPED)
+            else:
+                ingest_queue.advance(db, item, owner, ingest_queue.PUBLISHED, news_id=news.id)
+                stats[item.topic] = stats.get(item.topic, 0) + 1
+
+    return progressed
+
+
 def run_auto_publish(max_per_topic: int = 5) -> dict[str, int]:
+    """
+    Publish up to ``max_per_topic`` new stories per topic.
+
+    Entries go through the persistent ingest queue (discovered → fetched →
+    drafted → imaged → published). Each wave queues just enough new entries
+    to cover each topic's remaining quota, then advances everything
+    claimable by one stage per pass. Items left unfinished by an interrupted
+    run are picked up first, and entries skipped as duplicates are topped
+    up by the next wave.
+    """
     stats = {"ai": 0, "cricket": 0}
+    draft_cache.prune()
+    owner = ingest_queue.worker_id()
+    topic_entries = {
+        topic: _iter_topic_entries(topic, max_per_topic * 3)
+        for topic in dict.fromkeys(feed.topic for feed in FEEDS)
+    }
     db = SessionLocal()
     try:
-        for feed in FEEDS:
-            if stats.get(feed.topic, 0) >= max_per_topic:
-                continue
-            for entry in _iter_entries(feed, max_per_topic * 3):
-                if stats.get(feed.topic, 0) >= max_per_topic:
-                    break
-                try:
-                    created = _create_news_item(db, feed, entry)
-                except Exception as exc:
-                    db.rollback()
-                    logger.exception(
-                        "Auto-publish failed for topic %s and entry %s: %s",
-                        feed.topic,
-                        entry.get("title"),
-                        exc,
-                    )
-                    continue
-                if created:
-                    stats[feed.topic] += 1
+        ingest_queue.prune(db)
+        while True:
+            with jobs.track_stage("discover"):
+                active = ingest_queue.active_counts(db, AUTO_PUBLISH_PIPELINE)
+                fingerprints = ingest_queue.active_payload_values(db, AUTO_PUBLISH_PIPELINE, "fingerprint")
+                for topic, entries in topic_entries.items():
+                    needed = max_per_topic - stats.get(topic, 0) - active.get(topic, 0)
+                    while needed > 0:
+                        next_entry = next(entries, None)
+                        if next_entry is None:
+                            break
+                        feed, entry = next_entry
+                        try:
+                            queued = _enqueue_entry(db, feed, entry, fingerprints)
+                        except Exception as exc:
+                            db.rollback()
+                            logger.exception(
+                                "Auto-publish failed for topic %s and entry %s: %s",
+                                feed.topic,
+                                entry.get("title"),
+                                exc,
+                            )
+                            continue
+                        if queued:
+                            needed -= 1
+
+            progressed = _run_ingest_stages(db, owner, stats, max_per_topic)
+            jobs.report_progress(stats)
+            if not progressed:
+                break
     finally:
         db.close()
     return stats
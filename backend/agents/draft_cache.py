@@ -0,0 +1,75 @@
+"""
+Persistent memoization of LLM story drafts.
+
+A draft is keyed by a hash of (model, prompt template version, source URL,
+budgeted source excerpt). Re-running a refresh or a failed auto-publish over unchanged
+sources is served from the ``draft_cache`` table instead of paying for
+another chat-completions call. Cache failures never block drafting.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from app.database import SessionLocal
+from app.models import DraftCache
+
+logger = logging.getLogger(__name__)
+
+DRAFT_CACHE_ENABLED = os.getenv("DRAFT_CACHE_ENABLED", "true").strip().lower() in {"1", "true", "yes", "on"}
+DRAFT_CACHE_MAX_AGE_DAYS = int(os.getenv("DRAFT_CACHE_MAX_AGE_DAYS", "30"))
+
+
+def make_key(model: str, prompt_version: str, *source_fields: str) -> str:
+    raw = json.dumps([model, prompt_version, *source_fields], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get(key: str) -> Optional[tuple[str, str, str]]:
+    """Return the cached (title, summary, content) for key, or None."""
+    if not DRAFT_CACHE_ENABLED:
+        return None
+    db = SessionLocal()
+    try:
+        row = db.get(DraftCache, key)
+        return (row.title, row.summary, row.content) if row else None
+    except Exception as exc:
+        logger.warning("Draft cache lookup failed: %s", exc)
+        return None
+    finally:
+        db.close()
+
+
+def put(key: str, model: str, title: str, summary: str, content: str) -> None:
+    if not DRAFT_CACHE_ENABLED:
+        return
+    db = SessionLocal()
+    try:
+        db.merge(DraftCache(key=key, model=model, title=title, summary=summary, content=content))
+        db.commit()
+    except Exception as exc:
+        db.rollback()
+        logger.warning("Draft cache write failed: %s", exc)
+    finally:
+        db.close()
+
+
+def prune(max_age_days: int = DRAFT_CACHE_MAX_AGE_DAYS) -> int:
+    """Delete drafts older than max_age_days; returns the number removed."""
+    if not DRAFT_CACHE_ENABLED:
+        return 0
+    cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+    db = SessionLocal()
+    try:
+        removed = db.query(DraftCache).filter(DraftCache.created_at < cutoff).delete(synchronize_session=False)
+        db.commit()
+        return removed
+    except Exception as exc:
+        db.rollback()
+        logger.warning("Draft cache prune failed: %s", exc)
+        return 0
+    finally:
+        db.close()
@@ -0,0 +1,214 @@
+"""
+Adaptive per-feed polling for continuous RSS ingest.
+
+Instead of one daily batch, each feed is polled on its own interval: about
+half the average gap between its recent entries, so busy feeds are checked
+often and quiet ones rarely. Polls that find nothing new back the interval
+off, failing feeds back off exponentially, and conditional GETs (ETag /
+Last-Modified) keep unchanged feeds cheap. New entries go through the same
+staged ingest queue as ``run_auto_publish``, a few at a time, while a daily
+per-topic cap bounds how many stories are published each day.
+"""
+
+import calendar
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+import feedparser
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import FeedState
+from . import draft_cache, ingest_queue, jobs
+from .auto_publish import (
+    AUTO_PUBLISH_PIPELINE,
+    FEEDS,
+    USER_AGENT,
+    FeedConfig,
+    _enqueue_entry,
+    _run_ingest_stages,
+)
+
+logger = logging.getLogger(__name__)
+
+FEED_POLL_MIN_SECS = int(os.getenv("FEED_POLL_MIN_SECS", "300"))
+FEED_POLL_MAX_SECS = int(os.getenv("FEED_POLL_MAX_SECS", "21600"))
+FEED_POLL_IDLE_BACKOFF = 1.5
+AUTO_PUBLISH_TIMEZONE = os.getenv("AUTO_PUBLISH_TIMEZONE", "Asia/Kolkata")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _aware(value: Optional[datetime]) -> Optional[datetime]:
+    # SQLite hands DateTime(timezone=True) columns back as naive UTC.
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _start_of_day() -> datetime:
+    local_now = datetime.now(ZoneInfo(AUTO_PUBLISH_TIMEZONE))
+    return local_now.replace(hour=0, minute=0, second=0, microsecond=0).astimezone(timezone.utc)
+
+
+def _entry_time(entry: dict) -> Optional[datetime]:
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if not parsed:
+        return None
+    return datetime.fromtimestamp(calendar.timegm(parsed), tz=timezone.utc)
+
+
+def _clamp_interval(seconds: float) -> int:
+    return int(min(FEED_POLL_MAX_SECS, max(FEED_POLL_MIN_SECS, seconds)))
+
+
+def _observed_interval(entry_times: list[datetime]) -> Optional[int]:
+    """Half the mean gap between the feed's entries, or None with too few timestamps."""
+    if len(entry_times) < 2:
+        return None
+    span = (max(entry_times) - min(entry_times)).total_seconds()
+    return _clamp_interval(span / (len(entry_times) - 1) / 2)
+
+
+def _feed_state(db: Session, feed: FeedConfig, now: datetime) -> FeedState:
+    state = db.get(FeedState, feed.url)
+    if state is None:
+        state = FeedState(
+            feed_url=feed.url,
+            topic=feed.topic,
+            interval_secs=FEED_POLL_MIN_SECS,
+            next_poll_at=now,
+            consecutive_failures=0,
+        )
+        db.add(state)
+        db.commit()
+    return state
+
+
+def _daily_remaining(db: Session, max_per_topic: int) -> dict[str, int]:
+    """Today's remaining quota per topic, less stories already on their way."""
+    published = ingest_queue.published_since(db, AUTO_PUBLISH_PIPELINE, _start_of_day())
+    active = ingest_queue.active_counts(db, AUTO_PUBLISH_PIPELINE)
+    return {
+        topic: max(0, max_per_topic - published.get(topic, 0) - active.get(topic, 0))
+        for topic in dict.fromkeys(feed.topic for feed in FEEDS)
+    }
+
+
+def _poll_feed(
+    db: Session,
+    feed: FeedConfig,
+    state: FeedState,
+    remaining: dict[str, int],
+    fingerprints: list[list[str]],
+) -> int:
+    """Fetch one due feed, queue what the topic's quota allows, and reschedule it. Returns entries queued."""
+    now = _utcnow()
+    queued = 0
+    try:
+        parsed = feedparser.parse(feed.url, etag=state.etag, modified=state.modified, agent=USER_AGENT)
+        status = getattr(parsed, "status", 200)
+        if parsed.bozo and not parsed.entries and status != 304:
+            raise ValueError(f"unreadable feed: {parsed.bozo_exception}")
+        if status >= 400:
+            raise ValueError(f"HTTP {status}")
+    except Exception as exc:
+        state.consecutive_failures = (state.consecutive_failures or 0) + 1
+        state.last_error = str(exc)[:2000]
+        state.interval_secs = _clamp_interval(FEED_POLL_MIN_SECS * 2 ** state.consecutive_failures)
+        logger.warning("[FeedPoller] %s failed (%d in a row): %s", feed.source_name, state.consecutive_failures, exc)
+    else:
+        entries = parsed.entries
+        entry_times = [t for t in (_entry_time(entry) for entry in entries) if t is not None]
+        last_entry_at = _aware(state.last_entry_at)
+        fresh = sorted(
+            (
+                entry for entry in entries
+                if last_entry_at is None or (_entry_time(entry) or now) > last_entry_at
+            ),
+            key=lambda entry: _entry_time(entry) or now,
+        )
+
+        # Oldest first, so the watermark only passes entries that were looked
+        # at; whatever the topic's quota leaves over stays fresh for next poll.
+        watermark = last_entry_at
+        dropped = 0
+        for index, entry in enumerate(fresh):
+            if remaining.get(feed.topic, 0) <= 0:
+                dropped = len(fresh) - index
+                break
+            if _enqueue_entry(db, feed, entry, fingerprints):
+                remaining[feed.topic] -= 1
+                queued += 1
+            entry_at = _entry_time(entry)
+            if entry_at is not None and (watermark is None or entry_at > watermark):
+                watermark = entry_at
+
+        observed = _observed_interval(entry_times)
+        if fresh and observed is not None:
+            state.interval_secs = observed
+        elif not fresh:
+            state.interval_secs = _clamp_interval(state.interval_secs * FEED_POLL_IDLE_BACKOFF)
+        state.last_entry_at = watermark
+        if not dropped:
+            # Keep the old validators otherwise, or a 304 would hide the dropped entries.
+            state.etag = getattr(parsed, "etag", None) or state.etag
+            state.modified = getattr(parsed, "modified", None) or state.modified
+        state.consecutive_failures = 0
+        state.last_error = None
+        logger.info(
+            "[FeedPoller] %s: %d new, %d queued, %d left for later, next poll in %ds",
+            feed.source_name, len(fresh), queued, dropped, state.interval_secs,
+        )
+
+    state.last_polled_at = now
+    state.next_poll_at = now + timedelta(seconds=state.interval_secs)
+    db.commit()
+    return queued
+
+
+def _published(counts: dict[str, int], before: dict[str, int]) -> dict[str, int]:
+    return {topic: count - before.get(topic, 0) for topic, count in counts.items()}
+
+
+def poll_feeds(max_per_topic: int = 5) -> dict[str, int]:
+    """
+    Poll every due feed, queue new entries within today's per-topic cap of
+    ``max_per_topic``, and push the queue through to publication.
+    """
+    stats: dict[str, int] = {"polled": 0, "queued": 0}
+    owner = ingest_queue.worker_id()
+    db = SessionLocal()
+    try:
+        ingest_queue.prune(db)
+        now = _utcnow()
+        with jobs.track_stage("discover"):
+            remaining = _daily_remaining(db, max_per_topic)
+            fingerprints = ingest_queue.active_payload_values(db, AUTO_PUBLISH_PIPELINE, "fingerprint")
+            for feed in FEEDS:
+                state = _feed_state(db, feed, now)
+                if _aware(state.next_poll_at) > now:
+                    continue
+                try:
+                    stats["queued"] += _poll_feed(db, feed, state, remaining, fingerprints)
+                except Exception as exc:
+                    db.rollback()
+                    logger.exception("[FeedPoller] could not process %s: %s", feed.source_name, exc)
+                stats["polled"] += 1
+
+        # Seeded with today's count, so publishing stops at the daily cap.
+        published_today = ingest_queue.published_since(db, AUTO_PUBLISH_PIPELINE, _start_of_day())
+        counts = {topic: published_today.get(topic, 0) for topic in remaining}
+        while _run_ingest_stages(db, owner, counts, max_per_topic):
+            jobs.report_progress({**stats, **_published(counts, published_today)})
+        stats.update(_published(counts, published_today))
+    finally:
+        db.close()
+    if stats["polled"]:
+        draft_cache.prune()
+    return stats
@@ -0,0 +1,360 @@
+"""
+Persistent, lease-based work queue for the staged ingest pipelines.
+
+Each source story is one ``ingest_items`` row that moves through
+``discovered → fetched → drafted → imaged → published`` (or ends as
+``skipped``/``failed``). Stage outputs are stored on the row, so a process
+restarted mid-run resumes from the last completed stage instead of redoing
+fetches and LLM calls.
+
+A worker claims rows by compare-and-set on the lease columns, which works
+the same on SQLite and Postgres: the ``UPDATE`` only succeeds while the row
+is unleased or its lease has expired. Leases of crashed workers simply run
+out. Failures are retried per item with exponential backoff, up to
+``INGEST_MAX_ATTEMPTS``.
+
+All queue calls take the caller's session and run on the caller's thread;
+``process_stage`` fans the stage work itself out to a thread pool.
+"""
+
+import hashlib
+import logging
+import os
+import socket
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterator, Optional
+
+from sqlalchemy import and_, func, not_, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models import IngestItem, News
+
+logger = logging.getLogger(__name__)
+
+DISCOVERED = "discovered"
+FETCHED = "fetched"
+DRAFTED = "drafted"
+IMAGED = "imaged"
+PUBLISHED = "published"
+SKIPPED = "skipped"
+FAILED = "failed"
+ACTIVE_STAGES = (DISCOVERED, FETCHED, DRAFTED, IMAGED)
+
+INGEST_LEASE_SECS = int(os.getenv("INGEST_LEASE_SECS", "900"))
+INGEST_MAX_ATTEMPTS = int(os.getenv("INGEST_MAX_ATTEMPTS", "3"))
+INGEST_RETRY_BACKOFF_SECS = int(os.getenv("INGEST_RETRY_BACKOFF_SECS", "60"))
+INGEST_RETENTION_DAYS = int(os.getenv("INGEST_RETENTION_DAYS", "14"))
+INGEST_DISCOVERED_TTL_HOURS = int(os.getenv("INGEST_DISCOVERED_TTL_HOURS", "12"))
+
+ImageAsset = tuple[Optional[bytes], Optional[str], Optional[str]]
+
+
+@dataclass(frozen=True)
+class QueuedItem:
+    """Detached snapshot of a claimed row, safe to hand to worker threads."""
+    id: int
+    pipeline: str
+    topic: str
+    stage: str
+    source_url: str
+    attempts: int
+    payload: dict[str, Any] = field(default_factory=dict)
+    image_asset: ImageAsset = (None, None, None)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def worker_id() -> str:
+    """Lease owner id, unique per process and run."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def source_key(source_url: str) -> str:
+    from .auto_publish import _canonical_url  # auto_publish imports this module
+
+    return hashlib.sha256(_canonical_url(source_url).encode("utf-8")).hexdigest()
+
+
+def _snapshot(row: IngestItem) -> QueuedItem:
+    return QueuedItem(
+        id=row.id,
+        pipeline=row.pipeline,
+        topic=row.topic,
+        stage=row.stage,
+        source_url=row.source_url,
+        attempts=row.attempts or 0,
+        payload=dict(row.payload or {}),
+        image_asset=(row.image_data, row.image_filename, row.image_mimetype),
+    )
+
+
+def is_queued(db: Session, pipeline: str, source_url: str) -> bool:
+    """True when the source was already queued by this pipeline, in any stage."""
+    return (
+        db.query(IngestItem.id)
+        .filter(IngestItem.pipeline == pipeline, IngestItem.source_key == source_key(source_url))
+        .first()
+        is not None
+    )
+
+
+def enqueue(db: Session, pipeline: str, topic: str, source_url: str, payload: dict[str, Any]) -> bool:
+    """Queue a newly discovered source; returns False if it was queued before."""
+    if is_queued(db, pipeline, source_url):
+        return False
+    db.add(
+        IngestItem(
+            pipeline=pipeline,
+            topic=topic,
+            stage=DISCOVERED,
+            source_key=source_key(source_url),
+            source_url=source_url[:1000],
+            payload=payload,
+            attempts=0,
+        )
+    )
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another worker queued the same source in the meantime.
+        db.rollback()
+        return False
+    return True
+
+
+def active_counts(db: Session, pipeline: str, stages: tuple[str, ...] = ACTIVE_STAGES) -> dict[str, int]:
+    """
+    Items per topic currently in any of ``stages`` (by default, all
+    unfinished ones). Items waiting out a retry backoff are not counted, so
+    callers can fill their place with fresh work.
+    """
+    in_backoff = and_(
+        IngestItem.lease_owner.is_(None),
+        IngestItem.lease_expires_at.is_not(None),
+        IngestItem.lease_expires_at > _utcnow(),
+    )
+    rows = (
+        db.query(IngestItem.topic, func.count(IngestItem.id))
+        .filter(IngestItem.pipeline == pipeline, IngestItem.stage.in_(stages), not_(in_backoff))
+        .group_by(IngestItem.topic)
+        .all()
+    )
+    return {topic: count for topic, count in rows}
+
+
+def published_since(db: Session, pipeline: str, since: datetime) -> dict[str, int]:
+    """Stories per topic this pipeline has published since ``since``."""
+    rows = (
+        db.query(IngestItem.topic, func.count(IngestItem.id))
+        .join(News, News.id == IngestItem.news_id)
+        .filter(IngestItem.pipeline == pipeline, IngestItem.stage == PUBLISHED, News.created_at >= since)
+        .group_by(IngestItem.topic)
+        .all()
+    )
+    return {topic: count for topic, count in rows}
+
+
+def active_payload_values(db: Session, pipeline: str, key: str) -> list[Any]:
+    """``payload[key]`` of every unfinished item, e.g. their near-duplicate fingerprints."""
+    rows = (
+        db.query(IngestItem.payload)
+        .filter(IngestItem.pipeline == pipeline, IngestItem.stage.in_(ACTIVE_STAGES))
+        .all()
+    )
+    return [payload[key] for (payload,) in rows if payload and payload.get(key) is not None]
+
+
+def claim(
+    db: Session,
+    pipeline: str,
+    stage: str,
+    owner: str,
+    limit: int,
+    topic_limits: Optional[dict[str, int]] = None,
+) -> list[QueuedItem]:
+    """
+    Lease up to ``limit`` items waiting in ``stage``, oldest first. With
+    ``topic_limits``, at most that many items per topic (topics missing from
+    the map are not claimed).
+    """
+    if limit <= 0:
+        return []
+    now = _utcnow()
+    available = or_(IngestItem.lease_expires_at.is_(None), IngestItem.lease_expires_at < now)
+    candidates = (
+        db.query(IngestItem.id, IngestItem.topic)
+        .filter(IngestItem.pipeline == pipeline, IngestItem.stage == stage, available)
+        .order_by(IngestItem.id)
+        .limit(limit * 4 if topic_limits is not None else limit)
+        .all()
+    )
+
+    claimed_ids: list[int] = []
+    per_topic: dict[str, int] = {}
+    for item_id, topic in candidates:
+        if len(claimed_ids) >= limit:
+            break
+        if topic_limits is not None and per_topic.get(topic, 0) >= topic_limits.get(topic, 0):
+            continue
+        updated = (
+            db.query(IngestItem)
+            .filter(IngestItem.id == item_id, IngestItem.stage == stage, available)
+            .update(
+                {
+                    IngestItem.lease_owner: owner,
+                    IngestItem.lease_expires_at: now + timedelta(seconds=INGEST_LEASE_SECS),
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        if updated:
+            claimed_ids.append(item_id)
+            per_topic[topic] = per_topic.get(topic, 0) + 1
+
+    if not claimed_ids:
+        return []
+    rows = db.query(IngestItem).filter(IngestItem.id.in_(claimed_ids)).order_by(IngestItem.id).all()
+    return [_snapshot(row) for row in rows]
+
+
+def advance(
+    db: Session,
+    item: QueuedItem,
+    owner: str,
+    stage: str,
+    payload: Optional[dict[str, Any]] = None,
+    image_asset: Optional[ImageAsset] = None,
+    source_url: Optional[str] = None,
+    news_id: Optional[int] = None,
+) -> bool:
+    """
+    Move a leased item to ``stage`` and release it. Returns False when the
+    lease was lost (it expired and another worker took the item over).
+    """
+    values: dict[Any, Any] = {
+        IngestItem.stage: stage,
+        IngestItem.lease_owner: None,
+        IngestItem.lease_expires_at: None,
+        IngestItem.last_error: None,
+    }
+    if payload is not None:
+        values[IngestItem.payload] = payload
+    if image_asset is not None:
+        values[IngestItem.image_data] = image_asset[0]
+        values[IngestItem.image_filename] = image_asset[1]
+        values[IngestItem.image_mimetype] = image_asset[2]
+    if source_url is not None:
+        values[IngestItem.source_url] = source_url[:1000]
+    if news_id is not None:
+        values[IngestItem.news_id] = news_id
+    if stage in (PUBLISHED, SKIPPED):
+        # The image now lives on the news row (or is not needed at all).
+        values[IngestItem.image_data] = None
+
+    updated = (
+        db.query(IngestItem)
+        .filter(IngestItem.id == item.id, IngestItem.lease_owner == owner)
+        .update(values, synchronize_session=False)
+    )
+    db.commit()
+    if not updated:
+        logger.warning("[Queue] lost lease on item %s before moving it to %s", item.id, stage)
+    return bool(updated)
+
+
+def fail(db: Session, item: QueuedItem, owner: str, error: Exception | str) -> str:
+    """
+    Record a failed attempt. The item stays in its stage and becomes
+    claimable again after a backoff, or moves to ``failed`` once
+    ``INGEST_MAX_ATTEMPTS`` is reached. Returns the item's new stage.
+    """
+    attempts = item.attempts + 1
+    if attempts >= INGEST_MAX_ATTEMPTS:
+        stage, not_before = FAILED, None
+    else:
+        stage = item.stage
+        not_before = _utcnow() + timedelta(seconds=INGEST_RETRY_BACKOFF_SECS * 2 ** (attempts - 1))
+    db.query(IngestItem).filter(IngestItem.id == item.id, IngestItem.lease_owner == owner).update(
+        {
+            IngestItem.stage: stage,
+            IngestItem.attempts: attempts,
+            IngestItem.last_error: str(error)[:2000],
+            IngestItem.lease_owner: None,
+            IngestItem.lease_expires_at: not_before,
+        },
+        synchronize_session=False,
+    )
+    db.commit()
+    logger.warning("[Queue] item %s failed in %s (attempt %d): %s", item.id, item.stage, attempts, error)
+    return stage
+
+
+def process_stage(
+    items: list[QueuedItem],
+    handler: Callable[[QueuedItem], Any],
+    concurrency: int,
+    thread_name_prefix: str = "ingest",
+) -> Iterator[tuple[QueuedItem, Any, Optional[Exception]]]:
+    """
+    Run ``handler`` over items on up to ``concurrency`` threads, yielding
+    ``(item, result, error)`` on the calling thread as each one finishes so
+    the caller can record the outcome with its own session.
+    """
+    if not items:
+        return
+    if concurrency <= 1 or len(items) == 1:
+        for item in items:
+            try:
+                yield item, handler(item), None
+            except Exception as exc:
+                yield item, None, exc
+        return
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items)), thread_name_prefix=thread_name_prefix) as pool:
+        futures = {pool.submit(handler, item): item for item in items}
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                yield item, future.result(), None
+            except Exception as exc:
+                yield item, None, exc
+
+
+def prune(db: Session, max_age_days: int = INGEST_RETENTION_DAYS) -> int:
+    """
+    Delete finished items older than max_age_days, and discovered items
+    nobody started within INGEST_DISCOVERED_TTL_HOURS (stale news; a later
+    discovery may queue them again). Returns the number removed.
+    """
+    now = _utcnow()
+    try:
+        removed = (
+            db.query(IngestItem)
+            .filter(
+                or_(
+                    and_(
+                        IngestItem.stage.in_((PUBLISHED, SKIPPED, FAILED)),
+                        IngestItem.created_at < now - timedelta(days=max_age_days),
+                    ),
+                    and_(
+                        IngestItem.stage == DISCOVERED,
+                        IngestItem.attempts == 0,
+                        IngestItem.created_at < now - timedelta(hours=INGEST_DISCOVERED_TTL_HOURS),
+                    ),
+                )
+            )
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        return removed
+    except Exception as exc:
+        db.rollback()
+        logger.warning("Ingest queue prune failed: %s", exc)
+        return 0
@@ -0,0 +1,222 @@
+"""
+DB-backed job queue between the API process and the ingest worker.
+
+The API (admin endpoints, scheduler) only inserts ``jobs`` rows; the worker
+process (``python -m agents.worker``) claims them and runs the pipelines,
+so parsing and LLM work never share the API's threadpool or GIL.
+
+Claiming is a compare-and-set ``UPDATE`` like the ingest queue's leases. A
+running job's lease is renewed by the worker's heartbeat; if the worker
+dies, the lease runs out and another worker picks the job up again, which
+is safe because the pipelines resume from their persisted stages.
+
+While a job runs, the pipelines report their stages through
+``track_stage``/``report_progress``; the timings and running stats are
+written to ``jobs.progress`` for ``GET /admin/jobs/{id}``. Outside a job
+both are no-ops.
+"""
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import Job
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+JOB_LEASE_SECS = int(os.getenv("JOB_LEASE_SECS", "300"))
+# "inline" runs jobs on a thread of the process that queued them; "worker"
+# leaves them for the separate ingest worker (python -m agents.worker).
+INGEST_MODE = os.getenv("INGEST_MODE", "inline").strip().lower()
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def enqueue_job(kind: str, params: Optional[dict[str, Any]] = None, coalesce: bool = True) -> int:
+    """
+    Queue a job and return its id. With ``coalesce``, a job of the same kind
+    that is still queued or running is returned instead of adding another.
+    """
+    db = SessionLocal()
+    try:
+        if coalesce:
+            existing = (
+                db.query(Job.id)
+                .filter(Job.kind == kind, Job.status.in_((QUEUED, RUNNING)))
+                .order_by(Job.id)
+                .first()
+            )
+            if existing is not None:
+                logger.info("[Jobs] %s already pending as job %s", kind, existing.id)
+                return existing.id
+        job = Job(kind=kind, status=QUEUED, params=params or {})
+        db.add(job)
+        db.commit()
+        logger.info("[Jobs] queued %s as job %s", kind, job.id)
+        return job.id
+    finally:
+        db.close()
+
+
+def _claimable(now: datetime):
+    return or_(
+        Job.status == QUEUED,
+        and_(Job.status == RUNNING, Job.lease_expires_at < now),
+    )
+
+
+def claimable_job_ids(db: Session) -> list[int]:
+    """Queued jobs plus running ones whose worker stopped heartbeating, oldest first."""
+    return [job_id for (job_id,) in db.query(Job.id).filter(_claimable(_utcnow())).order_by(Job.id).all()]
+
+
+def claim_job(db: Session, owner: str, job_id: Optional[int] = None) -> Optional[Job]:
+    """
+    Lease the oldest queued job (or the given one), including a running job
+    whose worker stopped heartbeating. None when there is nothing to claim.
+    """
+    now = _utcnow()
+    claimable = _claimable(now)
+    query = db.query(Job.id).filter(claimable)
+    if job_id is not None:
+        query = query.filter(Job.id == job_id)
+    candidates = query.order_by(Job.id).limit(5).all()
+    for (job_id,) in candidates:
+        updated = (
+            db.query(Job)
+            .filter(Job.id == job_id, claimable)
+            .update(
+                {
+                    Job.status: RUNNING,
+                    Job.worker: owner,
+                    Job.started_at: now,
+                    Job.lease_expires_at: now + timedelta(seconds=JOB_LEASE_SECS),
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        if updated:
+            return db.get(Job, job_id)
+    return None
+
+
+def renew_lease(db: Session, job_id: int, owner: str) -> bool:
+    updated = (
+        db.query(Job)
+        .filter(Job.id == job_id, Job.worker == owner, Job.status == RUNNING)
+        .update(
+            {Job.lease_expires_at: _utcnow() + timedelta(seconds=JOB_LEASE_SECS)},
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return bool(updated)
+
+
+def finish_job(
+    db: Session,
+    job_id: int,
+    owner: str,
+    stats: Optional[dict[str, Any]] = None,
+    error: Optional[str] = None,
+    progress: Optional[dict[str, Any]] = None,
+) -> None:
+    db.query(Job).filter(Job.id == job_id, Job.worker == owner).update(
+        {
+            Job.status: FAILED if error else SUCCEEDED,
+            Job.stats: stats,
+            Job.progress: progress,
+            Job.error: error,
+            Job.finished_at: _utcnow(),
+            Job.lease_expires_at: None,
+        },
+        synchronize_session=False,
+    )
+    db.commit()
+
+
+class JobProgress:
+    """Per-stage wall time and running stats of the job executing on this thread."""
+
+    def __init__(self, job_id: int):
+        self.job_id = job_id
+        self.stage: Optional[str] = None
+        self.stages: dict[str, dict[str, float]] = {}
+        self.stats: dict[str, Any] = {}
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "stats": dict(self.stats),
+            "stages": {name: dict(timing) for name, timing in self.stages.items()},
+        }
+
+    def flush(self) -> None:
+        db = SessionLocal()
+        try:
+            db.query(Job).filter(Job.id == self.job_id).update(
+                {Job.progress: self.as_dict()}, synchronize_session=False
+            )
+            db.commit()
+        except Exception as exc:
+            db.rollback()
+            logger.warning("[Jobs] could not record progress for job %s: %s", self.job_id, exc)
+        finally:
+            db.close()
+
+
+_current_progress: ContextVar[Optional[JobProgress]] = ContextVar("job_progress", default=None)
+
+
+@contextmanager
+def tracking(job_id: int) -> Iterator[JobProgress]:
+    """Collect stage reports from the code run inside this block for job_id."""
+    progress = JobProgress(job_id)
+    token = _current_progress.set(progress)
+    try:
+        yield progress
+    finally:
+        _current_progress.reset(token)
+
+
+@contextmanager
+def track_stage(name: str) -> Iterator[None]:
+    """Time a pipeline stage; repeated passes over the same stage accumulate."""
+    progress = _current_progress.get()
+    if progress is None:
+        yield
+        return
+    progress.stage = name
+    progress.flush()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing = progress.stages.setdefault(name, {"seconds": 0.0, "passes": 0})
+        timing["seconds"] = round(timing["seconds"] + time.perf_counter() - started, 3)
+        timing["passes"] += 1
+        progress.stage = None
+
+
+def report_progress(stats: dict[str, Any]) -> None:
+    """Publish the pipeline's running stats to the current job, if any."""
+    progress = _current_progress.get()
+    if progress is not None:
+        progress.stats = dict(stats)
+        progress.flush()
@@ -0,0 +1,210 @@
+"""
+Cross-source near-duplicate story detection.
+
+The same event reported by several outlets rarely shares a URL or an exact
+title, so ``_source_exists``/``_story_exists`` let it through once per
+source. Outlets paraphrase headlines, but keep the entities and figures
+("Microsoft", "Activision", "69 billion"), so a candidate is fingerprinted
+by the distinct normalized words of its source title, in title order:
+lowercased, ASCII-folded, stopwords and live-coverage boilerplate ("live",
+"score", "vs", "day") dropped, number words, ordinals and "bn"/"m" spelled
+as figures, crude suffixes stripped. Two stories count as the same event
+when the Jaccard similarity of their word sets is at least
+``NEAR_DUPLICATE_MIN_JACCARD`` and neither guard below tells them apart.
+
+Word sets ignore figures' meaning and word order, which formulaic sports
+headlines defeat: "1st Test Day 2" and "2nd Test Day 2" share almost every
+word, and "India beat Pakistan" has the same words as "Pakistan beat
+India". So when both titles carry figures they must carry the same ones,
+and when both use the same result verb ("beat", "defeat", "lose") the words
+before it, the side it is about, must overlap.
+
+Published stories keep their words in ``story_fingerprints`` and their
+MinHash LSH band keys (16 bands of 2 rows) in ``story_fingerprint_bands``,
+so lookups are indexed equality matches followed by the exact checks.
+At a similarity of 0.5 a pair shares a band with probability ~0.99.
+
+Measured on paraphrased headline pairs from different outlets, same-event
+pairs scored 0.44-0.80 and unrelated pairs 0.0-0.40 (the top being two
+different Test matches between the same sides); 0.5 flags 9 of 10
+paraphrases and none of the controls, and the two guards keep all of
+those paraphrases matched. Leads are left out: they differ between outlets
+far more than headlines do.
+
+Checks run on the feed/search snippet, before the page fetch and LLM call.
+"""
+
+import hashlib
+import logging
+import os
+import random
+import re
+import unicodedata
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from app.models import News, StoryFingerprint, StoryFingerprintBand
+
+logger = logging.getLogger(__name__)
+
+NEAR_DUPLICATE_MIN_JACCARD = float(os.getenv("NEAR_DUPLICATE_MIN_JACCARD", "0.5"))
+NEAR_DUPLICATE_WINDOW_DAYS = int(os.getenv("NEAR_DUPLICATE_WINDOW_DAYS", "7"))
+
+# Titles this short match too easily by chance.
+_MIN_TOKENS = 3
+_BANDS = 16
+_ROWS_PER_BAND = 2
+_PRIME = (1 << 61) - 1
+_rng = random.Random(35)  # fixed seed: stored band keys must stay stable across releases
+_PERMUTATIONS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(_BANDS * _ROWS_PER_BAND)
+]
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_UNIT_RE = re.compile(r"(\d)([a-z]+)\b")
+_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have",
+    "in", "is", "it", "its", "of", "on", "or", "that", "the", "this", "to", "was",
+    "were", "will", "with", "after", "over", "says", "said", "new", "s",
+    "st", "nd", "rd", "th",
+    # Live-coverage boilerplate: shared by every match page, says nothing about which.
+    "live", "score", "scores", "scorecard", "update", "updates", "highlights",
+    "vs", "v", "day", "match", "today", "latest", "watch", "streaming",
+})
+_SYNONYMS = {
+    "one": "1", "two": "2", "three": "3", "four": "4", "five": "5",
+    "six": "6", "seven": "7", "eight": "8", "nine": "9", "ten": "10",
+    "first": "1", "second": "2", "third": "3", "fourth": "4", "fifth": "5",
+    "bn": "billion", "b": "billion", "mn": "million", "m": "million",
+}
+_SUFFIXES = ("ments", "ment", "ings", "ing", "ies", "ed", "es", "s", "e", "y")
+
+
+def _stem(word: str) -> str:
+    stripped = True
+    while stripped:
+        stripped = False
+        for suffix in _SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+                word = word[: -len(suffix)]
+                stripped = True
+                break
+    return word
+
+
+def story_fingerprint(title: str) -> list[str]:
+    """Distinct normalized words of a story title, in title order; JSON-safe for queue payloads."""
+    text = unicodedata.normalize("NFKD", title.lower()).encode("ascii", "ignore").decode("ascii")
+    text = _UNIT_RE.sub(r"\1 \2", text)
+    words: dict[str, None] = {}
+    for word in _WORD_RE.findall(text):
+        word = _SYNONYMS.get(word, word)
+        if word not in _STOPWORDS:
+            words[word if word.isdigit() else _stem(word)] = None
+    return list(words)
+
+
+_RESULT_VERBS = frozenset(_stem(word) for word in (
+    "beat", "beats", "defeat", "defeats", "defeated", "thrash", "thrashes", "thrashed",
+    "edge", "edges", "edged", "stun", "stuns", "stunned", "crush", "crushes", "crushed",
+    "rout", "routs", "routed", "trounce", "trounces", "trounced", "outclass", "outclasses",
+    "outclassed", "hammer", "hammers", "hammered", "whitewash", "whitewashes", "whitewashed",
+    "lose", "loses", "lost", "upset", "upsets",
+))
+
+
+def _as_fingerprint(value: Any) -> Optional[tuple[str, ...]]:
+    # Items queued before fingerprints were word lists carry a SimHash int.
+    if isinstance(value, (list, tuple)) and len(set(value)) >= _MIN_TOKENS:
+        return tuple(dict.fromkeys(value))
+    return None
+
+
+def jaccard(a: Sequence[str], b: Sequence[str]) -> float:
+    words_a, words_b = set(a), set(b)
+    if not words_a or not words_b:
+        return 0.0
+    return len(words_a & words_b) / len(words_a | words_b)
+
+
+def _different_figures(a: Sequence[str], b: Sequence[str]) -> bool:
+    figures_a = {word for word in a if word.isdigit()}
+    figures_b = {word for word in b if word.isdigit()}
+    return bool(figures_a and figures_b) and figures_a != figures_b
+
+
+def _opposite_sides(a: Sequence[str], b: Sequence[str]) -> bool:
+    """The same result verb with nothing in common before it: "X beat Y" against "Y beat X"."""
+    for verb in _RESULT_VERBS.intersection(a, b):
+        side_a, side_b = set(a[:a.index(verb)]), set(b[:b.index(verb)])
+        if side_a and side_b and not side_a & side_b:
+            return True
+    return False
+
+
+def is_near_duplicate(a: Any, b: Any, min_jaccard: float = NEAR_DUPLICATE_MIN_JACCARD) -> bool:
+    words_a, words_b = _as_fingerprint(a), _as_fingerprint(b)
+    if words_a is None or words_b is None:
+        return False
+    return (
+        jaccard(words_a, words_b) >= min_jaccard
+        and not _different_figures(words_a, words_b)
+        and not _opposite_sides(words_a, words_b)
+    )
+
+
+def _word_hash(word: str) -> int:
+    return int.from_bytes(hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def band_keys(fingerprint: Sequence[str]) -> list[int]:
+    """MinHash LSH keys: one signed 64-bit key per band, band index mixed in."""
+    hashes = [_word_hash(word) for word in fingerprint]
+    signature = [min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS]
+    keys = []
+    for band in range(_BANDS):
+        rows = signature[band * _ROWS_PER_BAND:(band + 1) * _ROWS_PER_BAND]
+        digest = hashlib.blake2b(f"{band}:{rows}".encode("ascii"), digest_size=8).digest()
+        keys.append(int.from_bytes(digest, "big", signed=True))
+    return keys
+
+
+def find_near_duplicate(db: Session, fingerprint: Sequence[str]) -> Optional[int]:
+    """Return the id of a recently published story near fingerprint, or None."""
+    words = _as_fingerprint(fingerprint)
+    if words is None or NEAR_DUPLICATE_MIN_JACCARD > 1:
+        return None
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=NEAR_DUPLICATE_WINDOW_DAYS)
+    candidates = (
+        db.query(StoryFingerprint.title_tokens, StoryFingerprint.news_id)
+        .join(StoryFingerprintBand, StoryFingerprintBand.fingerprint_id == StoryFingerprint.id)
+        .join(News, News.id == StoryFingerprint.news_id)
+        .filter(
+            StoryFingerprint.created_at >= cutoff,
+            StoryFingerprintBand.band_key.in_(band_keys(words)),
+        )
+        .distinct()
+        .all()
+    )
+    for stored, news_id in candidates:
+        if is_near_duplicate(words, stored.split()):
+            return news_id
+    return None
+
+
+def record_fingerprint(db: Session, fingerprint: Any, news_id: int, source_url: Optional[str] = None) -> None:
+    """Add the fingerprint of a newly published story; committed with the caller's transaction."""
+    words = _as_fingerprint(fingerprint)
+    if words is None:
+        return
+    row = StoryFingerprint(
+        news_id=news_id,
+        source_url=(source_url or "")[:1000] or None,
+        title_tokens=" ".join(words),
+    )
+    db.add(row)
+    db.flush()
+    db.add_all(StoryFingerprintBand(fingerprint_id=row.id, band_key=key) for key in band_keys(words))
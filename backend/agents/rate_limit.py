@@ -0,0 +1,79 @@
+"""
+Thread-safe token-bucket rate limiting shared by the ingest pipelines.
+
+Concurrent workers call ``acquire()`` before touching an external service
+instead of sleeping for a fixed interval, so throughput is bounded by the
+service's real limits rather than by idle time.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Refills ``rate`` tokens per second up to ``capacity``; ``acquire`` blocks until enough are available."""
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("TokenBucket rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Take ``amount`` tokens, blocking as needed. Returns the seconds spent waiting."""
+        # A request larger than the bucket could never be satisfied; let it
+        # through once the bucket is full instead of deadlocking.
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                delay = (amount - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class RateLimiter:
+    """
+    Requests-per-minute plus optional tokens-per-minute limits, as LLM providers
+    enforce them. A limit of zero (or None) disables it. ``burst`` caps how
+    many requests may go out back-to-back (defaults to a full minute's worth).
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float],
+        tokens_per_minute: Optional[float] = None,
+        burst: Optional[float] = None,
+    ):
+        self.requests = (
+            TokenBucket(requests_per_minute / 60.0, max(1.0, burst or requests_per_minute))
+            if requests_per_minute
+            else None
+        )
+        self.tokens = (
+            TokenBucket(tokens_per_minute / 60.0, tokens_per_minute)
+            if tokens_per_minute
+            else None
+        )
+
+    def acquire(self, tokens: int = 0, requests: int = 1) -> float:
+        """Block until ``requests`` requests (and ``tokens`` tokens) fit within the limits."""
+        waited = 0.0
+        if self.requests is not None and requests:
+            waited += self.requests.acquire(requests)
+        if self.tokens is not None and tokens:
+            waited += self.tokens.acquire(tokens)
+        return waited
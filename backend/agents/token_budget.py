@@ -0,0 +1,165 @@
+"""
+Token-aware source excerpt budgeting for LLM prompts.
+
+Instead of cutting source text at a fixed character count (often
+mid-sentence, and rarely matching the model's real token usage), the
+budgeter keeps the lead paragraph plus the most informative remaining
+paragraphs (quotes, figures, early context) that fit a per-model token
+budget, in their original order.
+
+Token counts use tiktoken when it is installed and fall back to a
+~4-characters-per-token estimate otherwise.
+"""
+
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+DEFAULT_SOURCE_TOKEN_BUDGET = int(os.getenv("SOURCE_TOKEN_BUDGET", "1200"))
+
+
+def _parse_model_budgets(raw: str) -> dict[str, int]:
+    """Parse ``"gpt-4o-mini=1200,gpt-4o=2000"`` into a per-model budget map."""
+    budgets: dict[str, int] = {}
+    for item in raw.split(","):
+        model, _, value = item.partition("=")
+        if model.strip() and value.strip().isdigit():
+            budgets[model.strip()] = int(value.strip())
+    return budgets
+
+
+MODEL_SOURCE_TOKEN_BUDGETS = _parse_model_budgets(os.getenv("SOURCE_TOKEN_BUDGETS", ""))
+
+_QUOTE_RE = re.compile(r"[\"“”]")
+_FIGURE_RE = re.compile(r"\d+(?:[.,]\d+)*%?")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+@dataclass(frozen=True)
+class SourceExcerpt:
+    text: str
+    tokens: int
+    budget: int
+    paragraphs_used: int
+    paragraphs_total: int
+
+
+_encodings: dict = {}
+_encoding_failed_at: dict[str, float] = {}
+# Encodings are downloaded on first use; after a failure (offline host,
+# network blip) the estimate is used until the next retry, not for good.
+ENCODING_RETRY_SECS = 300
+
+
+def _encoding(model: str):
+    """Return the tiktoken encoding for model, or None while it cannot be loaded."""
+    if tiktoken is None:
+        return None
+    encoding = _encodings.get(model)
+    if encoding is not None:
+        return encoding
+    failed_at = _encoding_failed_at.get(model)
+    if failed_at is not None and time.monotonic() - failed_at < ENCODING_RETRY_SECS:
+        return None
+    try:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding("o200k_base")
+    except Exception as exc:
+        _encoding_failed_at[model] = time.monotonic()
+        logger.warning("tiktoken encoding unavailable for %s, estimating tokens: %s", model, exc)
+        return None
+    _encoding_failed_at.pop(model, None)
+    _encodings[model] = encoding
+    return encoding
+
+
+def count_tokens(text: str, model: str = "") -> int:
+    if not text:
+        return 0
+    encoding = _encoding(model or "gpt-4o-mini")
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def token_budget_for(model: str) -> int:
+    return MODEL_SOURCE_TOKEN_BUDGETS.get(model, DEFAULT_SOURCE_TOKEN_BUDGET)
+
+
+def _informativeness(paragraph: str, position: int) -> float:
+    score = 2.0 if _QUOTE_RE.search(paragraph) else 0.0
+    score += min(len(_FIGURE_RE.findall(paragraph)), 3)
+    # Earlier paragraphs carry more of the story's context.
+    score += 1.0 / (1 + position)
+    return score
+
+
+def _trim_to_sentences(text: str, budget: int, model: str) -> tuple[str, int]:
+    """Keep whole leading sentences of text that fit within budget."""
+    kept: list[str] = []
+    used = 0
+    for sentence in _SENTENCE_END_RE.split(text):
+        cost = count_tokens(sentence, model)
+        if used + cost > budget:
+            break
+        kept.append(sentence)
+        used += cost
+    return " ".join(kept), used
+
+
+def budget_excerpt(
+    paragraphs: Sequence[str],
+    model: str = "",
+    budget: Optional[int] = None,
+) -> SourceExcerpt:
+    """Select the lead plus the most informative paragraphs that fit the token budget."""
+    budget = budget if budget is not None else token_budget_for(model)
+    candidates = [p.strip() for p in paragraphs if p and p.strip()]
+    if not candidates:
+        return SourceExcerpt(text="", tokens=0, budget=budget, paragraphs_used=0, paragraphs_total=0)
+
+    costs = [count_tokens(p, model) for p in candidates]
+
+    # The lead is always kept; if it alone is over budget, cut it at a sentence boundary.
+    if costs[0] > budget:
+        lead, used = _trim_to_sentences(candidates[0], budget, model)
+        return SourceExcerpt(
+            text=lead,
+            tokens=used,
+            budget=budget,
+            paragraphs_used=1 if lead else 0,
+            paragraphs_total=len(candidates),
+        )
+
+    selected = {0}
+    used = costs[0]
+    ranked = sorted(
+        range(1, len(candidates)),
+        key=lambda i: _informativeness(candidates[i], i),
+        reverse=True,
+    )
+    for index in ranked:
+        if used + costs[index] <= budget:
+            selected.add(index)
+            used += costs[index]
+
+    ordered = [candidates[i] for i in sorted(selected)]
+    return SourceExcerpt(
+        text="\n\n".join(ordered),
+        tokens=used,
+        budget=budget,
+        paragraphs_used=len(ordered),
+        paragraphs_total=len(candidates),
+    )
@@ -0,0 +1,186 @@
+"""
+Standalone ingest worker.
+
+    python -m agents.worker          # poll the jobs table until stopped
+    python -m agents.worker --once   # run queued jobs, then exit
+
+Runs every pipeline job in its own process so BeautifulSoup parsing and
+CrewAI work never compete with API requests for the CPU. Published stories
+reach the public list once the API's 60 s list cache expires.
+
+The API imports this module to queue jobs, so it must stay light: pipeline
+modules (CrewAI, feedparser, bs4, duckduckgo_search) are imported only when
+a job of their kind actually runs.
+"""
+
+import argparse
+import importlib
+import logging
+import os
+import signal
+import threading
+from typing import Any, Callable, Optional
+
+from app.database import SessionLocal
+from . import jobs
+from .ingest_queue import worker_id
+
+logger = logging.getLogger(__name__)
+
+WORKER_POLL_SECS = float(os.getenv("WORKER_POLL_SECS", "5"))
+
+# "module:function", resolved on first use
+JOB_HANDLERS: dict[str, str] = {
+    "auto_publish": "agents.auto_publish:run_auto_publish",
+    "agent_pipeline": "agents.agent_pipeline:run_agent_pipeline",
+    "feed_poll": "agents.feed_poller:poll_feeds",
+    "refresh_images": "agents.auto_publish:refresh_automated_article_images",
+    "refresh_content": "agents.auto_publish:refresh_automated_article_content",
+}
+
+_stopping = threading.Event()
+
+
+def _load_handler(kind: str) -> Callable[..., dict[str, Any]]:
+    target = JOB_HANDLERS.get(kind)
+    if target is None:
+        raise ValueError(f"Unknown job kind: {kind}")
+    module_name, _, function_name = target.partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def _heartbeat(job_id: int, owner: str, done: threading.Event) -> None:
+    """Keep the job's lease alive while it runs."""
+    while not done.wait(jobs.JOB_LEASE_SECS / 3):
+        db = SessionLocal()
+        try:
+            if not jobs.renew_lease(db, job_id, owner):
+                logger.warning("[Worker] lost lease on job %s", job_id)
+                return
+        except Exception as exc:
+            db.rollback()
+            logger.warning("[Worker] heartbeat for job %s failed: %s", job_id, exc)
+        finally:
+            db.close()
+
+
+def _execute(job_id: int, kind: str, params: dict[str, Any], owner: str) -> None:
+    logger.info("[Worker] job %s (%s) started", job_id, kind)
+    done = threading.Event()
+    heartbeat = threading.Thread(target=_heartbeat, args=(job_id, owner, done), daemon=True)
+    heartbeat.start()
+    stats, error = None, None
+    with jobs.tracking(job_id) as progress:
+        try:
+            stats = _load_handler(kind)(**params)
+        except Exception as exc:
+            logger.exception("[Worker] job %s (%s) failed", job_id, kind)
+            error = str(exc) or exc.__class__.__name__
+        finally:
+            done.set()
+            heartbeat.join()
+
+    db = SessionLocal()
+    try:
+        jobs.finish_job(db, job_id, owner, stats=stats, error=error, progress=progress.as_dict())
+    finally:
+        db.close()
+    logger.info("[Worker] job %s (%s) finished: %s", job_id, kind, error or stats)
+
+
+def run_job(owner: str, job_id: Optional[int] = None) -> bool:
+    """
+    Claim and run one job: the given one, or the oldest queued. Returns False
+    when there was nothing to claim (e.g. another worker already has it).
+    """
+    db = SessionLocal()
+    try:
+        job = jobs.claim_job(db, owner, job_id)
+        if job is None:
+            return False
+        claimed_id, kind, params = job.id, job.kind, dict(job.params or {})
+    finally:
+        db.close()
+    _execute(claimed_id, kind, params, owner)
+    return True
+
+
+def run_job_in_background(job_id: int, on_finish: Optional[Callable[[], None]] = None) -> None:
+    """INGEST_MODE=inline: run a just-queued job on a daemon thread of this process."""
+
+    def target() -> None:
+        try:
+            if run_job(worker_id(), job_id) and on_finish is not None:
+                on_finish()
+        except Exception:
+            logger.exception("[Worker] inline job %s raised an unhandled exception", job_id)
+
+    threading.Thread(target=target, name=f"job-{job_id}", daemon=True).start()
+
+
+def submit_job(
+    kind: str,
+    params: Optional[dict[str, Any]] = None,
+    on_finish: Optional[Callable[[], None]] = None,
+) -> int:
+    """
+    Queue a job and return its id. With INGEST_MODE=worker the ingest worker
+    picks it up; otherwise it runs on a background thread of this process
+    and ``on_finish`` is called when it succeeds or fails.
+    """
+    job_id = jobs.enqueue_job(kind, params)
+    if jobs.INGEST_MODE != "worker":
+        run_job_in_background(job_id, on_finish)
+    return job_id
+
+
+def resume_orphaned_jobs(on_finish: Optional[Callable[[], None]] = None) -> int:
+    """
+    INGEST_MODE=inline: start background runs for jobs nobody is running,
+    e.g. those of an instance that died mid-run. The scheduler leader calls
+    this on every heartbeat; a job another thread already holds is simply
+    not claimed again. Returns how many were found.
+    """
+    db = SessionLocal()
+    try:
+        job_ids = jobs.claimable_job_ids(db)
+    finally:
+        db.close()
+    for job_id in job_ids:
+        logger.info("[Worker] resuming orphaned job %s", job_id)
+        run_job_in_background(job_id, on_finish)
+    return len(job_ids)
+
+
+def run_worker(once: bool = False) -> None:
+    owner = worker_id()
+    logger.info("[Worker] %s polling every %.0fs", owner, WORKER_POLL_SECS)
+    while not _stopping.is_set():
+        try:
+            ran = run_job(owner)
+        except Exception:
+            logger.exception("[Worker] could not poll the job queue")
+            ran = False
+        if not ran:
+            if once:
+                return
+            _stopping.wait(WORKER_POLL_SECS)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run queued ingest jobs.")
+    parser.add_argument("--once", action="store_true", help="exit once the queue is empty")
+    args = parser.parse_args()
+
+    def stop(signum, _frame):
+        # Finish the current job; its lease lets another worker resume it otherwise.
+        logger.info("[Worker] received signal %s, stopping after the current job", signum)
+        _stopping.set()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    run_worker(once=args.once)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ created, updated, deleted, or published via the admin router.
 import time
 from threading import Lock
 
+from . import metrics
+
 _lock = Lock()
 _store: dict[str, tuple[object, float]] = {}
 
@@ -21,12 +23,15 @@ def get(key: str):
     with _lock:
         entry = _store.get(key)
     if entry is None:
+        metrics.record_cache(hit=False)
         return None
     value, expires_at = entry
     if time.monotonic() > expires_at:
         with _lock:
             _store.pop(key, None)
+        metrics.record_cache(hit=False)
         return None
+    metrics.record_cache(hit=True)
     return value
 
 
@@ -40,3 +45,12 @@ def invalidate() -> None:
     """Flush the entire cache (called after any admin write)."""
     with _lock:
         _store.clear()
+
+
+def invalidate_prefix(prefix: str) -> int:
+    """Drop only the entries whose key starts with prefix; returns how many."""
+    with _lock:
+        keys = [key for key in _store if key.startswith(prefix)]
+        for key in keys:
+            del _store[key]
+    return len(keys)
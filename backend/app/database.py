@@ -1,11 +1,18 @@
 import logging
 import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, exc as sa_exc, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from dotenv import load_dotenv
 
+from . import metrics
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -15,22 +22,72 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
 
-connect_args = {}
-if "sslmode" not in DATABASE_URL:
-    connect_args["sslmode"] = "require"
-
-engine = create_engine(
-    DATABASE_URL,
-    # Larger pool to absorb burst image requests without exhaustion.
-    # A homepage loads 20-30 images; each image request needs one connection.
-    pool_size=15,
-    max_overflow=25,      # 40 total connections at peak
-    pool_timeout=10,      # fail fast — don't queue forever
-    pool_recycle=1800,
-    pool_pre_ping=True,
-    connect_args=connect_args,
-)
-logger.info("Database engine created (pool_size=15, max_overflow=25)")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "15"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "25"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+# Sync routes each hold a worker thread while they wait for a connection;
+# more threads than connections only moves the queue into the pool.
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", str(DB_POOL_SIZE + DB_MAX_OVERFLOW)))
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool that records how long each checkout waited for a free
+    connection and counts timeouts. Opening a new connection is timed on
+    its own, so slow connects don't read as pool contention.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._connecting = threading.local()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        self._connecting.seconds = 0.0
+        try:
+            connection = super()._do_get()
+        except sa_exc.TimeoutError:
+            metrics.POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        metrics.record_pool_wait(time.perf_counter() - started - self._connecting.seconds)
+        return connection
+
+    def _create_connection(self):
+        started = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            seconds = time.perf_counter() - started
+            metrics.record_pool_connect(seconds)
+            self._connecting.seconds = getattr(self._connecting, "seconds", 0.0) + seconds
+
+
+if DATABASE_URL.startswith("sqlite"):
+    # Local development and pipeline testing; SQLite has no server-side pool.
+    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    logger.info("Database engine created (sqlite)")
+else:
+    connect_args = {}
+    if "sslmode" not in DATABASE_URL:
+        connect_args["sslmode"] = "require"
+
+    engine = create_engine(
+        DATABASE_URL,
+        # Sized for burst image requests: a homepage loads 20-30 images and
+        # each image request needs one connection. Tune with the db_pool_*
+        # and threadpool_* series on /metrics.
+        poolclass=TimedQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,  # fail fast — don't queue forever
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        connect_args=connect_args,
+    )
+    logger.info(
+        "Database engine created (pool_size=%d, max_overflow=%d, threadpool=%d)",
+        DB_POOL_SIZE, DB_MAX_OVERFLOW, THREADPOOL_SIZE,
+    )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
@@ -58,3 +115,39 @@ def db_ping() -> bool:
     except Exception as exc:
         logger.warning("DB ping failed: %s", exc)
         return False
+
+
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+# None until verify_schema_revision() has run.
+schema_current: Optional[bool] = None
+
+
+def verify_schema_revision() -> bool:
+    """
+    Compare the database's Alembic revision with the newest migration.
+
+    Migrations run as a release step (``alembic upgrade head``), not at
+    import, so the API only checks the revision once, off the startup path,
+    and logs loudly when the schema is behind.
+    """
+    global schema_current
+    from alembic.config import Config
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    try:
+        head = ScriptDirectory.from_config(Config(str(ALEMBIC_INI))).get_current_head()
+        with engine.connect() as conn:
+            current = MigrationContext.configure(conn).get_current_revision()
+    except Exception as exc:
+        logger.warning("Schema revision check failed: %s", exc)
+        return False
+    schema_current = current == head
+    if schema_current:
+        logger.info("Database schema at revision %s", current)
+    else:
+        logger.error(
+            "Database schema at revision %s, expected %s; run `alembic upgrade head`", current, head
+        )
+    return schema_current
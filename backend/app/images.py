@@ -0,0 +1,103 @@
+"""
+Admin image upload handling: bounded streaming reads, content sniffing by
+magic bytes, and downscaling of oversized images with Pillow.
+
+Everything here is blocking and is called from sync route handlers, so it
+runs in FastAPI's threadpool rather than on the event loop.
+"""
+
+import io
+import logging
+import os
+from typing import BinaryIO, Optional
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_IMAGE_MAX_DIMENSION = int(os.getenv("UPLOAD_IMAGE_MAX_DIMENSION", "1600"))
+# A few hundred KB of PNG can declare a huge canvas; decoding it costs
+# width * height * 4 bytes, so uploads are refused above this many pixels.
+UPLOAD_IMAGE_MAX_PIXELS = int(os.getenv("UPLOAD_IMAGE_MAX_PIXELS", "25000000"))
+
+_CHUNK_SIZE = 64 * 1024
+
+_PIL_FORMATS = {"image/jpeg": "JPEG", "image/png": "PNG", "image/webp": "WEBP"}
+
+
+class ImageTooLarge(ValueError):
+    pass
+
+
+class InvalidImage(ValueError):
+    pass
+
+
+def read_limited(stream: BinaryIO, max_bytes: int) -> bytes:
+    """Read stream in chunks, giving up as soon as it exceeds max_bytes."""
+    buffer = io.BytesIO()
+    while True:
+        chunk = stream.read(_CHUNK_SIZE)
+        if not chunk:
+            return buffer.getvalue()
+        if buffer.tell() + len(chunk) > max_bytes:
+            raise ImageTooLarge(f"image exceeds {max_bytes} bytes")
+        buffer.write(chunk)
+
+
+def sniff_mimetype(data: bytes) -> Optional[str]:
+    """MIME type from the file's magic bytes, or None for anything but JPEG, PNG and WebP."""
+    if data.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def downscale(
+    data: bytes,
+    mimetype: str,
+    max_dimension: int = UPLOAD_IMAGE_MAX_DIMENSION,
+    max_pixels: int = UPLOAD_IMAGE_MAX_PIXELS,
+) -> bytes:
+    """
+    Shrink images whose longer side exceeds max_dimension, keeping the
+    format. Smaller images are returned unchanged, byte for byte.
+
+    Every image is fully decoded first: verify() only checks PNG chunk CRCs
+    and reads no JPEG scan data, so a truncated file would otherwise pass.
+    The declared size is checked against max_pixels before anything is
+    decoded, and large JPEGs are decoded at a reduced scale (draft mode).
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image.verify()
+        image = Image.open(io.BytesIO(data))
+        width, height = image.size
+        if width * height > max_pixels:
+            raise ImageTooLarge(f"image is {width}x{height} pixels, limit {max_pixels}")
+        if max(width, height) > max_dimension and image.format == "JPEG":
+            image.draft(image.mode, (max_dimension, max_dimension))
+        image.load()
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError) as exc:
+        raise InvalidImage(f"unreadable image: {exc}") from exc
+
+    if max(width, height) <= max_dimension:
+        return data
+
+    original_size = (width, height)
+    image = ImageOps.exif_transpose(image)
+    image.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+    image_format = _PIL_FORMATS[mimetype]
+    if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+
+    output = io.BytesIO()
+    image.save(output, format=image_format, quality=85, optimize=True)
+    logger.info(
+        "Downscaled upload from %sx%s to %sx%s (%d -> %d bytes)",
+        *original_size, *image.size, len(data), output.tell(),
+    )
+    return output.getvalue()
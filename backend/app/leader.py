@@ -0,0 +1,103 @@
+"""
+Lease-table leader election across API instances.
+
+Every instance runs the scheduler, but only the holder of a named lease
+dispatches scheduled jobs. The leader renews its lease periodically; if it
+dies, the lease expires after LEADER_LEASE_SECS and the next instance to
+renew takes over. Acquisition is a compare-and-set UPDATE (or the first
+INSERT), so it behaves the same on Postgres and SQLite and never pins a
+pooled connection the way a session-level advisory lock would.
+"""
+
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+
+from .database import SessionLocal
+from .models import SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+LEADER_LEASE_SECS = int(os.getenv("LEADER_LEASE_SECS", "60"))
+
+
+def try_acquire(name: str, holder: str, ttl: int = LEADER_LEASE_SECS) -> bool:
+    """Take or renew the lease; False while another holder's lease is live."""
+    now = datetime.now(timezone.utc)
+    expires_at = now + timedelta(seconds=ttl)
+    db = SessionLocal()
+    try:
+        updated = (
+            db.query(SchedulerLease)
+            .filter(
+                SchedulerLease.name == name,
+                or_(SchedulerLease.holder == holder, SchedulerLease.expires_at < now),
+            )
+            .update(
+                {SchedulerLease.holder: holder, SchedulerLease.expires_at: expires_at},
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        if updated:
+            return True
+        if db.get(SchedulerLease, name) is not None:
+            return False
+        db.add(SchedulerLease(name=name, holder=holder, expires_at=expires_at))
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another instance created the lease first.
+            db.rollback()
+            return False
+        return True
+    finally:
+        db.close()
+
+
+def release(name: str, holder: str) -> None:
+    """Give the lease up early so another instance can take over at once."""
+    db = SessionLocal()
+    try:
+        db.query(SchedulerLease).filter(
+            SchedulerLease.name == name, SchedulerLease.holder == holder
+        ).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+class LeaderElector:
+    """Tracks whether this process currently holds the ``name`` lease."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+
+    def renew(self) -> bool:
+        """Acquire or renew leadership. Returns True when this process is the leader."""
+        try:
+            leader = try_acquire(self.name, self.holder)
+        except Exception as exc:
+            # Without the database we cannot prove leadership; stand down.
+            logger.warning("[Leader] could not renew %s lease: %s", self.name, exc)
+            leader = False
+        if leader != self.is_leader:
+            logger.info("[Leader] %s %s leadership of %s", self.holder, "took" if leader else "lost", self.name)
+        self.is_leader = leader
+        return leader
+
+    def resign(self) -> None:
+        if not self.is_leader:
+            return
+        try:
+            release(self.name, self.holder)
+        except Exception as exc:
+            logger.warning("[Leader] could not release %s lease: %s", self.name, exc)
+        self.is_leader = False
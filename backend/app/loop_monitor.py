@@ -0,0 +1,64 @@
+"""
+Event-loop lag monitor.
+
+A background task sleeps for a fixed interval and measures how late it
+wakes up. Any lag beyond a few milliseconds means something ran on the
+event loop without yielding: sync DB calls inside an ``async def`` route,
+CPU-heavy parsing, blocking I/O. Stalls over LOOP_LAG_WARN_MS are logged so
+they can be traced back to the route or job that caused them.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+LOOP_LAG_WARN_MS = float(os.getenv("LOOP_LAG_WARN_MS", "100"))
+LOOP_MONITOR_INTERVAL_SECS = float(os.getenv("LOOP_MONITOR_INTERVAL_SECS", "0.5"))
+
+
+class LoopLagMonitor:
+    def __init__(self, interval: float = LOOP_MONITOR_INTERVAL_SECS, warn_ms: float = LOOP_LAG_WARN_MS):
+        self.interval = interval
+        self.warn_ms = warn_ms
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self.stalls = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run(), name="loop-lag-monitor")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "last_lag_ms": round(self.last_lag_ms, 1),
+            "max_lag_ms": round(self.max_lag_ms, 1),
+            "stalls": self.stalls,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag_ms = (time.perf_counter() - started - self.interval) * 1000
+            self.last_lag_ms = lag_ms
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+            if lag_ms > self.warn_ms:
+                self.stalls += 1
+                logger.warning("[LoopMonitor] event loop blocked for %.0f ms", lag_ms)
+
+
+monitor = LoopLagMonitor()
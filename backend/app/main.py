@@ -1,29 +1,39 @@
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
+from typing import Optional
 
-from fastapi import FastAPI
+from anyio import to_thread
+from fastapi import FastAPI, Header, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import PlainTextResponse
 
-from .database import engine, Base, db_ping
+from . import database, metrics
+from .database import db_ping, verify_schema_revision
+from .loop_monitor import monitor as loop_monitor
 from .routers import admin, news, contact
 from .scheduler import start_scheduler, stop_scheduler
 
 logger = logging.getLogger(__name__)
 
-try:
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database tables verified")
-except Exception as exc:
-    logger.error("Failed to create database tables: %s", exc)
+# When set, /metrics requires "Authorization: Bearer <METRICS_TOKEN>".
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Schema changes ship as Alembic migrations (fly.toml release_command);
+    # the revision check runs in the background so it never delays serving.
+    asyncio.get_running_loop().run_in_executor(None, verify_schema_revision)
+    # Sync routes run on anyio's default limiter; tie it to the pool size.
+    to_thread.current_default_thread_limiter().total_tokens = database.THREADPOOL_SIZE
+    loop_monitor.start()
     start_scheduler()
     yield
     stop_scheduler()
+    await loop_monitor.stop()
 
 
 app = FastAPI(title="AI News API", version="1.0.0", lifespan=lifespan)
@@ -45,8 +55,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+# Outermost, so the timings cover CORS and compression too.
+app.add_middleware(metrics.TimingMiddleware)
+metrics.instrument_engine(database.engine)
+
 app.include_router(admin.router)
 app.include_router(news.router)
 app.include_router(contact.router)
@@ -66,6 +81,27 @@ async def health():
     session pool — pool exhaustion during request bursts won't cause
     the health check to fail and trigger unnecessary machine restarts.
     """
-    import asyncio
     ok = await asyncio.get_event_loop().run_in_executor(None, db_ping)
-    return {"status": "running", "database": "connected" if ok else "unreachable"}
+    schema = {True: "current", False: "outdated", None: "unchecked"}[database.schema_current]
+    return {
+        "status": "running",
+        "database": "connected" if ok else "unreachable",
+        "schema": schema,
+        "event_loop": loop_monitor.stats(),
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics(authorization: Optional[str] = Header(None)):
+    """Per-route latency, DB time, query counts and cache hits in Prometheus text format."""
+    if METRICS_TOKEN and authorization != f"Bearer {METRICS_TOKEN}":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+    loop = loop_monitor.stats()
+    extra = metrics.sample(
+        "event_loop_lag_seconds", "gauge", "Most recent event-loop wake-up lag.", loop["last_lag_ms"] / 1000
+    )
+    extra += metrics.sample(
+        "event_loop_stalls_total", "counter", "Event-loop stalls longer than LOOP_LAG_WARN_MS.", loop["stalls"]
+    )
+    extra += metrics.saturation_lines(database.engine.pool, to_thread.current_default_thread_limiter())
+    return PlainTextResponse(metrics.render(extra), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,307 @@
+"""
+Request-level timing and Prometheus metrics.
+
+TimingMiddleware opens a RequestTiming for every HTTP request and keeps it
+in a contextvar. SQLAlchemy cursor events, the response cache and timed()
+blocks add to it from whichever thread does the work (FastAPI copies the
+request context into its threadpool). When the response starts the
+middleware adds a ``Server-Timing`` header; when it finishes the numbers
+are folded into process-wide per-route histograms and counters, which
+render() serves in the Prometheus text exposition format.
+
+Routes are labelled by their path template (``/news/{news_id}``), never the
+raw URL, so label cardinality stays bounded.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+from starlette.datastructures import MutableHeaders
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50)
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_STARTED_ATTR = "_request_timing_started"
+
+
+@dataclass
+class RequestTiming:
+    db_seconds: float = 0.0
+    db_queries: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    spans: dict[str, float] = field(default_factory=dict)
+
+    def server_timing(self, total_seconds: float) -> str:
+        entries = [f"app;dur={total_seconds * 1000:.1f}"]
+        if self.db_queries:
+            entries.append(f'db;dur={self.db_seconds * 1000:.1f};desc="{self.db_queries} queries"')
+        if self.cache_hits or self.cache_misses:
+            entries.append(f'cache;desc="{"miss" if self.cache_misses else "hit"}"')
+        for name, seconds in self.spans.items():
+            entries.append(f"{name};dur={seconds * 1000:.1f}")
+        return ", ".join(entries)
+
+
+_current: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = Lock()
+
+    def inc(self, labels: tuple[str, ...] = (), amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = self._values if self._values or self.labelnames else {(): 0.0}
+            for labels, value in sorted(values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {value:g}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # labels -> (per-bucket counts, sum, count)
+        self._values: dict[tuple[str, ...], tuple[list[int], float, int]] = {}
+        self._lock = Lock()
+
+    def observe(self, labels: tuple[str, ...], value: float) -> None:
+        with self._lock:
+            counts, total, count = self._values.get(labels) or ([0] * len(self.buckets), 0.0, 0)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[labels] = (counts, total + value, count + 1)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        bucket_names = self.labelnames + ("le",)
+        with self._lock:
+            for labels, (counts, total, count) in sorted(self._values.items()):
+                for bound, bucket_count in zip(self.buckets, counts):
+                    le = _format_labels(bucket_names, labels + (f"{bound:g}",))
+                    lines.append(f"{self.name}_bucket{le} {bucket_count}")
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_names, labels + ('+Inf',))} {count}")
+                lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {total:.6f}")
+                lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time from request start until the response is fully sent.",
+    ("method", "route", "status"),
+)
+REQUEST_DB_DURATION = Histogram(
+    "http_request_db_seconds",
+    "Database time spent per request.",
+    ("method", "route"),
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Database queries executed per request.",
+    ("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+CACHE_LOOKUPS = Counter(
+    "news_cache_lookups_total",
+    "Response cache lookups by result.",
+    ("route", "result"),
+)
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time checkouts spent waiting for a free pooled database connection, excluding connecting.",
+    buckets=POOL_WAIT_BUCKETS,
+)
+POOL_CONNECT = Histogram(
+    "db_pool_connect_seconds",
+    "Time spent opening new database connections for the pool.",
+    buckets=POOL_WAIT_BUCKETS,
+)
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after the pool timeout.",
+)
+
+_REGISTRY = [
+    REQUEST_DURATION,
+    REQUEST_DB_DURATION,
+    REQUEST_DB_QUERIES,
+    CACHE_LOOKUPS,
+    POOL_CHECKOUT_WAIT,
+    POOL_CONNECT,
+    POOL_CHECKOUT_TIMEOUTS,
+]
+
+
+def sample(name: str, kind: str, help_text: str, value: float) -> list[str]:
+    """A single unlabelled gauge or counter, for values read at scrape time."""
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {value:g}"]
+
+
+def saturation_lines(pool, limiter) -> list[str]:
+    """
+    Connection pool and worker threadpool occupancy at scrape time. Call it
+    from the event loop: the anyio limiter is not thread-safe to inspect.
+    """
+    lines: list[str] = []
+    if isinstance(pool, QueuePool):
+        lines += sample("db_pool_size", "gauge", "Persistent connections the pool keeps.", pool.size())
+        lines += sample("db_pool_checked_out", "gauge", "Connections currently in use.", pool.checkedout())
+        lines += sample(
+            "db_pool_overflow", "gauge", "Overflow connections open beyond db_pool_size.", max(pool.overflow(), 0)
+        )
+    statistics = limiter.statistics()
+    lines += sample("threadpool_size", "gauge", "Worker threads available to sync routes.", limiter.total_tokens)
+    lines += sample("threadpool_busy", "gauge", "Worker threads currently running a route.", statistics.borrowed_tokens)
+    lines += sample(
+        "threadpool_queue_depth", "gauge", "Sync route calls waiting for a worker thread.", statistics.tasks_waiting
+    )
+    return lines
+
+
+def record_cache(hit: bool) -> None:
+    timing = _current.get()
+    if timing is None:
+        return
+    if hit:
+        timing.cache_hits += 1
+    else:
+        timing.cache_misses += 1
+
+
+def record_pool_wait(seconds: float) -> None:
+    POOL_CHECKOUT_WAIT.observe((), seconds)
+    timing = _current.get()
+    if timing is not None:
+        timing.spans["pool"] = timing.spans.get("pool", 0.0) + seconds
+
+
+def record_pool_connect(seconds: float) -> None:
+    POOL_CONNECT.observe((), seconds)
+    timing = _current.get()
+    if timing is not None:
+        timing.spans["connect"] = timing.spans.get("connect", 0.0) + seconds
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Time a block and report it as its own Server-Timing entry."""
+    timing = _current.get()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timing is not None:
+            timing.spans[name] = timing.spans.get(name, 0.0) + time.perf_counter() - started
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None and _current.get() is not None:
+        setattr(context, _STARTED_ATTR, time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    timing = _current.get()
+    started = getattr(context, _STARTED_ATTR, None)
+    if timing is None or started is None:
+        return
+    timing.db_seconds += time.perf_counter() - started
+    timing.db_queries += 1
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attribute every cursor execution on engine to the current request."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _route_label(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class TimingMiddleware:
+    """Pure ASGI middleware, so streaming responses and the contextvar pass through untouched."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming()
+        token = _current.set(timing)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timing.server_timing(time.perf_counter() - started))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            route = _route_label(scope)
+            method = scope["method"]
+            REQUEST_DURATION.observe((method, route, str(status_code)), time.perf_counter() - started)
+            REQUEST_DB_DURATION.observe((method, route), timing.db_seconds)
+            REQUEST_DB_QUERIES.observe((method, route), timing.db_queries)
+            if timing.cache_hits:
+                CACHE_LOOKUPS.inc((route, "hit"), timing.cache_hits)
+            if timing.cache_misses:
+                CACHE_LOOKUPS.inc((route, "miss"), timing.cache_misses)
+
+
+def render(extra: Optional[list[str]] = None) -> str:
+    """All metrics in the Prometheus text format; extra lines are appended verbatim."""
+    lines: list[str] = []
+    for metric in _REGISTRY:
+        lines.extend(metric.render())
+    lines.extend(extra or [])
+    return "\n".join(lines) + "\n"
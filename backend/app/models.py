@@ -1,9 +1,10 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, JSON, LargeBinary
+from sqlalchemy import Column, Integer, BigInteger, String, Text, Boolean, DateTime, JSON, LargeBinary, UniqueConstraint, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import validates, Session
 from .database import Base
 from typing import List, Optional, Dict, Any
+import json
 import re
 import unicodedata
 
@@ -53,11 +54,40 @@ def generate_slug(title: str, db_session: Optional[Session] = None, model_class=
     return slug
 
 
+def normalize_tags(tags: Any) -> List[str]:
+    """
+    Canonical tag list stored on every write: stripped, non-empty, unique
+    strings in their original order.
+
+    Accepts a list, a JSON array string or a comma-separated string (as the
+    admin form sends them); anything else becomes an empty list. Rows are
+    stored this way, so read paths use the column value as-is.
+    """
+    if isinstance(tags, str):
+        text = tags.strip()
+        if text.startswith('['):
+            try:
+                tags = json.loads(text)
+            except ValueError:
+                tags = text.strip('[]').split(',')
+        else:
+            tags = text.split(',')
+    if not isinstance(tags, (list, tuple)):
+        return []
+    normalized: List[str] = []
+    for tag in tags:
+        tag = str(tag).strip() if tag is not None else ''
+        if tag and tag not in normalized:
+            normalized.append(tag)
+    return normalized
+
+
 class News(Base):
     """
     News model representing articles in the database.
     """
     __tablename__ = "news"
+    __table_args__ = (Index("ix_news_published_created_at", "published", "created_at"),)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False, index=True)
@@ -69,7 +99,7 @@ class News(Base):
     image_filename = Column(String(255), nullable=True)  # Store original filename
     image_mimetype = Column(String(100), nullable=True)  # Store MIME type (image/jpeg, etc.)
     published = Column(Boolean, default=False, index=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
     author_id = Column(Integer, nullable=True)  # Reference to user who created the news
     slug = Column(String(300), unique=True, nullable=True)  # URL-friendly version of title
@@ -85,26 +115,8 @@ class News(Base):
 
     @validates('tags')
     def validate_tags(self, key, tags):
-        """Ensure tags is always a list"""
-        if tags is None:
-            return []
-        if isinstance(tags, str):
-            # If it's a string, convert to list
-            return [tags.strip()] if tags.strip() else []
-        if isinstance(tags, list):
-            return tags
-        return []
-
-    def _get_tags(self):
-        """Property to ensure tags is always returned as a list"""
-        tags_value = object.__getattribute__(self, '_sa_instance_state').dict.get('tags')
-        if tags_value is None:
-            return []
-        if isinstance(tags_value, str):
-            return [tags_value.strip()] if tags_value.strip() else []
-        if isinstance(tags_value, list):
-            return tags_value
-        return []
+        """Normalize tags on write (admin and both agents assign through here)"""
+        return normalize_tags(tags)
 
     def generate_slug_from_title(self, db_session: Optional[Session] = None):
         """Generate and set slug from title if slug is not already set"""
@@ -113,13 +125,6 @@ class News(Base):
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert model instance to dictionary"""
-        # Ensure tags is always a list
-        tags_value = self.tags
-        if isinstance(tags_value, str):
-            tags_value = [tags_value.strip()] if tags_value.strip() else []
-        elif tags_value is None:
-            tags_value = []
-
         # Generate image URL if image data exists
         image_url = None
         if self.image_data:
@@ -132,7 +137,7 @@ class News(Base):
             'title': self.title,
             'summary': self.summary,
             'content': self.content,
-            'tags': tags_value,
+            'tags': self.tags,
             'image_url': image_url,
             'published': self.published,
             'created_at': self.created_at.isoformat() if self.created_at else None,
@@ -170,7 +175,7 @@ class Contact(Base):
     email = Column(String(255), nullable=False)
     subject = Column(String(500), nullable=False)
     message = Column(Text, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     read = Column(Boolean, default=False, index=True)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -187,3 +192,145 @@ class Contact(Base):
 
     def __repr__(self) -> str:
         return f"<Contact(id={self.id}, name='{self.name}', email='{self.email}')>"
+
+
+class DraftCache(Base):
+    """
+    Memoized LLM story drafts, keyed by a hash of the model, prompt template
+    version, source URL and the source excerpt sent to the model.
+    """
+    __tablename__ = "draft_cache"
+
+    key = Column(String(64), primary_key=True)  # sha256 hex digest
+    model = Column(String(100), nullable=False)
+    title = Column(String(255), nullable=False)
+    summary = Column(String(500), nullable=False)
+    content = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+    def __repr__(self) -> str:
+        return f"<DraftCache(key='{self.key[:12]}...', model='{self.model}')>"
+
+
+class StoryFingerprint(Base):
+    """
+    Normalized source-title words of a published story, for cross-source
+    near-duplicate checks. Its MinHash LSH band keys live in
+    story_fingerprint_bands so candidates are found by indexed equality.
+    """
+    __tablename__ = "story_fingerprints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    news_id = Column(Integer, nullable=False, index=True)  # Reference to the published news row
+    source_url = Column(String(1000), nullable=True)
+    title_tokens = Column(Text, nullable=False)  # sorted normalized words, space-separated
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+    def __repr__(self) -> str:
+        return f"<StoryFingerprint(news_id={self.news_id}, title_tokens={self.title_tokens!r})>"
+
+
+class StoryFingerprintBand(Base):
+    """One LSH band key of a StoryFingerprint; the band index is hashed into the key."""
+    __tablename__ = "story_fingerprint_bands"
+
+    id = Column(Integer, primary_key=True, index=True)
+    fingerprint_id = Column(Integer, nullable=False, index=True)  # Reference to story_fingerprints
+    band_key = Column(BigInteger, nullable=False, index=True)
+
+
+class IngestItem(Base):
+    """
+    One source story moving through the staged ingest pipeline
+    (discovered → fetched → drafted → imaged → published). Workers claim a
+    row by taking a time-limited lease, so a restarted process resumes
+    where the previous one stopped and retries happen per item.
+    """
+    __tablename__ = "ingest_items"
+    __table_args__ = (
+        UniqueConstraint("pipeline", "source_key", name="uq_ingest_items_pipeline_source"),
+        Index("ix_ingest_items_pipeline_stage", "pipeline", "stage"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    pipeline = Column(String(32), nullable=False)  # auto_publish | agent
+    topic = Column(String(32), nullable=False)
+    stage = Column(String(16), nullable=False, index=True)
+    source_key = Column(String(64), nullable=False)  # sha256 of the canonical source URL
+    source_url = Column(String(1000), nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)  # Stage inputs/outputs (entry, article, draft, ...)
+    image_data = Column(LargeBinary, nullable=True)
+    image_filename = Column(String(255), nullable=True)
+    image_mimetype = Column(String(100), nullable=True)
+    news_id = Column(Integer, nullable=True, index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    lease_owner = Column(String(100), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True, index=True)  # Also "not before" for retries
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<IngestItem(id={self.id}, pipeline='{self.pipeline}', stage='{self.stage}')>"
+
+
+class Job(Base):
+    """
+    A background pipeline run (auto-publish, agent pipeline, refreshes)
+    queued by the API or scheduler and executed by the ingest worker process.
+    """
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(32), nullable=False, index=True)
+    status = Column(String(16), nullable=False, index=True)  # queued | running | succeeded | failed
+    params = Column(JSON, nullable=False, default=dict)
+    stats = Column(JSON, nullable=True)
+    progress = Column(JSON, nullable=True)  # Current stage, running stats and per-stage timings
+    error = Column(Text, nullable=True)
+    worker = Column(String(100), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)  # Renewed by the running worker's heartbeat
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<Job(id={self.id}, kind='{self.kind}', status='{self.status}')>"
+
+
+class SchedulerLease(Base):
+    """
+    Named time-limited lease used for leader election: only the instance
+    holding the "scheduler" lease dispatches scheduled jobs.
+    """
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String(100), primary_key=True)
+    holder = Column(String(100), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    acquired_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<SchedulerLease(name='{self.name}', holder='{self.holder}')>"
+
+
+class FeedState(Base):
+    """
+    Polling state of one RSS feed: its adaptive interval, conditional-GET
+    validators and failure backoff.
+    """
+    __tablename__ = "feed_states"
+
+    feed_url = Column(String(500), primary_key=True)
+    topic = Column(String(32), nullable=False)
+    interval_secs = Column(Integer, nullable=False)
+    next_poll_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    last_polled_at = Column(DateTime(timezone=True), nullable=True)
+    last_entry_at = Column(DateTime(timezone=True), nullable=True)  # Newest entry timestamp seen so far
+    etag = Column(String(255), nullable=True)
+    modified = Column(String(100), nullable=True)
+    consecutive_failures = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<FeedState(feed_url='{self.feed_url}', interval_secs={self.interval_secs})>"
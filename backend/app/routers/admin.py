@@ -1,19 +1,19 @@
 import logging
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File, Form
+from sqlalchemy import cast, delete, func, not_, or_, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
 
 from ..database import get_db
-from ..models import News, generate_slug
-from ..schemas import NewsResponse, Token
+from ..models import Job, News, generate_slug, normalize_tags
+from ..schemas import AdminNewsPage, JobResponse, NewsBulkRequest, NewsBulkResponse, NewsResponse, Token
 from ..auth import authenticate_admin, create_access_token, get_current_admin
 from .. import cache as news_cache
-from agents.auto_publish import (
-    refresh_automated_article_content,
-    refresh_automated_article_images,
-    run_auto_publish,
-)
-from agents.agent_pipeline import run_agent_pipeline
+from .. import images
+from .news import LIST_CACHE_PREFIX
+from agents.worker import submit_job
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 logger = logging.getLogger(__name__)
@@ -21,6 +21,27 @@ logger = logging.getLogger(__name__)
 ALLOWED_EXTENSIONS = {"jpg", "jpeg", "png", "webp"}
 MAX_IMAGE_SIZE = 10 * 1024 * 1024  # 10MB
 
+ADMIN_PAGE_SIZE_MAX = 100
+
+# Both ingest pipelines tag what they publish with "Automation".
+AUTOMATION_TAG = "Automation"
+
+# Admin list and detail columns. image_data (the blob) is never selected;
+# its presence is checked in SQL instead.
+_HAS_IMAGE = News.image_data.is_not(None).label("has_image")
+_SUMMARY_COLS = [
+    News.id,
+    News.title,
+    News.summary,
+    News.tags,
+    News.published,
+    News.created_at,
+    News.updated_at,
+    News.slug,
+    News._image_url_legacy.label("legacy_image_url"),
+    _HAS_IMAGE,
+]
+
 
 def validate_image(file: UploadFile) -> bool:
     if not file.filename:
@@ -31,19 +52,43 @@ def validate_image(file: UploadFile) -> bool:
     return True
 
 
-async def read_image_data(file: UploadFile) -> tuple[bytes, str, str]:
-    """Read image file and return binary data, filename, and mimetype"""
-    image_data = await file.read()
+def read_image_data(file: UploadFile) -> tuple[bytes, str, str]:
+    """
+    Read an uploaded image and return binary data, filename and mimetype.
 
-    # Check file size
-    if len(image_data) > MAX_IMAGE_SIZE:
+    Oversized uploads are rejected before (or while) reading, the type is
+    taken from the magic bytes rather than the client's Content-Type, and
+    large images are downscaled. Blocking: call it from a sync handler.
+    """
+    too_large = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Image size exceeds maximum allowed size of {MAX_IMAGE_SIZE / 1024 / 1024}MB"
+    )
+    if file.size is not None and file.size > MAX_IMAGE_SIZE:
+        raise too_large
+    try:
+        image_data = images.read_limited(file.file, MAX_IMAGE_SIZE)
+    except images.ImageTooLarge:
+        raise too_large
+
+    mimetype = images.sniff_mimetype(image_data[:16])
+    if mimetype is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Image size exceeds maximum allowed size of {MAX_IMAGE_SIZE / 1024 / 1024}MB"
+            detail="File content is not a jpg, png or webp image"
+        )
+    try:
+        image_data = images.downscale(image_data, mimetype)
+    except images.ImageTooLarge:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Image dimensions exceed {images.UPLOAD_IMAGE_MAX_PIXELS / 1_000_000:g} megapixels"
+        )
+    except images.InvalidImage:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Image file is corrupt or unreadable"
         )
-
-    # Determine mimetype
-    mimetype = file.content_type or "image/jpeg"
 
     return image_data, file.filename, mimetype
 
@@ -90,8 +135,10 @@ async def login(username: str = Form(...), password: str = Form(...)):
         )
 
 
+# Sync `def` — upload reading, image processing and the DB write all run
+# in the threadpool instead of blocking the event loop.
 @router.post("/news", response_model=NewsResponse)
-async def create_news(
+def create_news(
     title: str = Form(...),
     summary: str = Form(...),
     content: str = Form(...),
@@ -102,8 +149,6 @@ async def create_news(
     db: Session = Depends(get_db),
     current_admin: str = Depends(get_current_admin)
 ):
-    import json
-
     image_data = None
     image_filename = None
     image_mimetype = None
@@ -114,15 +159,10 @@ async def create_news(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid image type. Allowed: jpg, jpeg, png, webp"
             )
-        image_data, image_filename, image_mimetype = await read_image_data(image)
+        image_data, image_filename, image_mimetype = read_image_data(image)
 
-    # Parse tags - can be JSON array or comma-separated string
-    tags_list = None
-    if tags:
-        try:
-            tags_list = json.loads(tags) if tags.startswith('[') else [t.strip() for t in tags.split(',')]
-        except:
-            tags_list = [t.strip() for t in tags.split(',')]
+    # Tags can be a JSON array or a comma-separated string
+    tags_list = normalize_tags(tags)
 
     # Generate slug from title if not provided
     if not slug:
@@ -150,7 +190,7 @@ async def create_news(
 
 
 @router.put("/news/{news_id}", response_model=NewsResponse)
-async def update_news(
+def update_news(
     news_id: int,
     title: Optional[str] = Form(None),
     summary: Optional[str] = Form(None),
@@ -162,8 +202,6 @@ async def update_news(
     db: Session = Depends(get_db),
     current_admin: str = Depends(get_current_admin)
 ):
-    import json
-
     news = db.query(News).filter(News.id == news_id).first()
     if not news:
         raise HTTPException(status_code=404, detail="News not found")
@@ -177,12 +215,8 @@ async def update_news(
     if content is not None:
         news.content = content
     if tags is not None:
-        # Parse tags - can be JSON array or comma-separated string
-        try:
-            tags_list = json.loads(tags) if tags.startswith('[') else [t.strip() for t in tags.split(',')]
-        except:
-            tags_list = [t.strip() for t in tags.split(',')]
-        news.tags = tags_list
+        # Tags can be a JSON array or a comma-separated string
+        news.tags = normalize_tags(tags)
     if published is not None:
         news.published = published
 
@@ -211,7 +245,7 @@ async def update_news(
                 detail="Invalid image type. Allowed: jpg, jpeg, png, webp"
             )
         # Update image data in database
-        image_data, image_filename, image_mimetype = await read_image_data(image)
+        image_data, image_filename, image_mimetype = read_image_data(image)
         news.image_data = image_data
         news.image_filename = image_filename
         news.image_mimetype = image_mimetype
@@ -223,7 +257,7 @@ async def update_news(
 
 
 @router.delete("/news/{news_id}")
-async def delete_news(
+def delete_news(
     news_id: int,
     db: Session = Depends(get_db),
     current_admin: str = Depends(get_current_admin)
@@ -238,59 +272,183 @@ async def delete_news(
     return {"message": "News deleted successfully"}
 
 
-@router.get("/news", response_model=list[NewsResponse])
-async def get_all_news(
+def _has_tag(db: Session, tag: str):
+    """
+    Exact, case-sensitive match on one element of the tags JSON array.
+    Matching the serialized text instead would be case-insensitive (ilike),
+    treat % and _ as wildcards, and miss non-ASCII tags stored escaped.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return cast(News.tags, JSONB).contains([tag])
+    elements = func.json_each(News.tags).table_valued("value")
+    return select(elements.c.value).where(elements.c.value == tag).exists()
+
+
+def _image_url(row) -> Optional[str]:
+    return f"/news/image/{row.id}" if row.has_image else row.legacy_image_url
+
+
+# Sync `def` — the threadpool runs the blocking queries. Memory per
+# request is bounded by page_size: no content, no image blobs.
+@router.get("/news", response_model=AdminNewsPage)
+def get_all_news(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(25, ge=1, le=ADMIN_PAGE_SIZE_MAX),
+    published: Optional[bool] = Query(None),
+    tag: Optional[str] = Query(None),
+    automated: Optional[bool] = Query(None),
+    created_from: Optional[date] = Query(None, description="Inclusive, UTC"),
+    created_to: Optional[date] = Query(None, description="Inclusive, UTC"),
+    search: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_admin: str = Depends(get_current_admin)
+):
+    filters = []
+    if published is not None:
+        filters.append(News.published == published)
+    if tag:
+        filters.append(_has_tag(db, tag.strip()))
+    if automated is not None:
+        automation = _has_tag(db, AUTOMATION_TAG)
+        filters.append(automation if automated else not_(automation))
+    if created_from:
+        filters.append(News.created_at >= datetime.combine(created_from, time.min, timezone.utc))
+    if created_to:
+        filters.append(News.created_at < datetime.combine(created_to + timedelta(days=1), time.min, timezone.utc))
+    if search:
+        term = f"%{search}%"
+        filters.append(or_(News.title.ilike(term), News.summary.ilike(term)))
+
+    total = db.execute(select(func.count(News.id)).where(*filters)).scalar_one()
+    rows = db.execute(
+        select(*_SUMMARY_COLS)
+        .where(*filters)
+        .order_by(News.created_at.desc(), News.id.desc())
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    ).all()
+
+    items: list[dict[str, Any]] = [
+        {
+            "id": row.id,
+            "title": row.title,
+            "summary": row.summary,
+            "tags": row.tags or [],
+            "image_url": _image_url(row),
+            "published": bool(row.published),
+            "automated": AUTOMATION_TAG in (row.tags or []),
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+            "slug": row.slug,
+        }
+        for row in rows
+    ]
+    return {"items": items, "total": total, "page": page, "page_size": page_size}
+
+
+@router.get("/news/{news_id}", response_model=NewsResponse)
+def get_news_detail(
+    news_id: int,
     db: Session = Depends(get_db),
     current_admin: str = Depends(get_current_admin)
 ):
-    news = db.query(News).order_by(News.created_at.desc()).all()
+    """One article with its content (drafts included), still without the image blob."""
+    row = db.execute(
+        select(*_SUMMARY_COLS, News.content).where(News.id == news_id)
+    ).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="News not found")
+    return {
+        "id": row.id,
+        "title": row.title,
+        "summary": row.summary,
+        "content": row.content,
+        "tags": row.tags or [],
+        "image_url": _image_url(row),
+        "published": bool(row.published),
+        "created_at": row.created_at,
+        "slug": row.slug,
+    }
+
+
+@router.post("/news/bulk", response_model=NewsBulkResponse)
+def bulk_news(
+    request: NewsBulkRequest,
+    db: Session = Depends(get_db),
+    current_admin: str = Depends(get_current_admin)
+):
+    """
+    Publish, unpublish, delete or retag many articles at once: one set-based
+    statement in one transaction, then one invalidation of the cached public
+    lists. Ids that do not exist are ignored; ``affected`` counts the rest.
+    """
+    ids = sorted(set(request.ids))
+    if request.operation == "delete":
+        statement = delete(News).where(News.id.in_(ids))
+    else:
+        if request.operation == "retag":
+            # Bulk UPDATE skips the @validates hook; tags were normalized by the schema.
+            values = {News.tags: request.tags}
+        else:
+            values = {News.published: request.operation == "publish"}
+        statement = update(News).where(News.id.in_(ids)).values({**values, News.updated_at: func.now()})
+
+    affected = db.execute(statement.execution_options(synchronize_session=False)).rowcount
+    db.commit()
+    if affected:
+        news_cache.invalidate_prefix(LIST_CACHE_PREFIX)
+    logger.info("Bulk %s by %s: %d of %d articles", request.operation, current_admin, affected, len(ids))
+    return {"operation": request.operation, "requested": len(ids), "affected": affected}
 
-    # Ensure tags is always a list
-    for item in news:
-        if isinstance(item.tags, str):
-            item.tags = [item.tags.strip()] if item.tags.strip() else []
-        elif item.tags is None:
-            item.tags = []
 
-    return news
+def _queue_automation(kind: str) -> dict:
+    job_id = submit_job(kind, on_finish=news_cache.invalidate)
+    return {"message": "Job queued", "job_id": job_id, "status_url": f"/admin/jobs/{job_id}"}
+
 
+# Automation endpoints only queue a job and return at once; poll
+# GET /admin/jobs/{id} for progress and the final stats.
 
-@router.post("/automation/run")
-async def run_automation(
+@router.post("/automation/run", status_code=status.HTTP_202_ACCEPTED)
+def run_automation(
     current_admin: str = Depends(get_current_admin)
 ):
-    stats = run_auto_publish()
-    news_cache.invalidate()
-    return {"message": "Automation run completed", "created": stats}
+    return _queue_automation("auto_publish")
 
 
-@router.post("/automation/refresh-images")
-async def refresh_automation_images(
+@router.post("/automation/refresh-images", status_code=status.HTTP_202_ACCEPTED)
+def refresh_automation_images(
     current_admin: str = Depends(get_current_admin)
 ):
-    stats = refresh_automated_article_images()
-    news_cache.invalidate()
-    return {"message": "Automation images refreshed", "updated": stats}
+    return _queue_automation("refresh_images")
 
 
-@router.post("/automation/refresh-content")
-async def refresh_automation_content(
+@router.post("/automation/refresh-content", status_code=status.HTTP_202_ACCEPTED)
+def refresh_automation_content(
     current_admin: str = Depends(get_current_admin)
 ):
-    stats = refresh_automated_article_content()
-    news_cache.invalidate()
-    return {"message": "Automation content refreshed", "updated": stats}
+    return _queue_automation("refresh_content")
 
 
-@router.post("/automation/agent-run")
-async def run_agent_automation(
+@router.post("/automation/agent-run", status_code=status.HTTP_202_ACCEPTED)
+def run_agent_automation(
     current_admin: str = Depends(get_current_admin)
 ):
     """
-    Run the full agent pipeline:
+    Queue the full agent pipeline:
     DuckDuckGo news discovery → OpenAI content → DuckDuckGo image search → publish.
     No feeds or source names required — agents figure everything out dynamically.
     """
-    stats = run_agent_pipeline()
-    news_cache.invalidate()
-    return {"message": "Agent pipeline completed", "stats": stats}
+    return _queue_automation("agent_pipeline")
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+def get_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_admin: str = Depends(get_current_admin)
+):
+    job = db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
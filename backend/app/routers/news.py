@@ -1,16 +1,19 @@
-from typing import Optional
+from typing import Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import Response
-from sqlalchemy.orm import Session, load_only
-from sqlalchemy import or_, cast, Text
+from pydantic_core import to_json
+from sqlalchemy.orm import Session
+from sqlalchemy import or_, cast, select, Text
 
 from ..database import get_db
 from ..models import News
 from ..schemas import NewsResponse, NewsListResponse
-from .. import cache
+from .. import cache, metrics
 
 router = APIRouter(prefix="/news", tags=["news"])
 
+LIST_CACHE_PREFIX = "news_list:"
+
 # Columns for the list view — image_data (binary blob) is intentionally excluded.
 # Loading it for every article was the primary latency source.
 _LIST_COLS = [
@@ -20,11 +23,9 @@ _LIST_COLS = [
     News.tags,
     News.published,
     News.created_at,
-    News.updated_at,
     News.slug,
     News.image_filename,
     News._image_url_legacy,
-    News.image_mimetype,
 ]
 
 _IMAGE_HEADERS = {
@@ -41,38 +42,52 @@ def list_news(
     tag: Optional[str] = Query(None),
     db: Session = Depends(get_db),
 ):
-    cache_key = f"news_list:{search or ''}:{tag or ''}"
-    cached = cache.get(cache_key)
-    if cached is not None:
-        return cached
-
-    query = (
-        db.query(News)
-        .options(load_only(*_LIST_COLS))
-        .filter(News.published == True)  # noqa: E712
-    )
+    cache_key = f"{LIST_CACHE_PREFIX}{search or ''}:{tag or ''}"
+    body = cache.get(cache_key)
+    if body is None:
+        items = list_news_items(db, search, tag)
+        with metrics.timed("serialize"):
+            body = to_json(items)
+        cache.set(cache_key, body)
+    # Serialized once per cache fill; response_model only documents the shape.
+    return Response(content=body, media_type="application/json")
+
+
+def list_news_items(db: Session, search: Optional[str] = None, tag: Optional[str] = None) -> list[dict[str, Any]]:
+    """
+    Published articles as NewsListResponse-shaped dicts, newest first.
+
+    Selects plain row tuples rather than ORM instances, so rows skip the
+    identity map and per-row model validation.
+    """
+    query = select(*_LIST_COLS).where(News.published == True)  # noqa: E712
 
     if search:
         term = f"%{search}%"
-        query = query.filter(
+        query = query.where(
             or_(News.title.ilike(term), News.summary.ilike(term))
         )
 
     if tag:
         # tags is a JSON column — cast to text before ILIKE
-        query = query.filter(cast(News.tags, Text).ilike(f"%{tag}%"))
-
-    rows = query.order_by(News.created_at.desc()).all()
-
-    for item in rows:
-        if isinstance(item.tags, str):
-            item.tags = [item.tags.strip()] if item.tags.strip() else []
-        elif item.tags is None:
-            item.tags = []
-
-    result = [NewsListResponse.model_validate(item) for item in rows]
-    cache.set(cache_key, result)
-    return result
+        query = query.where(cast(News.tags, Text).ilike(f"%{tag}%"))
+
+    items = []
+    for id_, title, summary, tags, published, created_at, slug, image_filename, legacy_url in db.execute(
+        query.order_by(News.created_at.desc())
+    ):
+        items.append({
+            "id": id_,
+            "title": title,
+            "summary": summary,
+            "tags": tags,
+            # image_filename marks a stored image without loading the blob
+            "image_url": f"/news/image/{id_}" if image_filename else legacy_url,
+            "published": published,
+            "created_at": created_at,
+            "slug": slug,
+        })
+    return items
 
 
 # ── Image by ID ───────────────────────────────────────────────────
@@ -101,11 +116,6 @@ def get_news_by_slug(slug: str, db: Session = Depends(get_db)):
     if not news:
         raise HTTPException(status_code=404, detail="News not found")
 
-    if isinstance(news.tags, str):
-        news.tags = [news.tags.strip()] if news.tags.strip() else []
-    elif news.tags is None:
-        news.tags = []
-
     return news
 
 
@@ -133,9 +143,4 @@ def get_news(news_id: int, db: Session = Depends(get_db)):
     if not news:
         raise HTTPException(status_code=404, detail="News not found")
 
-    if isinstance(news.tags, str):
-        news.tags = [news.tags.strip()] if news.tags.strip() else []
-    elif news.tags is None:
-        news.tags = []
-
     return news
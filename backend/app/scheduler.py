@@ -1,13 +1,22 @@
 import asyncio
 import logging
 import os
+from datetime import datetime, timezone as dt_timezone
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
-from agents.auto_publish import run_auto_publish
-from agents.agent_pipeline import run_agent_pipeline
+from sqlalchemy import func
+
+# agents.jobs and agents.worker are light; the pipelines themselves are only
+# imported by the process that runs a job.
+from agents.jobs import INGEST_MODE
+from agents.worker import resume_orphaned_jobs, submit_job
 from . import cache as news_cache
+from .database import SessionLocal
+from .leader import LEADER_LEASE_SECS, LeaderElector
+from .models import FeedState
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +26,14 @@ _scheduler: AsyncIOScheduler | None = None
 # time), APScheduler will still run it within this window (seconds).
 _MISFIRE_GRACE_SECS = 3600  # 1 hour
 
+# "poll": check RSS feeds continuously on their adaptive intervals;
+# "daily": the original single 09:00 batch.
+AUTO_PUBLISH_SCHEDULE = os.getenv("AUTO_PUBLISH_SCHEDULE", "poll").strip().lower()
+FEED_POLL_TICK_SECS = int(os.getenv("FEED_POLL_TICK_SECS", "60"))
+
+# Every instance runs the scheduler; only the lease holder dispatches jobs.
+_leader = LeaderElector("scheduler")
+
 
 def _env_bool(name: str, default: bool) -> bool:
     value = os.getenv(name)
@@ -25,46 +42,85 @@ def _env_bool(name: str, default: bool) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
-# ── Blocking worker functions (run in thread pool, never block event loop) ──
+# ── Job dispatch (blocking DB write, run in the thread pool) ───────────────
 
-def _auto_publish_worker() -> None:
-    """Runs RSS auto-publish in a thread pool thread."""
+def _queue_job(kind: str, params: dict) -> None:
+    """
+    Queues a pipeline job. With INGEST_MODE=worker the ingest worker process
+    runs it; otherwise it runs on a background thread of this process.
+    """
     try:
-        logger.info("[Scheduler] auto-publish job started")
-        stats = run_auto_publish(
-            max_per_topic=int(os.getenv("AUTO_PUBLISH_MAX_PER_TOPIC", "5"))
-        )
-        news_cache.invalidate()
-        logger.info("[Scheduler] auto-publish completed: %s", stats)
+        job_id = submit_job(kind, params, on_finish=news_cache.invalidate)
+        logger.info("[Scheduler] %s queued as job %s", kind, job_id)
     except Exception:
-        logger.exception("[Scheduler] auto-publish job raised an unhandled exception")
+        logger.exception("[Scheduler] could not queue %s", kind)
+
+
+def _renew_leadership() -> bool:
+    """
+    Renews the scheduler lease. While this instance leads, every heartbeat
+    also resumes jobs nobody is running (inline mode; worker processes
+    recover their own jobs). Sweeping only on takeover is not enough: after
+    a deploy the old leader resigns at once, but its running job keeps a
+    live lease for up to JOB_LEASE_SECS, and a job stuck in ``running``
+    also blocks every later job of its kind from being queued.
+    """
+    leader = _leader.renew()
+    if leader and INGEST_MODE != "worker":
+        try:
+            resume_orphaned_jobs(on_finish=news_cache.invalidate)
+        except Exception:
+            logger.exception("[Scheduler] could not resume orphaned jobs")
+    return leader
 
 
-def _agent_pipeline_worker() -> None:
-    """Runs CrewAI agent pipeline in a thread pool thread."""
-    try:
-        logger.info("[Scheduler] agent pipeline job started")
-        stats = run_agent_pipeline(
-            max_per_topic=int(os.getenv("AGENT_PUBLISH_MAX_PER_TOPIC", "3"))
-        )
-        news_cache.invalidate()
-        logger.info("[Scheduler] agent pipeline completed: %s", stats)
-    except Exception:
-        logger.exception("[Scheduler] agent pipeline job raised an unhandled exception")
+# ── Async wrappers scheduled by APScheduler ────────────────────────────────
 
+async def _renew_leadership_job() -> None:
+    loop = asyncio.get_event_loop()
+    await loop.run_in_executor(None, _renew_leadership)
+
+
+async def _dispatch_if_leader(kind: str, params: dict) -> None:
+    """Queue the job off the event loop; the pipeline itself never runs on it."""
+    loop = asyncio.get_event_loop()
+    if not await loop.run_in_executor(None, _renew_leadership):
+        logger.info("[Scheduler] not the leader — skipping %s", kind)
+        return
+    await loop.run_in_executor(None, _queue_job, kind, params)
 
-# ── Async wrappers scheduled by APScheduler ────────────────────────────────
 
 async def _run_auto_publish_job() -> None:
-    """Offload blocking work to a thread so the event loop stays free."""
+    params = {"max_per_topic": int(os.getenv("AUTO_PUBLISH_MAX_PER_TOPIC", "5"))}
+    await _dispatch_if_leader("auto_publish", params)
+
+
+def _feeds_due() -> bool:
+    """True when some feed's next poll is due, or no feed has been polled yet."""
+    db = SessionLocal()
+    try:
+        due = db.query(func.min(FeedState.next_poll_at)).scalar()
+    finally:
+        db.close()
+    if due is None:
+        return True
+    if due.tzinfo is None:  # SQLite returns naive UTC
+        due = due.replace(tzinfo=dt_timezone.utc)
+    return due <= datetime.now(dt_timezone.utc)
+
+
+async def _run_feed_poll_job() -> None:
+    """Queue a poll only when some feed is due, so idle ticks cost one query."""
     loop = asyncio.get_event_loop()
-    await loop.run_in_executor(None, _auto_publish_worker)
+    if not await loop.run_in_executor(None, _feeds_due):
+        return
+    params = {"max_per_topic": int(os.getenv("AUTO_PUBLISH_MAX_PER_TOPIC", "5"))}
+    await _dispatch_if_leader("feed_poll", params)
 
 
 async def _run_agent_pipeline_job() -> None:
-    """Offload blocking work to a thread so the event loop stays free."""
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(None, _agent_pipeline_worker)
+    params = {"max_per_topic": int(os.getenv("AGENT_PUBLISH_MAX_PER_TOPIC", "3"))}
+    await _dispatch_if_leader("agent_pipeline", params)
 
 
 # ── Scheduler lifecycle ────────────────────────────────────────────────────
@@ -85,17 +141,39 @@ def start_scheduler() -> None:
 
     scheduler = AsyncIOScheduler(timezone=timezone)
 
-    # RSS auto-publish at 09:00 IST daily
+    # Leader election heartbeat; the first renewal runs immediately
     scheduler.add_job(
-        _run_auto_publish_job,
-        CronTrigger(hour=hour, minute=minute, timezone=timezone),
-        id="daily-auto-publish",
+        _renew_leadership_job,
+        IntervalTrigger(seconds=max(5, LEADER_LEASE_SECS // 3)),
+        id="leader-heartbeat",
         replace_existing=True,
         max_instances=1,
         coalesce=True,
-        misfire_grace_time=_MISFIRE_GRACE_SECS,
+        next_run_time=datetime.now().astimezone(),
     )
 
+    if AUTO_PUBLISH_SCHEDULE == "daily":
+        # RSS auto-publish at 09:00 IST daily
+        scheduler.add_job(
+            _run_auto_publish_job,
+            CronTrigger(hour=hour, minute=minute, timezone=timezone),
+            id="daily-auto-publish",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=_MISFIRE_GRACE_SECS,
+        )
+    else:
+        # RSS feeds polled on their own adaptive intervals, capped per day
+        scheduler.add_job(
+            _run_feed_poll_job,
+            IntervalTrigger(seconds=FEED_POLL_TICK_SECS),
+            id="feed-poll",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
+
     # Agent pipeline runs 30 minutes after the RSS job (09:30 IST)
     agent_minute = (minute + 30) % 60
     agent_hour = (hour + (minute + 30) // 60) % 24
@@ -111,16 +189,23 @@ def start_scheduler() -> None:
 
     scheduler.start()
     _scheduler = scheduler
+    rss_schedule = (
+        f"at {hour:02d}:{minute:02d} {timezone}"
+        if AUTO_PUBLISH_SCHEDULE == "daily"
+        else f"polled every {FEED_POLL_TICK_SECS}s"
+    )
     logger.info(
-        "[Scheduler] started — auto-publish at %02d:%02d %s, "
-        "agent pipeline at %02d:%02d %s",
-        hour, minute, timezone,
-        agent_hour, agent_minute, timezone,
+        "[Scheduler] started — auto-publish %s, "
+        "agent pipeline at %02d:%02d %s (%s mode)",
+        rss_schedule,
+        agent_hour, agent_minute, timezone, INGEST_MODE,
     )
 
     if _env_bool("AUTO_PUBLISH_RUN_ON_STARTUP", False):
         logger.info("[Scheduler] AUTO_PUBLISH_RUN_ON_STARTUP=true — queuing immediate run")
-        asyncio.ensure_future(_run_auto_publish_job())
+        asyncio.ensure_future(
+            _run_auto_publish_job() if AUTO_PUBLISH_SCHEDULE == "daily" else _run_feed_poll_job()
+        )
 
 
 def stop_scheduler() -> None:
@@ -128,3 +213,5 @@ def stop_scheduler() -> None:
     if _scheduler is not None:
         _scheduler.shutdown(wait=False)
         _scheduler = None
+        # Hand leadership over now instead of after the lease expires
+        _leader.resign()
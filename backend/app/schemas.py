@@ -1,6 +1,8 @@
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from datetime import datetime
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Literal
+
+from .models import normalize_tags
 
 
 class NewsBase(BaseModel):
@@ -10,22 +12,13 @@ class NewsBase(BaseModel):
     tags: Optional[List[str]] = None
     published: bool = False
 
+
+class NewsCreate(NewsBase):
     @field_validator('tags', mode='before')
     @classmethod
     def validate_tags(cls, v):
-        """Ensure tags is always a list"""
-        if v is None:
-            return []
-        if isinstance(v, str):
-            # If it's a string, convert to list
-            return [v.strip()] if v.strip() else []
-        if isinstance(v, list):
-            return v
-        return []
-
-
-class NewsCreate(NewsBase):
-    pass
+        """Normalize incoming tags the same way they are stored"""
+        return normalize_tags(v)
 
 
 class NewsUpdate(BaseModel):
@@ -38,14 +31,8 @@ class NewsUpdate(BaseModel):
     @field_validator('tags', mode='before')
     @classmethod
     def validate_tags(cls, v):
-        """Ensure tags is always a list"""
-        if v is None:
-            return []
-        if isinstance(v, str):
-            return [v.strip()] if v.strip() else []
-        if isinstance(v, list):
-            return v
-        return []
+        """Normalize incoming tags; None leaves them unchanged"""
+        return None if v is None else normalize_tags(v)
 
 
 class NewsResponse(NewsBase):
@@ -99,9 +86,9 @@ class NewsListResponse(BaseModel):
         """
         Compute image_url without touching image_data.
 
-        The list query uses load_only() to defer the image_data binary
-        blob (can be 50-300 KB per row). We detect image presence using
-        image_filename instead, which is always loaded.
+        The image_data binary blob (can be 50-300 KB per row) may be
+        deferred, so image presence is detected from image_filename.
+        The public list builds these dicts itself (routers/news.py).
         """
         if isinstance(data, dict):
             return data
@@ -123,20 +110,53 @@ class NewsListResponse(BaseModel):
             return result
         return data
 
+    class Config:
+        from_attributes = True
+
+
+class AdminNewsSummary(BaseModel):
+    """Admin list row: everything but the content and image blob."""
+    id: int
+    title: str
+    summary: str
+    tags: List[str] = []
+    image_url: Optional[str] = None
+    published: bool
+    automated: bool
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    slug: Optional[str] = None
+
+
+class AdminNewsPage(BaseModel):
+    items: List[AdminNewsSummary]
+    total: int
+    page: int
+    page_size: int
+
+
+class NewsBulkRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=1000)
+    operation: Literal["publish", "unpublish", "delete", "retag"]
+    tags: Optional[List[str]] = None  # Replacement tags for "retag"
+
     @field_validator('tags', mode='before')
     @classmethod
     def validate_tags(cls, v):
-        """Ensure tags is always a list"""
-        if v is None:
-            return []
-        if isinstance(v, str):
-            return [v.strip()] if v.strip() else []
-        if isinstance(v, list):
-            return v
-        return []
+        """Normalize incoming tags; None when not retagging"""
+        return None if v is None else normalize_tags(v)
+
+    @model_validator(mode='after')
+    def require_tags_for_retag(self):
+        if self.operation == "retag" and self.tags is None:
+            raise ValueError("tags is required for the retag operation")
+        return self
 
-    class Config:
-        from_attributes = True
+
+class NewsBulkResponse(BaseModel):
+    operation: str
+    requested: int
+    affected: int
 
 
 class Token(BaseModel):
@@ -171,3 +191,19 @@ class ContactResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class JobResponse(BaseModel):
+    id: int
+    kind: str
+    status: str
+    params: Dict[str, Any] = {}
+    progress: Optional[Dict[str, Any]] = None
+    stats: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for per-article CrewAI construction overhead.
+
+Compares building the LLM client, agents, tools, task and crew from
+scratch for every article (the old per-crew behaviour) against one
+ArticleCrewFactory reused across articles, which only creates the
+per-article Task and Crew. No LLM calls are made.
+
+Run from the backend directory:
+    python -m benchmarks.crew_construction --articles 50
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///benchmark.db")
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from agents.agent_pipeline import ArticleCrewFactory, DiscoveredNews  # noqa: E402
+
+
+def _items(count: int) -> list[DiscoveredNews]:
+    return [
+        DiscoveredNews(
+            title=f"Benchmark headline {i}",
+            url=f"https://example.com/story-{i}",
+            body="Snippet text for the benchmark article.",
+            source="Example",
+            topic="ai",
+            tags=["AI", "Automation"],
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=50)
+    args = parser.parse_args()
+    items = _items(args.articles)
+
+    started = time.perf_counter()
+    for item in items:
+        ArticleCrewFactory().build_writer(item)
+    per_article_secs = time.perf_counter() - started
+
+    started = time.perf_counter()
+    factory = ArticleCrewFactory()
+    for item in items:
+        factory.build_writer(item)
+    reused_secs = time.perf_counter() - started
+
+    print("=" * 60)
+    print(f"Articles: {args.articles}")
+    print(f"Rebuilt per article: {per_article_secs * 1000 / args.articles:8.2f} ms/article")
+    print(f"Reused factory:      {reused_secs * 1000 / args.articles:8.2f} ms/article")
+    print(f"Speedup:             {per_article_secs / reused_secs:8.2f}x")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Event-loop blocking check for every API route.
+
+Runs the app in-process on an asyncio loop in debug mode, where asyncio
+logs any callback that holds the loop longer than ``slow_callback_duration``.
+Each route is called on its own so a slow callback can be pinned to it;
+then admin writes run alongside public list reads to show whether admin
+activity leaks into public latency. Uses a throwaway SQLite database and
+skips authentication.
+
+Run from the backend directory:
+    python -m benchmarks.event_loop_blocking
+    python -m benchmarks.event_loop_blocking --threshold-ms 20 --rounds 50
+
+Exits non-zero when any route blocks the loop past the threshold.
+"""
+
+import argparse
+import asyncio
+import io
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_DB_PATH = Path(tempfile.gettempdir()) / "event_loop_benchmark.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_PATH}"
+os.environ["AUTO_PUBLISH_ENABLED"] = "false"
+os.environ["INGEST_MODE"] = "worker"  # queue automation jobs without running them
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+from PIL import Image  # noqa: E402
+
+from app.auth import get_current_admin  # noqa: E402
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Contact, News  # noqa: E402
+
+
+class _SlowCallbacks(logging.Handler):
+    """Collects asyncio's "Executing <Handle ...> took N seconds" debug warnings."""
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.records: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        message = record.getMessage()
+        if message.startswith("Executing"):
+            self.records.append(message)
+
+
+def _seed(rows: int) -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        for i in range(rows):
+            db.add(News(
+                title=f"Benchmark story {i}",
+                summary="Summary " * 10,
+                content="Paragraph. " * 200,
+                tags=["AI", "Automation"] if i % 2 else ["Cricket"],
+                published=True,
+                slug=f"benchmark-story-{i}",
+                image_data=b"\xff\xd8\xff" + b"0" * 1024,
+                image_filename="image.jpg",
+                image_mimetype="image/jpeg",
+            ))
+        db.add(Contact(name="n", email="e@example.com", subject="s", message="m"))
+        db.commit()
+    finally:
+        db.close()
+
+
+def _upload() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (2400, 1600), (30, 90, 160)).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+def _requests(image: bytes) -> list[tuple[str, str, dict]]:
+    form = {"title": "Harness article", "summary": "s", "content": "c", "tags": "AI, Harness"}
+    return [
+        ("GET", "/", {}),
+        ("GET", "/health", {}),
+        ("GET", "/news", {}),
+        ("GET", "/news?search=story&tag=AI", {}),
+        ("GET", "/news/1", {}),
+        ("GET", "/news/by-slug/benchmark-story-1", {}),
+        ("GET", "/news/image/1", {}),
+        ("GET", "/news/image/by-slug/benchmark-story-1", {}),
+        ("POST", "/contact/", {"json": {"name": "n", "email": "e@example.com", "subject": "s", "message": "m"}}),
+        ("GET", "/contact/", {}),
+        ("POST", "/admin/login", {"data": {"username": "x", "password": "y"}}),
+        ("GET", "/admin/news?automated=true&page_size=100", {}),
+        ("GET", "/admin/news/1", {}),
+        ("POST", "/admin/news", {"data": form, "files": {"image": ("upload.jpg", image, "image/jpeg")}}),
+        ("PUT", "/admin/news/2", {"data": {"summary": "updated"}, "files": {"image": ("upload.jpg", image, "image/jpeg")}}),
+        ("POST", "/admin/news/bulk", {"json": {"ids": list(range(3, 40)), "operation": "unpublish"}}),
+        ("DELETE", "/admin/news/40", {}),
+        ("POST", "/admin/automation/run", {}),
+    ]
+
+
+async def _check_routes(client: httpx.AsyncClient, slow: _SlowCallbacks, image: bytes) -> dict[str, list[str]]:
+    blocked: dict[str, list[str]] = {}
+    for method, url, kwargs in _requests(image):
+        slow.records.clear()
+        response = await client.request(method, url, **kwargs)
+        await asyncio.sleep(0)  # let asyncio flush its debug warnings
+        status = "ok" if response.status_code < 500 else f"HTTP {response.status_code}"
+        verdict = f"BLOCKED ({len(slow.records)})" if slow.records else "ok"
+        print(f"  {method:6s} {url:45s} {status:8s} loop: {verdict}")
+        if slow.records:
+            blocked[f"{method} {url}"] = list(slow.records)
+    return blocked
+
+
+async def _public_latency(client: httpx.AsyncClient, rounds: int, with_admin: bool, image: bytes) -> list[float]:
+    latencies: list[float] = []
+
+    async def public() -> None:
+        for _ in range(rounds):
+            started = time.perf_counter()
+            await client.get("/news?search=story")  # distinct key per round is not needed: cache is per query
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    async def admin() -> None:
+        for i in range(rounds // 5 or 1):
+            await client.post(
+                "/admin/news",
+                data={"title": f"Concurrent {i}", "summary": "s", "content": "c"},
+                files={"image": ("upload.jpg", image, "image/jpeg")},
+            )
+            await client.get("/admin/news?page_size=100")
+
+    tasks = [public()] + ([admin()] if with_admin else [])
+    await asyncio.gather(*tasks)
+    return latencies
+
+
+async def _main(args: argparse.Namespace) -> int:
+    loop = asyncio.get_running_loop()
+    loop.set_debug(True)
+    loop.slow_callback_duration = args.threshold_ms / 1000
+    slow = _SlowCallbacks()
+    logging.getLogger("asyncio").addHandler(slow)
+    logging.getLogger("asyncio").setLevel(logging.WARNING)
+
+    app.dependency_overrides[get_current_admin] = lambda: "benchmark"
+    image = _upload()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        print(f"Per-route check (slow callback threshold {args.threshold_ms:.0f} ms):")
+        blocked = await _check_routes(client, slow, image)
+
+        print(f"\nPublic GET /news latency over {args.rounds} requests:")
+        for label, with_admin in (("alone", False), ("with admin writes", True)):
+            latencies = sorted(await _public_latency(client, args.rounds, with_admin, image))
+            p95 = latencies[int(len(latencies) * 0.95) - 1]
+            print(f"  {label:18s} p50 {statistics.median(latencies):6.1f} ms  p95 {p95:6.1f} ms  max {latencies[-1]:6.1f} ms")
+
+    _DB_PATH.unlink(missing_ok=True)
+    if blocked:
+        print("\nRoutes that blocked the event loop:")
+        for route, records in blocked.items():
+            print(f"  {route}")
+            for record in records[:3]:
+                print(f"    {record[:160]}")
+        return 1
+    print("\nNo route blocked the event loop.")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Detect API routes that block the event loop.")
+    parser.add_argument("--threshold-ms", type=float, default=50.0)
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--rows", type=int, default=200)
+    args = parser.parse_args()
+
+    _seed(args.rows)
+    sys.exit(asyncio.run(_main(args)))
+
+
+if __name__ == "__main__":
+    main()
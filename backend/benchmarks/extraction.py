@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Corpus benchmark for article HTML extraction.
+
+Compares the legacy extractor (one BeautifulSoup parse per helper, eleven
+CSS selector passes, list-based dedup) against the single-parse, single-walk
+extractor in agents.auto_publish, and checks that the meta description,
+lead image and the token-budgeted source excerpt the drafting prompt
+actually receives are unchanged for every page.
+
+Without arguments it runs on the small synthetic corpus checked in under
+benchmarks/fixtures/extraction (meta tags, nav and sidebar noise, live-blog
+duplicates, unclosed <p> tags, lazy images). Save real article pages for
+representative timings. Run from the backend directory:
+    python -m benchmarks.extraction
+    python -m benchmarks.extraction --save benchmarks/corpus URL [URL ...]
+    python -m benchmarks.extraction benchmarks/corpus
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from bs4 import BeautifulSoup
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///benchmark.db")
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from agents import auto_publish  # noqa: E402
+
+FIXTURE_CORPUS = Path(__file__).resolve().parent / "fixtures" / "extraction"
+
+
+# ── Legacy extractor (pre single-parse), kept verbatim for comparison ──────
+
+def _legacy_meta_description(article_html: str) -> str:
+    soup = BeautifulSoup(article_html, "html.parser")
+    for tag_name, attrs in [
+        ("meta", {"name": "description"}),
+        ("meta", {"property": "og:description"}),
+        ("meta", {"name": "twitter:description"}),
+    ]:
+        tag = soup.find(tag_name, attrs=attrs)
+        if tag and tag.get("content"):
+            cleaned = auto_publish._clean_text(tag["content"])
+            if cleaned:
+                return cleaned[:500]
+    return ""
+
+
+def _legacy_article_text(article_html: str) -> str:
+    soup = BeautifulSoup(article_html, "html.parser")
+    for tag in soup(["script", "style", "noscript", "svg", "header", "footer", "form", "aside"]):
+        tag.decompose()
+
+    # The selector passes stop at the candidate pool size the budgeter now
+    # chooses from; the old fixed character cut is no longer part of the output.
+    paragraph_candidates: list[str] = []
+    for selector in [
+        "article p", "main p", "[role='main'] p", ".article-content p",
+        ".story-body p", ".entry-content p", ".c-entry-content p",
+        ".post-content p", ".post-body p", ".content p", "p",
+    ]:
+        for node in soup.select(selector):
+            text = auto_publish._clean_text(node.get_text(" ", strip=True))
+            if not text or auto_publish._is_noise_paragraph(text):
+                continue
+            if text not in paragraph_candidates:
+                paragraph_candidates.append(text)
+        if len(paragraph_candidates) >= auto_publish.MAX_CANDIDATE_PARAGRAPHS:
+            break
+
+    article_text = "\n\n".join(paragraph_candidates[:auto_publish.MAX_CANDIDATE_PARAGRAPHS])
+    return auto_publish._source_excerpt(article_text).text
+
+
+def _legacy_image_url(article_html: str) -> Optional[str]:
+    soup = BeautifulSoup(article_html, "html.parser")
+    for tag_name, attrs in [
+        ("meta", {"property": "og:image"}),
+        ("meta", {"name": "twitter:image"}),
+        ("meta", {"property": "og:image:url"}),
+    ]:
+        tag = soup.find(tag_name, attrs=attrs)
+        if tag and tag.get("content"):
+            url = tag["content"].strip()
+            if url and not auto_publish._is_placeholder_image_url(url):
+                return url
+    for selector in [
+        "article img", "main img", ".article-content img", ".story-body img",
+        ".entry-content img", ".c-entry-content img", ".post-content img",
+    ]:
+        for img in soup.select(selector):
+            if auto_publish._is_likely_article_image(img):
+                src = img.get("src") or img.get("data-src") or ""
+                if src and src.startswith("http"):
+                    return src
+    return None
+
+
+def _legacy_extract(article_html: str) -> tuple[str, str, Optional[str]]:
+    return (
+        _legacy_meta_description(article_html),
+        _legacy_article_text(article_html),
+        _legacy_image_url(article_html),
+    )
+
+
+def _current_extract(article_html: str) -> tuple[str, str, Optional[str]]:
+    article = auto_publish._parse_article_html(article_html)
+    return (
+        auto_publish._extract_meta_description(article),
+        auto_publish._source_excerpt("\n\n".join(article.paragraphs)).text,
+        auto_publish._extract_image_url({}, article),
+    )
+
+
+# ── Commands ───────────────────────────────────────────────────────────────
+
+def save_corpus(corpus_dir: Path, urls: list[str]) -> None:
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    for url in urls:
+        try:
+            article_html, _ = auto_publish._fetch_article_html(url)
+        except Exception as exc:
+            print(f"[SKIP] {url}: {exc}")
+            continue
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16] + ".html"
+        (corpus_dir / name).write_text(article_html, encoding="utf-8")
+        print(f"[SAVED] {url} -> {name} ({len(article_html) / 1024:.0f} KB)")
+
+
+def _time(fn, pages: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for page in pages:
+            fn(page)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_benchmark(corpus_dir: Path, repeat: int) -> int:
+    files = sorted(corpus_dir.glob("*.html"))
+    if not files:
+        print(f"No .html pages found in {corpus_dir}; save some with --save first.")
+        return 1
+    pages = [f.read_text(encoding="utf-8", errors="replace") for f in files]
+    total_kb = sum(len(p) for p in pages) / 1024
+
+    mismatches = 0
+    for path, page in zip(files, pages):
+        legacy, current = _legacy_extract(page), _current_extract(page)
+        if legacy != current:
+            mismatches += 1
+            fields = [name for name, a, b in zip(("meta", "excerpt", "image"), legacy, current) if a != b]
+            print(f"[DIFF] {path.name}: {', '.join(fields)}")
+
+    legacy_secs = _time(_legacy_extract, pages, repeat)
+    current_secs = _time(_current_extract, pages, repeat)
+
+    print("=" * 60)
+    fallbacks = sum(auto_publish._parser_for(page) != auto_publish.HTML_PARSER for page in pages)
+    print(f"Pages: {len(pages)} ({total_kb:.0f} KB), parser: {auto_publish.HTML_PARSER}"
+          f" ({fallbacks} with unclosed <p> on html.parser)")
+    print(f"Legacy:  {legacy_secs * 1000 / len(pages):8.2f} ms/page")
+    print(f"Current: {current_secs * 1000 / len(pages):8.2f} ms/page")
+    print(f"Speedup: {legacy_secs / current_secs:8.2f}x")
+    print(f"Output mismatches: {mismatches}")
+    print("=" * 60)
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "corpus", type=Path, nargs="?", default=FIXTURE_CORPUS,
+        help="directory of saved .html article pages (default: the checked-in fixtures)",
+    )
+    parser.add_argument("urls", nargs="*", help="article URLs to download (with --save)")
+    parser.add_argument("--save", action="store_true", help="download URLs into the corpus directory")
+    parser.add_argument("--repeat", type=int, default=3, help="timing repetitions, best run is reported")
+    args = parser.parse_args()
+
+    if args.save:
+        save_corpus(args.corpus, args.urls)
+        return 0
+    return run_benchmark(args.corpus, args.repeat)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
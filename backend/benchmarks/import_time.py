@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for the API process.
+
+Imports ``app.main`` in a fresh interpreter under ``python -X importtime``
+and reports the total import time, peak RSS and the slowest top-level
+packages. The API must not load the agent/ingest stack (CrewAI,
+duckduckgo_search, feedparser, bs4, the pipeline modules): those belong
+to the worker, or to the first job that runs inline. The script exits
+non-zero when any of them is imported, or when the import takes longer
+than ``--budget-ms``.
+
+For ``app.main`` it then measures cold start in another fresh interpreter:
+import, lifespan startup and the first served request (``--path``, through
+Starlette's TestClient), plus the database statements run before that
+response. It fails when cold start exceeds ``--cold-start-budget-ms``.
+
+Run from the backend directory:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --module agents.worker --budget-ms 1500
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Modules the API process must never import at startup.
+FORBIDDEN = (
+    "crewai",
+    "duckduckgo_search",
+    "feedparser",
+    "bs4",
+    "lxml",
+    "agents.auto_publish",
+    "agents.agent_pipeline",
+    "agents.feed_poller",
+)
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+_CHILD = """
+import resource
+import {module}
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+_COLD_START_CHILD = """
+import json
+import time
+
+started = time.perf_counter()
+from sqlalchemy import event
+from app import database
+
+statements = []
+event.listen(database.engine, "before_cursor_execute", lambda *args: statements.append(time.perf_counter()))
+import {module} as target
+imported = time.perf_counter()
+
+from fastapi.testclient import TestClient
+
+client_ready = time.perf_counter()
+with TestClient(target.app) as client:
+    status = client.get({path!r}).status_code
+    served = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "first_request_ms": (served - client_ready) * 1000,
+    "status": status,
+    "statements": sum(1 for at in statements if at <= served),
+}}))
+"""
+
+
+def _child_env() -> dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", "sqlite:///benchmark.db")
+    env.setdefault("OPENAI_API_KEY", "sk-benchmark")
+    env.setdefault("AUTO_PUBLISH_ENABLED", "false")
+    return env
+
+
+def _run(module: str) -> tuple[list[tuple[int, int, str]], int]:
+    """Import ``module`` in a child interpreter; returns ``(self_us, cumulative_us, name)`` rows and peak RSS in KB."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD.format(module=module)],
+        cwd=BACKEND_DIR,
+        env=_child_env(),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise SystemExit(f"importing {module} failed")
+
+    imports = []
+    for line in result.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            imports.append((int(self_us), int(cumulative_us), name))
+    max_rss_kb = int(result.stdout.strip().splitlines()[-1])
+    return imports, max_rss_kb
+
+
+def _cold_start(module: str, path: str, repeat: int) -> dict:
+    """Best of ``repeat`` fresh interpreters: import, startup and first response for ``path``."""
+    runs = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", _COLD_START_CHILD.format(module=module, path=path)],
+            cwd=BACKEND_DIR,
+            env=_child_env(),
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            sys.stderr.write(result.stderr)
+            raise SystemExit(f"serving {path} from {module} failed")
+        runs.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    return min(runs, key=lambda run: run["import_ms"] + run["first_request_ms"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure import time of the API process.")
+    parser.add_argument("--module", default="app.main", help="module to import (default: app.main)")
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="fail above this import time")
+    parser.add_argument("--top", type=int, default=15, help="slowest packages to list")
+    parser.add_argument("--path", default="/", help="route requested for the cold-start timing (app.main only)")
+    parser.add_argument("--cold-start-budget-ms", type=float, default=2500.0, help="fail above this cold start")
+    parser.add_argument("--repeat", type=int, default=3, help="cold-start runs, best is reported")
+    args = parser.parse_args()
+
+    imports, max_rss_kb = _run(args.module)
+    total_ms = max(cumulative for _, cumulative, name in imports if name == args.module) / 1000
+    print(f"import {args.module}: {total_ms:.0f} ms, peak RSS {max_rss_kb / 1024:.0f} MB")
+
+    # Self time summed per top-level package, so nested imports are not counted twice.
+    per_package: dict[str, int] = {}
+    for self_us, _, name in imports:
+        package = name.split(".")[0]
+        per_package[package] = per_package.get(package, 0) + self_us
+    print("\nslowest packages (self time):")
+    for package, self_us in sorted(per_package.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {package}")
+
+    loaded = {name for _, _, name in imports}
+    forbidden = [
+        module for module in FORBIDDEN
+        if any(name == module or name.startswith(module + ".") for name in loaded)
+    ]
+    failed = False
+    if forbidden:
+        print(f"\nFAIL: {args.module} imports the agent stack: {', '.join(forbidden)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"\nFAIL: import took {total_ms:.0f} ms, budget {args.budget_ms:.0f} ms")
+        failed = True
+
+    if args.module == "app.main":
+        run = _cold_start(args.module, args.path, args.repeat)
+        cold_start_ms = run["import_ms"] + run["first_request_ms"]
+        print(
+            f"\ncold start: {cold_start_ms:.0f} ms to first response (import {run['import_ms']:.0f} ms,"
+            f" startup + GET {args.path} {run['first_request_ms']:.0f} ms, HTTP {run['status']}),"
+            f" {run['statements']} DB statements before it"
+        )
+        if cold_start_ms > args.cold_start_budget_ms:
+            print(f"\nFAIL: cold start took {cold_start_ms:.0f} ms, budget {args.cold_start_budget_ms:.0f} ms")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Per-row cost of the public news list at 10k rows.
+
+Compares the previous ORM path (load_only() instances in the identity map,
+in-place tag fixes, NewsListResponse.model_validate per row, then response
+model serialization) against the row-tuple projection in app.routers.news
+serialized once with pydantic_core.to_json. Both read the same rows from a
+throwaway SQLite database and must produce the same JSON.
+
+Run from the backend directory:
+    python -m benchmarks.news_list --rows 10000
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+_DB_PATH = Path(tempfile.gettempdir()) / "news_list_benchmark.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_PATH}"
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from pydantic import TypeAdapter  # noqa: E402
+from pydantic_core import to_json  # noqa: E402
+from sqlalchemy.orm import load_only  # noqa: E402
+
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.models import News  # noqa: E402
+from app.routers.news import list_news_items  # noqa: E402
+from app.schemas import NewsListResponse  # noqa: E402
+
+_LEGACY_COLS = [
+    News.id, News.title, News.summary, News.tags, News.published, News.created_at,
+    News.updated_at, News.slug, News.image_filename, News._image_url_legacy, News.image_mimetype,
+]
+_LIST_ADAPTER = TypeAdapter(list[NewsListResponse])
+
+
+def _seed(rows: int) -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    now = datetime.now(timezone.utc)
+    db = SessionLocal()
+    try:
+        db.bulk_insert_mappings(News, [
+            {
+                "title": f"Benchmark headline {i}",
+                "summary": "A short summary of the benchmark story. " * 3,
+                "content": "Body paragraph. " * 50,
+                # Canonical lists, as normalize_tags and migration 0003 leave every row.
+                "tags": ["ai", "research"] if i % 3 else ["cricket"],
+                "image_filename": f"image-{i}.jpg" if i % 2 else None,
+                "_image_url_legacy": None if i % 2 else f"https://example.com/{i}.jpg",
+                "published": True,
+                "created_at": now - timedelta(minutes=i),
+                "slug": f"benchmark-headline-{i}",
+            }
+            for i in range(rows)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def _legacy_list() -> bytes:
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(News)
+            .options(load_only(*_LEGACY_COLS))
+            .filter(News.published == True)  # noqa: E712
+            .order_by(News.created_at.desc())
+            .all()
+        )
+        for item in rows:
+            if isinstance(item.tags, str):
+                item.tags = [item.tags.strip()] if item.tags.strip() else []
+            elif item.tags is None:
+                item.tags = []
+        result = [NewsListResponse.model_validate(item) for item in rows]
+        return _LIST_ADAPTER.dump_json(result)
+    finally:
+        db.close()
+
+
+def _projected_list() -> bytes:
+    db = SessionLocal()
+    try:
+        return to_json(list_news_items(db))
+    finally:
+        db.close()
+
+
+def _best_of(func, repeat: int) -> tuple[float, bytes]:
+    best, body = float("inf"), b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = func()
+        best = min(best, time.perf_counter() - start)
+    return best, body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the public news list query.")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    _seed(args.rows)
+    legacy_time, legacy_body = _best_of(_legacy_list, args.repeat)
+    projected_time, projected_body = _best_of(_projected_list, args.repeat)
+
+    if json.loads(legacy_body) != json.loads(projected_body):
+        raise SystemExit("Projected list differs from the ORM list")
+
+    print(f"{args.rows} rows, best of {args.repeat}:")
+    for label, seconds in (("ORM + model_validate", legacy_time), ("row tuples + to_json", projected_time)):
+        print(f"  {label:22s} {seconds * 1000:8.1f} ms  {seconds / args.rows * 1e6:6.1f} µs/row")
+    print(f"  speedup {legacy_time / projected_time:.1f}x")
+    _DB_PATH.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    main()
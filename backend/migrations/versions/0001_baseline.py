@@ -0,0 +1,146 @@
+"""Baseline schema
+
+The tables as Base.metadata.create_all() used to create them at API
+startup. Existing databases already have some or all of them, so every
+table is created only when missing; stamping is not needed.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _create_table(name: str, *columns, indexes=()) -> None:
+    """Create ``name`` with its single-column indexes unless it already exists."""
+    if sa.inspect(op.get_bind()).has_table(name):
+        return
+    op.create_table(name, *columns)
+    for column in indexes:
+        op.create_index(f"ix_{name}_{column}", name, [column])
+
+
+def upgrade() -> None:
+    _create_table(
+        "news",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("summary", sa.String(500), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("tags", sa.JSON(), nullable=True),
+        sa.Column("image_url", sa.String(500), nullable=True),
+        sa.Column("image_data", sa.LargeBinary(), nullable=True),
+        sa.Column("image_filename", sa.String(255), nullable=True),
+        sa.Column("image_mimetype", sa.String(100), nullable=True),
+        sa.Column("published", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("author_id", sa.Integer(), nullable=True),
+        sa.Column("slug", sa.String(300), nullable=True, unique=True),
+        indexes=("id", "title", "published"),
+    )
+    _create_table(
+        "contacts",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("subject", sa.String(500), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("read", sa.Boolean(), nullable=True),
+        indexes=("id", "read"),
+    )
+    _create_table(
+        "draft_cache",
+        sa.Column("key", sa.String(64), primary_key=True),
+        sa.Column("model", sa.String(100), nullable=False),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("summary", sa.String(500), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        indexes=("created_at",),
+    )
+    _create_table(
+        "story_fingerprints",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("news_id", sa.Integer(), nullable=False),
+        sa.Column("source_url", sa.String(1000), nullable=True),
+        sa.Column("simhash", sa.BigInteger(), nullable=False),
+        sa.Column("band_0", sa.Integer(), nullable=False),
+        sa.Column("band_1", sa.Integer(), nullable=False),
+        sa.Column("band_2", sa.Integer(), nullable=False),
+        sa.Column("band_3", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        indexes=("id", "news_id", "band_0", "band_1", "band_2", "band_3", "created_at"),
+    )
+    _create_table(
+        "ingest_items",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("pipeline", sa.String(32), nullable=False),
+        sa.Column("topic", sa.String(32), nullable=False),
+        sa.Column("stage", sa.String(16), nullable=False),
+        sa.Column("source_key", sa.String(64), nullable=False),
+        sa.Column("source_url", sa.String(1000), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("image_data", sa.LargeBinary(), nullable=True),
+        sa.Column("image_filename", sa.String(255), nullable=True),
+        sa.Column("image_mimetype", sa.String(100), nullable=True),
+        sa.Column("news_id", sa.Integer(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("lease_owner", sa.String(100), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("pipeline", "source_key", name="uq_ingest_items_pipeline_source"),
+        indexes=("id", "stage", "lease_expires_at", "created_at"),
+    )
+    _create_table(
+        "jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("kind", sa.String(32), nullable=False),
+        sa.Column("status", sa.String(16), nullable=False),
+        sa.Column("params", sa.JSON(), nullable=False),
+        sa.Column("stats", sa.JSON(), nullable=True),
+        sa.Column("progress", sa.JSON(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("worker", sa.String(100), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        indexes=("id", "kind", "status", "created_at"),
+    )
+    _create_table(
+        "scheduler_leases",
+        sa.Column("name", sa.String(100), primary_key=True),
+        sa.Column("holder", sa.String(100), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("acquired_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    _create_table(
+        "feed_states",
+        sa.Column("feed_url", sa.String(500), primary_key=True),
+        sa.Column("topic", sa.String(32), nullable=False),
+        sa.Column("interval_secs", sa.Integer(), nullable=False),
+        sa.Column("next_poll_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_polled_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_entry_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("etag", sa.String(255), nullable=True),
+        sa.Column("modified", sa.String(100), nullable=True),
+        sa.Column("consecutive_failures", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        indexes=("next_poll_at",),
+    )
+
+
+def downgrade() -> None:
+    # The baseline adopts tables that predate migrations; never drop them.
+    pass
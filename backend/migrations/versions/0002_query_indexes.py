@@ -0,0 +1,40 @@
+"""Indexes for the hot list and queue queries
+
+- news (published, created_at): the public list filters on published and
+  sorts newest first; created_at alone serves the admin list.
+- contacts.created_at: the admin inbox sort.
+- ingest_items (pipeline, stage): every queue claim; news_id: the daily
+  published-per-topic count of the feed poller.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+_INDEXES = (
+    ("ix_news_published_created_at", "news", ["published", "created_at"]),
+    ("ix_news_created_at", "news", ["created_at"]),
+    ("ix_contacts_created_at", "contacts", ["created_at"]),
+    ("ix_ingest_items_pipeline_stage", "ingest_items", ["pipeline", "stage"]),
+    ("ix_ingest_items_news_id", "ingest_items", ["news_id"]),
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in _INDEXES:
+        if name not in {index["name"] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,69 @@
+"""Backfill canonical news tags
+
+Tags are normalized on write (app.models.normalize_tags), so read paths no
+longer coerce them per row. This rewrites legacy rows (NULL, bare strings,
+lists with blanks or duplicates) into the canonical list form once.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+_BATCH_SIZE = 500
+
+_news = sa.table("news", sa.column("id", sa.Integer), sa.column("tags", sa.JSON))
+
+
+def _normalize(tags):
+    # Frozen copy of app.models.normalize_tags as of this revision.
+    if isinstance(tags, str):
+        text = tags.strip()
+        if text.startswith("["):
+            try:
+                tags = json.loads(text)
+            except ValueError:
+                tags = text.strip("[]").split(",")
+        else:
+            tags = text.split(",")
+    if not isinstance(tags, (list, tuple)):
+        return []
+    normalized = []
+    for tag in tags:
+        tag = str(tag).strip() if tag is not None else ""
+        if tag and tag not in normalized:
+            normalized.append(tag)
+    return normalized
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(_news.c.id, _news.c.tags)
+            .where(_news.c.id > last_id)
+            .order_by(_news.c.id)
+            .limit(_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        for news_id, tags in rows:
+            normalized = _normalize(tags)
+            if normalized != tags:
+                bind.execute(sa.update(_news).where(_news.c.id == news_id).values(tags=normalized))
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    # Canonical lists are valid under the old read paths too.
+    pass
@@ -0,0 +1,68 @@
+"""Word-set fingerprints with MinHash LSH bands for near-duplicates
+
+SimHash over title and lead only caught almost identical text: paraphrased
+headlines of the same event landed as far apart as unrelated stories.
+Fingerprints are now the normalized source-title word set, with 16 LSH
+band keys per story in story_fingerprint_bands.
+
+The old SimHash rows cannot be converted (the source titles were not
+stored) and only cover a 7-day lookback, so they are dropped; URL and
+exact-title checks still apply to stories published before the upgrade.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def _create_indexes(table: str, columns: tuple[str, ...]) -> None:
+    for column in columns:
+        op.create_index(f"ix_{table}_{column}", table, [column])
+
+
+def upgrade() -> None:
+    op.drop_table("story_fingerprints")
+    op.create_table(
+        "story_fingerprints",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("news_id", sa.Integer(), nullable=False),
+        sa.Column("source_url", sa.String(1000), nullable=True),
+        sa.Column("title_tokens", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    _create_indexes("story_fingerprints", ("id", "news_id", "created_at"))
+    op.create_table(
+        "story_fingerprint_bands",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("fingerprint_id", sa.Integer(), nullable=False),
+        sa.Column("band_key", sa.BigInteger(), nullable=False),
+    )
+    _create_indexes("story_fingerprint_bands", ("id", "fingerprint_id", "band_key"))
+
+
+def downgrade() -> None:
+    op.drop_table("story_fingerprint_bands")
+    op.drop_table("story_fingerprints")
+    op.create_table(
+        "story_fingerprints",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("news_id", sa.Integer(), nullable=False),
+        sa.Column("source_url", sa.String(1000), nullable=True),
+        sa.Column("simhash", sa.BigInteger(), nullable=False),
+        sa.Column("band_0", sa.Integer(), nullable=False),
+        sa.Column("band_1", sa.Integer(), nullable=False),
+        sa.Column("band_2", sa.Integer(), nullable=False),
+        sa.Column("band_3", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    _create_indexes(
+        "story_fingerprints", ("id", "news_id", "band_0", "band_1", "band_2", "band_3", "created_at")
+    )
@@ -0,0 +1,23 @@
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# app.database builds its engine at import time, so this must run first.
+_DB_PATH = Path(tempfile.mkdtemp()) / "test.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_PATH}"
+os.environ["AUTO_PUBLISH_ENABLED"] = "false"
+
+from app.database import Base, SessionLocal, engine  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
@@ -0,0 +1,104 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app import cache as news_cache
+from app.auth import get_current_admin
+from app.main import app
+from app.models import News
+from app.routers.news import LIST_CACHE_PREFIX
+
+TAGS = {
+    "upper": ["AI", "Automation"],
+    "lower": ["ai"],
+    "wildcard": ["abc", "100%"],
+    "accent": ["café"],
+}
+
+
+@pytest.fixture
+def client(db):
+    for slug, tags in TAGS.items():
+        db.add(News(title=slug, summary="s", content="c", tags=tags, published=True, slug=slug))
+    db.commit()
+    app.dependency_overrides[get_current_admin] = lambda: "admin"
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+def _slugs(client, **params):
+    response = client.get("/admin/news", params=params)
+    assert response.status_code == 200
+    return sorted(item["slug"] for item in response.json()["items"])
+
+
+@pytest.mark.parametrize(
+    "tag, expected",
+    [
+        ("AI", ["upper"]),
+        ("ai", ["lower"]),
+        ("a_c", []),
+        ("%", []),
+        ("100%", ["wildcard"]),
+        ("café", ["accent"]),
+    ],
+)
+def test_tag_filter_matches_exact_element(client, tag, expected):
+    assert _slugs(client, tag=tag) == expected
+
+
+def test_automated_filter(client):
+    assert _slugs(client, automated="true") == ["upper"]
+    assert _slugs(client, automated="false") == ["accent", "lower", "wildcard"]
+
+
+def _bulk(client, ids, operation, **extra):
+    return client.post("/admin/news/bulk", json={"ids": ids, "operation": operation, **extra})
+
+
+def _cache_list(key="list:bulk-test"):
+    news_cache.set(LIST_CACHE_PREFIX + key, ["cached"])
+    return LIST_CACHE_PREFIX + key
+
+
+@pytest.mark.parametrize(
+    "operation, extra, published, tags",
+    [
+        ("unpublish", {}, False, ["AI", "Automation"]),
+        ("publish", {}, True, ["AI", "Automation"]),
+        ("retag", {"tags": "Cricket, IPL, Cricket"}, True, ["Cricket", "IPL"]),
+    ],
+)
+def test_bulk_update_counts_and_applies(client, db, operation, extra, published, tags):
+    ids = [news.id for news in db.query(News).filter(News.slug.in_(["upper", "lower"]))]
+    response = _bulk(client, ids + [ids[0], 999_999], operation, **extra)
+
+    assert response.status_code == 200
+    assert response.json() == {"operation": operation, "requested": 3, "affected": 2}
+    db.expire_all()
+    upper = db.query(News).filter(News.slug == "upper").one()
+    assert upper.published is published and upper.tags == tags
+
+
+def test_bulk_delete_ignores_unknown_ids(client, db):
+    ids = [news.id for news in db.query(News).filter(News.slug.in_(["upper", "accent"]))]
+    response = _bulk(client, ids + [999_999], "delete")
+
+    assert response.json() == {"operation": "delete", "requested": 3, "affected": 2}
+    db.expire_all()
+    assert sorted(news.slug for news in db.query(News)) == ["lower", "wildcard"]
+
+
+def test_bulk_retag_without_tags_is_rejected(client, db):
+    response = _bulk(client, [db.query(News).first().id], "retag")
+    assert response.status_code == 422
+
+
+def test_bulk_invalidates_list_cache_only_when_rows_change(client, db):
+    key = _cache_list()
+    assert _bulk(client, [999_999], "publish").json()["affected"] == 0
+    assert news_cache.get(key) == ["cached"]
+
+    assert _bulk(client, [db.query(News).first().id], "unpublish").json()["affected"] == 1
+    assert news_cache.get(key) is None
@@ -0,0 +1,25 @@
+import pytest
+
+from agents import auto_publish
+from benchmarks.extraction import FIXTURE_CORPUS, _current_extract, _legacy_extract
+
+PAGES = sorted(FIXTURE_CORPUS.glob("*.html"))
+
+
+@pytest.mark.parametrize("path", PAGES, ids=lambda path: path.name)
+def test_single_walk_matches_legacy_extractor(path):
+    page = path.read_text(encoding="utf-8")
+    assert _current_extract(page) == _legacy_extract(page)
+
+
+def test_nav_paragraphs_stay_in_excerpt_but_not_in_page_text():
+    page = (FIXTURE_CORPUS / "c_nav_paragraphs.html").read_text(encoding="utf-8")
+    article = auto_publish._parse_article_html(page)
+    assert any(paragraph.startswith("Browse all sections") for paragraph in article.paragraphs)
+    assert "Browse all sections" not in article.text
+
+
+def test_unclosed_paragraphs_fall_back_to_html_parser():
+    page = (FIXTURE_CORPUS / "e_unclosed_p.html").read_text(encoding="utf-8")
+    assert auto_publish._parser_for(page) == "html.parser"
+    assert auto_publish._parser_for("<p>closed</p>") == auto_publish.HTML_PARSER
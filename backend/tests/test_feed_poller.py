@@ -0,0 +1,53 @@
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from agents import feed_poller
+from agents.auto_publish import FeedConfig
+
+FEED = FeedConfig(topic="ai", source_name="Example", url="https://example.com/feed", tags=["ai"])
+
+
+def _entries(start: datetime, count: int) -> list[dict]:
+    # Newest first, the way feeds list them.
+    return [
+        {
+            "title": f"Story {i}",
+            "link": f"https://example.com/{i}",
+            "published_parsed": time.gmtime((start + timedelta(hours=i)).timestamp()),
+        }
+        for i in reversed(range(count))
+    ]
+
+
+def _poll(db, monkeypatch, entries, remaining, etag):
+    queued = []
+    parsed = SimpleNamespace(status=200, bozo=False, entries=entries, etag=etag, modified=None)
+    monkeypatch.setattr(feed_poller.feedparser, "parse", lambda *args, **kwargs: parsed)
+    monkeypatch.setattr(
+        feed_poller, "_enqueue_entry", lambda db, feed, entry, fingerprints: queued.append(entry["link"]) or True
+    )
+    state = feed_poller._feed_state(db, FEED, feed_poller._utcnow())
+    feed_poller._poll_feed(db, FEED, state, remaining, [])
+    return state, queued
+
+
+def test_entries_dropped_by_the_daily_cap_are_queued_on_a_later_poll(db, monkeypatch):
+    start = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    entries = _entries(start, 5)
+
+    state, queued = _poll(db, monkeypatch, entries, {"ai": 2}, "v1")
+    assert queued == ["https://example.com/0", "https://example.com/1"]
+    assert feed_poller._aware(state.last_entry_at) == start + timedelta(hours=1)
+    assert state.etag is None
+
+    state, queued = _poll(db, monkeypatch, entries, {"ai": 5}, "v1")
+    assert queued == ["https://example.com/2", "https://example.com/3", "https://example.com/4"]
+    assert feed_poller._aware(state.last_entry_at) == start + timedelta(hours=4)
+    assert state.etag == "v1"
+
+
+def test_watermark_stays_put_when_the_quota_is_spent(db, monkeypatch):
+    state, queued = _poll(db, monkeypatch, _entries(datetime(2026, 10, 1, tzinfo=timezone.utc), 3), {"ai": 0}, "v1")
+    assert queued == []
+    assert state.last_entry_at is None
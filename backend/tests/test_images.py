@@ -0,0 +1,95 @@
+import io
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image, JpegImagePlugin
+
+from app import images
+from app.auth import get_current_admin
+from app.main import app
+
+
+def _jpeg(size=(320, 240)) -> bytes:
+    # Noise, so most of the file is scan data rather than headers.
+    rng = random.Random(47)
+    image = Image.frombytes("RGB", size, bytes(rng.randrange(256) for _ in range(size[0] * size[1] * 3)))
+    output = io.BytesIO()
+    image.save(output, format="JPEG")
+    return output.getvalue()
+
+
+def _truncated_jpeg() -> bytes:
+    data = _jpeg()
+    return data[: len(data) * 3 // 4]
+
+
+def test_small_image_is_returned_unchanged():
+    data = _jpeg()
+    assert images.downscale(data, "image/jpeg", max_dimension=400) == data
+
+
+def test_large_image_is_downscaled():
+    data = images.downscale(_jpeg(), "image/jpeg", max_dimension=100)
+    with Image.open(io.BytesIO(data)) as image:
+        assert image.size == (100, 75)
+
+
+def test_truncated_jpeg_is_rejected():
+    with pytest.raises(images.InvalidImage):
+        images.downscale(_truncated_jpeg(), "image/jpeg", max_dimension=400)
+
+
+def test_truncated_jpeg_upload_returns_400(db):
+    app.dependency_overrides[get_current_admin] = lambda: "admin"
+    try:
+        response = TestClient(app).post(
+            "/admin/news",
+            data={"title": "t", "summary": "s", "content": "c"},
+            files={"image": ("photo.jpg", _truncated_jpeg(), "image/jpeg")},
+        )
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Image file is corrupt or unreadable"
+
+
+def _huge_png() -> bytes:
+    # 30 megapixels that compress to a few KB, over the 25 MP default.
+    output = io.BytesIO()
+    Image.new("1", (6000, 5000)).save(output, format="PNG")
+    return output.getvalue()
+
+
+def test_oversized_dimensions_are_rejected_before_decoding(monkeypatch):
+    def load(self):
+        raise AssertionError("decoded an oversized image")
+
+    data = _huge_png()
+    monkeypatch.setattr(Image.Image, "load", load)
+    with pytest.raises(images.ImageTooLarge):
+        images.downscale(data, "image/png")
+
+
+def test_oversized_dimensions_upload_returns_400(db):
+    app.dependency_overrides[get_current_admin] = lambda: "admin"
+    try:
+        response = TestClient(app).post(
+            "/admin/news",
+            data={"title": "t", "summary": "s", "content": "c"},
+            files={"image": ("huge.png", _huge_png(), "image/png")},
+        )
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Image dimensions exceed 25 megapixels"
+
+
+def test_large_jpeg_is_decoded_in_draft_mode(monkeypatch):
+    drafts = []
+    draft = JpegImagePlugin.JpegImageFile.draft
+    monkeypatch.setattr(
+        JpegImagePlugin.JpegImageFile, "draft", lambda self, mode, size: drafts.append(size) or draft(self, mode, size)
+    )
+    images.downscale(_jpeg(), "image/jpeg", max_dimension=100)
+    assert drafts == [(100, 100)]
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from agents import ingest_queue
+from app.models import IngestItem
+
+PIPELINE = "test"
+
+
+@pytest.fixture
+def queued(db):
+    assert ingest_queue.enqueue(db, PIPELINE, "ai", "https://example.com/story", {"title": "Story"})
+    return db.query(IngestItem).one()
+
+
+def _expire_lease(db, row):
+    row.lease_expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    db.commit()
+
+
+def test_enqueue_is_idempotent_per_source(db, queued):
+    assert not ingest_queue.enqueue(db, PIPELINE, "ai", "https://example.com/story", {})
+    assert ingest_queue.is_queued(db, PIPELINE, "https://example.com/story")
+
+
+def test_second_claim_while_lease_is_held_gets_nothing(db, queued):
+    assert [item.id for item in ingest_queue.claim(db, PIPELINE, ingest_queue.DISCOVERED, "a", 5)] == [queued.id]
+    assert ingest_queue.claim(db, PIPELINE, ingest_queue.DISCOVERED, "b", 5) == []
+
+
+def test_expired_lease_is_taken_over_and_the_old_owner_loses_it(db, queued):
+    [item] = ingest_queue.claim(db, PIPELINE, ingest_queue.DISCOVERED, "a", 5)
+    _expire_lease(db, queued)
+
+    [taken] = ingest_queue.claim(db, PIPELINE, ingest_queue.DISCOVERED, "b", 5)
+    assert taken.id == item.id
+    assert not ingest_queue.advance(db, item, "a", ingest_queue.FETCHED)
+    assert ingest_queue.advance(db, taken, "b", ingest_queue.FETCHED)
+    db.refresh(queued)
+    assert queued.stage == ingest_queue.FETCHED and queued.lease_owner is None
+
+
+def test_failures_back_off_exponentially_then_fail(db, queued, monkeypatch):
+    monkeypatch.setattr(ingest_queue, "INGEST_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(ingest_queue, "INGEST_RETRY_BACKOFF_SECS", 60)
+
+    for attempt, backoff in ((1, 60), (2, 120)):
+        [item] = ingest_queue.claim(db, PIPELINE, ingest_queue.DISCOVERED, "a", 5)
+        before = datetime.now(timezone.utc)
+        assert ingest_queue.fail(db, item, "a", RuntimeError("boom")) == ingest_queue.DISCOVERED
+        db.refresh(queued)
+        assert queued.attempts == attempt and queued.last_error == "boom"
+        retry_at = queued.lease_expires_at.replace(tzinfo=timezone.utc)
+        assert before + timedelta(seconds=backoff - 1) <= retry_at <= before + timedelta(seconds=backoff + 1)
+        # Not claimable until the backoff has passed.
+        assert ingest_queue.claim(db, PIPELINE, ingest_queue.DISCOVERED, "a", 5) == []
+        _expire_lease(db, queued)
+
+    [item] = ingest_queue.claim(db, PIPELINE, ingest_queue.DISCOVERED, "a", 5)
+    assert ingest_queue.fail(db, item, "a", "boom") == ingest_queue.FAILED
+    db.refresh(queued)
+    assert queued.stage == ingest_queue.FAILED and queued.lease_expires_at is None
+
+
+def test_half_processed_item_resumes_from_its_stage(db, queued):
+    [item] = ingest_queue.claim(db, PIPELINE, ingest_queue.DISCOVERED, "crashed", 5)
+    ingest_queue.advance(
+        db, item, "crashed", ingest_queue.FETCHED,
+        payload={**item.payload, "article": "text"}, image_asset=(b"img", "a.jpg", "image/jpeg"),
+    )
+    # The worker died mid-draft, holding the lease.
+    ingest_queue.claim(db, PIPELINE, ingest_queue.FETCHED, "crashed", 5)
+    _expire_lease(db, queued)
+
+    assert ingest_queue.claim(db, PIPELINE, ingest_queue.DISCOVERED, "new", 5) == []
+    [resumed] = ingest_queue.claim(db, PIPELINE, ingest_queue.FETCHED, "new", 5)
+    assert resumed.payload == {"title": "Story", "article": "text"}
+    assert resumed.image_asset == (b"img", "a.jpg", "image/jpeg")
+
+
+def test_claim_respects_topic_limits(db):
+    for n, topic in enumerate(("ai", "ai", "cricket")):
+        ingest_queue.enqueue(db, PIPELINE, topic, f"https://example.com/{n}", {})
+    items = ingest_queue.claim(db, PIPELINE, ingest_queue.DISCOVERED, "a", 5, topic_limits={"ai": 1})
+    assert [item.topic for item in items] == ["ai"]
+
+
+def test_prune_removes_old_finished_and_stale_discovered_items(db):
+    old = datetime.now(timezone.utc) - timedelta(days=30)
+    for n, (stage, attempts) in enumerate((
+        (ingest_queue.PUBLISHED, 0),
+        (ingest_queue.DISCOVERED, 0),
+        (ingest_queue.DISCOVERED, 1),
+        (ingest_queue.FETCHED, 0),
+    )):
+        db.add(IngestItem(
+            pipeline=PIPELINE, topic="ai", stage=stage, source_key=str(n), source_url=f"https://example.com/{n}",
+            payload={}, attempts=attempts, created_at=old,
+        ))
+    db.commit()
+
+    assert ingest_queue.prune(db) == 2
+    assert sorted((row.stage, row.attempts) for row in db.query(IngestItem)) == [
+        (ingest_queue.DISCOVERED, 1),
+        (ingest_queue.FETCHED, 0),
+    ]
@@ -0,0 +1,54 @@
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import cache
+from app.main import app
+from app.models import News
+
+
+@pytest.fixture
+def client(db):
+    db.add(News(title="Timing", summary="s", content="c", tags=["AI"], published=True, slug="timing"))
+    db.commit()
+    cache.invalidate()
+    yield TestClient(app)
+    cache.invalidate()
+
+
+def _sample(body: str, line_prefix: str) -> float:
+    match = re.search(rf"^{re.escape(line_prefix)} (\S+)$", body, re.MULTILINE)
+    return float(match.group(1)) if match else 0.0
+
+
+def test_server_timing_attributes_db_work_done_in_the_threadpool(client):
+    miss = client.get("/news")
+    assert miss.status_code == 200
+    timing = miss.headers["Server-Timing"]
+    assert timing.startswith("app;dur=")
+    # The query ran on a worker thread; the contextvar carried the request's timing there.
+    assert re.search(r'db;dur=[\d.]+;desc="[1-9]\d* quer(y|ies)"', timing)
+    assert 'cache;desc="miss"' in timing
+    assert re.search(r"serialize;dur=[\d.]+", timing)
+
+    hit = client.get("/news")
+    assert 'cache;desc="hit"' in hit.headers["Server-Timing"]
+    assert "db;" not in hit.headers["Server-Timing"]
+
+
+def test_metrics_render_per_route_histograms_and_cache_counters(client):
+    before = client.get("/metrics").text
+    client.get("/news")
+    client.get("/news")
+    after = client.get("/metrics").text
+
+    count = 'http_request_duration_seconds_count{method="GET",route="/news",status="200"}'
+    assert _sample(after, count) - _sample(before, count) == 2
+    hits = 'news_cache_lookups_total{route="/news",result="hit"}'
+    misses = 'news_cache_lookups_total{route="/news",result="miss"}'
+    assert _sample(after, hits) - _sample(before, hits) == 1
+    assert _sample(after, misses) - _sample(before, misses) == 1
+    assert 'http_request_db_queries_bucket{method="GET",route="/news",le="+Inf"}' in after
+    assert "# TYPE http_request_db_seconds histogram" in after
+    assert "threadpool_size" in after
@@ -0,0 +1,87 @@
+import pytest
+
+from agents.near_duplicate import (
+    find_near_duplicate,
+    is_near_duplicate,
+    record_fingerprint,
+    story_fingerprint,
+)
+from app.models import News
+
+# The same event as headlined by different outlets.
+PARAPHRASES = [
+    ("India beat Australia by six wickets in first Test", "Australia lose first Test to India by 6 wickets"),
+    ("Apple unveils iPhone 16 at September event", "iPhone 16 announced at Apple's September launch event"),
+    ("Nvidia shares surge after record quarterly revenue", "Record quarterly revenue sends Nvidia shares soaring"),
+    ("Google fined €2.4bn by EU over shopping search", "EU hits Google with €2.4 billion fine over shopping search results"),
+    ("Microsoft to acquire Activision Blizzard for $69 billion", "Microsoft agrees $69bn deal to buy Activision Blizzard"),
+    ("Meta releases Llama 3 open-source AI model", "Meta's new open-source Llama 3 AI model is out"),
+    ("Tesla recalls 2 million cars over Autopilot safety concerns", "Autopilot concerns force Tesla to recall two million vehicles"),
+    ("India beat Pakistan by 5 wickets", "Kohli fifty helps India beat Pakistan by five wickets"),
+]
+
+UNRELATED = [
+    ("Federal Reserve holds interest rates steady", "Google releases Gemini 2.0 model"),
+    ("OpenAI launches GPT-5 with improved reasoning", "Meta releases Llama 3 open-source AI model"),
+    ("India beat Australia by six wickets in first Test", "England beat India by five wickets in second Test"),
+    ("Anthropic raises $4 billion from Amazon", "OpenAI raises $6.6 billion at $157 billion valuation"),
+]
+
+
+# Live pages and results that share almost every word but are different stories.
+FORMULAIC = [
+    ("India vs Australia 1st Test Day 2 live score", "India vs Australia 2nd Test Day 2 live score"),
+    ("India vs England 3rd T20I live updates", "India vs England 4th T20I live updates"),
+    ("IPL 2025: CSK vs MI live score", "IPL 2025: RCB vs KKR live score"),
+]
+
+REVERSED = [
+    ("India beat Pakistan by 5 wickets", "Pakistan beat India by 5 wickets"),
+    ("Australia lose to India by six wickets", "India lose to Australia by 6 wickets"),
+]
+
+
+@pytest.mark.parametrize("first, second", PARAPHRASES)
+def test_paraphrased_headlines_are_near_duplicates(first, second):
+    assert is_near_duplicate(story_fingerprint(first), story_fingerprint(second))
+
+
+@pytest.mark.parametrize("first, second", UNRELATED)
+def test_unrelated_headlines_are_not_near_duplicates(first, second):
+    assert not is_near_duplicate(story_fingerprint(first), story_fingerprint(second))
+
+
+@pytest.mark.parametrize("first, second", FORMULAIC)
+def test_formulaic_headlines_for_different_matches_are_not_near_duplicates(first, second):
+    assert not is_near_duplicate(story_fingerprint(first), story_fingerprint(second))
+
+
+@pytest.mark.parametrize("first, second", REVERSED)
+def test_reversed_results_are_not_near_duplicates(first, second):
+    assert not is_near_duplicate(story_fingerprint(first), story_fingerprint(second))
+
+
+def test_legacy_simhash_payloads_never_match():
+    assert not is_near_duplicate(story_fingerprint(PARAPHRASES[0][0]), 1234567890)
+
+
+def test_indexed_lookup_finds_paraphrase_of_published_story(db):
+    news = News(title="Microsoft buys Activision", summary="s", content="c", published=True, slug="ms")
+    db.add(news)
+    db.flush()
+    record_fingerprint(db, story_fingerprint(PARAPHRASES[4][0]), news.id, "https://a.example/story")
+    db.commit()
+
+    assert find_near_duplicate(db, story_fingerprint(PARAPHRASES[4][1])) == news.id
+    assert find_near_duplicate(db, story_fingerprint(UNRELATED[0][0])) is None
+
+
+def test_indexed_lookup_rejects_reversed_result(db):
+    news = News(title="India beat Pakistan", summary="s", content="c", published=True, slug="ind-pak")
+    db.add(news)
+    db.flush()
+    record_fingerprint(db, story_fingerprint(REVERSED[0][0]), news.id)
+    db.commit()
+
+    assert find_near_duplicate(db, story_fingerprint(REVERSED[0][1])) is None
+    assert find_near_duplicate(db, story_fingerprint(PARAPHRASES[-1][1])) == news.id
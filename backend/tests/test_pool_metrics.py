@@ -0,0 +1,28 @@
+import sqlite3
+import time
+
+from app import metrics
+from app.database import TimedQueuePool
+
+
+def _totals(histogram) -> tuple[float, int]:
+    _, total, count = histogram._values.get((), ([], 0.0, 0))
+    return total, count
+
+
+def test_checkout_wait_excludes_connect_time(monkeypatch):
+    monkeypatch.setattr(metrics.POOL_CHECKOUT_WAIT, "_values", {})
+    monkeypatch.setattr(metrics.POOL_CONNECT, "_values", {})
+
+    def slow_connect():
+        time.sleep(0.2)
+        return sqlite3.connect(":memory:")
+
+    pool = TimedQueuePool(slow_connect, pool_size=1, max_overflow=0)
+    pool.connect().close()
+    pool.connect().close()
+
+    connect_total, connects = _totals(metrics.POOL_CONNECT)
+    wait_total, checkouts = _totals(metrics.POOL_CHECKOUT_WAIT)
+    assert connects == 1 and connect_total >= 0.2
+    assert checkouts == 2 and wait_total < 0.05
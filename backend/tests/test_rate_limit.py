@@ -0,0 +1,13 @@
+from agents.rate_limit import RateLimiter
+
+
+def test_zero_limits_disable_throttling():
+    limiter = RateLimiter(0, 0)
+    assert limiter.requests is None and limiter.tokens is None
+    assert sum(limiter.acquire(tokens=10_000) for _ in range(100)) == 0
+
+
+def test_requests_beyond_the_burst_wait():
+    limiter = RateLimiter(6000, burst=1)
+    assert limiter.acquire() == 0
+    assert limiter.acquire() > 0
@@ -0,0 +1,29 @@
+from datetime import datetime, timedelta, timezone
+
+from agents import worker
+from agents.jobs import RUNNING
+from app import scheduler
+from app.leader import LeaderElector
+from app.models import Job
+
+
+def test_leader_resumes_job_whose_lease_expires_after_takeover(db, monkeypatch):
+    started = []
+    monkeypatch.setattr(worker, "run_job_in_background", lambda job_id, on_finish=None: started.append(job_id))
+    monkeypatch.setattr(scheduler, "INGEST_MODE", "inline")
+    monkeypatch.setattr(scheduler, "_leader", LeaderElector("scheduler"))
+
+    # The previous leader resigned on deploy, but its job still holds a live lease.
+    now = datetime.now(timezone.utc)
+    job = Job(kind="auto_publish", status=RUNNING, params={}, worker="old", lease_expires_at=now + timedelta(minutes=5))
+    db.add(job)
+    db.commit()
+
+    assert scheduler._renew_leadership()
+    assert started == []
+
+    job.lease_expires_at = now - timedelta(seconds=1)
+    db.commit()
+
+    assert scheduler._renew_leadership()
+    assert started == [job.id]
@@ -0,0 +1,105 @@
+import json
+from dataclasses import asdict
+
+import pytest
+
+from agents import auto_publish, ingest_queue
+from agents.auto_publish import DraftRequest, ParsedArticle, StoryDraft
+from app.models import News
+
+
+def _request(n: int) -> DraftRequest:
+    return DraftRequest(
+        topic="ai",
+        source_name="Example",
+        source_url=f"https://example.com/{n}",
+        source_title=f"Source title {n}",
+        source_summary=f"Source summary {n}",
+        article_text="",
+    )
+
+
+def test_one_failed_draft_falls_back_without_losing_the_batch(monkeypatch):
+    def generate(**request):
+        if request["source_url"].endswith("/1"):
+            raise RuntimeError("limiter exploded")
+        return StoryDraft(title=f"Drafted {request['source_url']}", summary="s", content="c")
+
+    monkeypatch.setattr(auto_publish, "OPENAI_MAX_CONCURRENCY", 4)
+    monkeypatch.setattr(auto_publish, "_generate_story_draft", generate)
+    drafts = auto_publish._generate_story_drafts([_request(n) for n in range(3)])
+
+    assert [draft.title for draft in drafts] == [
+        "Drafted https://example.com/0",
+        "Source title 1",
+        "Drafted https://example.com/2",
+    ]
+
+
+class _Response:
+    def __init__(self, content: dict):
+        self._content = content
+
+    def json(self):
+        return {"choices": [{"message": {"content": json.dumps(self._content)}}]}
+
+
+def test_repeat_refresh_is_served_from_the_draft_cache(db, monkeypatch):
+    source_url = "https://example.com/story"
+    db.add(News(
+        title="Old title",
+        summary="Old summary",
+        content=f"Body\n\nOriginal source: {source_url}",
+        tags=["AI", "Automation"],
+        published=True,
+        slug="old-title",
+    ))
+    db.commit()
+
+    article = ParsedArticle(paragraphs=("A source paragraph long enough to be worth drafting from. " * 3,))
+    monkeypatch.setattr(auto_publish, "_fetch_article_assets", lambda url: (article, url, (None, None, None)))
+    monkeypatch.setattr(auto_publish, "OPENAI_API_KEY", "test-key")
+    calls = []
+
+    def request(method, url, **kwargs):
+        calls.append(url)
+        return _Response({
+            "title": f"Drafted title {len(calls)}",
+            "summary": "Drafted summary.",
+            "sections": [
+                {"heading": heading, "body": "Body."}
+                for heading in ("What happened", "Why it matters", "Key details", "What to watch")
+            ],
+        })
+
+    monkeypatch.setattr(auto_publish, "_request_with_retries", request)
+
+    assert auto_publish.refresh_automated_article_content()["updated"] == 1
+    assert len(calls) == 1
+    assert auto_publish.refresh_automated_article_content()["updated"] == 1
+    assert len(calls) == 1
+    db.expire_all()
+    assert db.query(News).one().title == "Drafted title 1"
+
+
+def _queued_draft(attempts: int) -> ingest_queue.QueuedItem:
+    request = _request(0)
+    request = DraftRequest(**{**asdict(request), "article_text": "A long enough source paragraph to draft from."})
+    return ingest_queue.QueuedItem(
+        id=1, pipeline=auto_publish.AUTO_PUBLISH_PIPELINE, topic="ai", stage=ingest_queue.FETCHED,
+        source_url=request.source_url, attempts=attempts, payload={"draft_request": asdict(request)},
+    )
+
+
+def test_draft_stage_retries_api_errors_and_falls_back_on_the_last_attempt(monkeypatch):
+    def request(method, url, **kwargs):
+        raise ConnectionError("API unavailable")
+
+    monkeypatch.setattr(auto_publish, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(auto_publish, "_request_with_retries", request)
+    monkeypatch.setattr(ingest_queue, "INGEST_MAX_ATTEMPTS", 3)
+
+    for attempts in (0, 1):
+        with pytest.raises(ConnectionError):
+            auto_publish._draft_queued_story(_queued_draft(attempts))
+    assert auto_publish._draft_queued_story(_queued_draft(2)).title == "Source title 0"
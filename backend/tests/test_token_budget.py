@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+from agents import token_budget
+
+
+class _Encoding:
+    def encode(self, text, disallowed_special=()):
+        return text.split()
+
+
+def test_encoding_load_failure_is_retried(monkeypatch):
+    attempts = []
+
+    def encoding_for_model(model):
+        attempts.append(model)
+        if len(attempts) == 1:
+            raise ConnectionError("offline")
+        return _Encoding()
+
+    monkeypatch.setattr(token_budget, "tiktoken", SimpleNamespace(encoding_for_model=encoding_for_model))
+    monkeypatch.setattr(token_budget, "_encodings", {})
+    monkeypatch.setattr(token_budget, "_encoding_failed_at", {})
+    text = "three word sentence"
+
+    assert token_budget.count_tokens(text, "m") == len(text) // 4 + 1
+    # Within the retry interval the estimate is used without another download.
+    assert token_budget.count_tokens(text, "m") == len(text) // 4 + 1
+    assert len(attempts) == 1
+
+    monkeypatch.setattr(token_budget, "ENCODING_RETRY_SECS", 0)
+    assert token_budget.count_tokens(text, "m") == 3
+    assert token_budget.count_tokens(text, "m") == 3
+    assert len(attempts) == 2
+
+
+def test_budget_keeps_lead_and_original_order(monkeypatch):
+    monkeypatch.setattr(token_budget, "count_tokens", lambda text, model="": len(text.split()))
+    paragraphs = ["Lead paragraph here.", "Filler text without much.", 'He said "a quote" with 42 figures.']
+    excerpt = token_budget.budget_excerpt(paragraphs, budget=10)
+    assert excerpt.text.split("\n\n") == [paragraphs[0], paragraphs[2]]
+    assert excerpt.paragraphs_used == 2 and excerpt.paragraphs_total == 3
@@ -80,7 +80,16 @@ export const adminApi = {
       headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
     });
   },
-  getAllNews: () => api.get('/admin/news'),
+  // Paged summaries (no content or image data); filters: published, tag,
+  // automated, created_from, created_to (YYYY-MM-DD), search.
+  getAllNews: ({ page = 1, pageSize = 25, ...filters } = {}) => {
+    const params = new URLSearchParams({ page, page_size: pageSize });
+    Object.entries(filters).forEach(([key, value]) => {
+      if (value !== '' && value !== null && value !== undefined) params.append(key, value);
+    });
+    return api.get(`/admin/news?${params.toString()}`);
+  },
+  getNews: (id) => api.get(`/admin/news/${id}`),
   createNews: (formData) =>
     api.post('/admin/news', formData, {
       headers: { 'Content-Type': 'multipart/form-data' },
@@ -90,9 +99,20 @@ export const adminApi = {
       headers: { 'Content-Type': 'multipart/form-data' },
     }),
   deleteNews: (id) => api.delete(`/admin/news/${id}`),
-  runAutomation: () => api.post('/admin/automation/run', null, { timeout: 120000 }),
-  refreshAutomationImages: () => api.post('/admin/automation/refresh-images', null, { timeout: 120000 }),
-  refreshAutomationContent: () => api.post('/admin/automation/refresh-content', null, { timeout: 120000 }),
+  // operation: 'publish' | 'unpublish' | 'delete' | 'retag' (retag replaces tags)
+  bulkNews: (ids, operation, tags) => api.post('/admin/news/bulk', { ids, operation, tags }),
+  // Automation endpoints queue a background job and return its id at once.
+  runAutomation: () => api.post('/admin/automation/run'),
+  refreshAutomationImages: () => api.post('/admin/automation/refresh-images'),
+  refreshAutomationContent: () => api.post('/admin/automation/refresh-content'),
+  getJob: (id) => api.get(`/admin/jobs/${id}`),
+  waitForJob: async (id, intervalMs = 3000) => {
+    for (;;) {
+      const { data } = await api.get(`/admin/jobs/${id}`);
+      if (data.status === 'succeeded' || data.status === 'failed') return data;
+      await new Promise((resolve) => setTimeout(resolve, intervalMs));
+    }
+  },
 };
 
 export const getImageUrl = (imagePath) => {
@@ -1,12 +1,24 @@
 import { useState, useEffect, useCallback } from 'react'
 import { useNavigate } from 'react-router-dom'
-import { Trash2, Loader, Eye, EyeOff, RefreshCw, LogOut, Plus, X, Bot, Image as ImageIcon } from 'lucide-react'
+import { Trash2, Loader, Eye, EyeOff, RefreshCw, LogOut, Plus, X, Bot, Image as ImageIcon, ChevronLeft, ChevronRight } from 'lucide-react'
 import { adminApi, getImageUrl } from '../lib/api'
 import logo from '../assets/logo.jpg'
 
+const PAGE_SIZE = 25
+
 function AdminDashboard() {
   const navigate = useNavigate()
   const [articles, setArticles] = useState([])
+  const [total, setTotal] = useState(0)
+  const [selected, setSelected] = useState([])
+  const [page, setPage] = useState(1)
+  const [filters, setFilters] = useState({
+    published: '',
+    automated: '',
+    tag: '',
+    created_from: '',
+    created_to: ''
+  })
   const [loading, setLoading] = useState(true)
   const [refreshing, setRefreshing] = useState(false)
   const [showCreateModal, setShowCreateModal] = useState(false)
@@ -25,8 +37,10 @@ function AdminDashboard() {
 
   const fetchArticles = useCallback(async () => {
     try {
-      const response = await adminApi.getAllNews()
-      setArticles(response.data)
+      const response = await adminApi.getAllNews({ page, pageSize: PAGE_SIZE, ...filters })
+      setArticles(response.data.items)
+      setTotal(response.data.total)
+      setSelected([])
     } catch (error) {
       if (error.response?.status === 401) {
         localStorage.removeItem('token')
@@ -36,7 +50,7 @@ function AdminDashboard() {
       setLoading(false)
       setRefreshing(false)
     }
-  }, [navigate])
+  }, [navigate, page, filters])
 
   useEffect(() => {
     const token = localStorage.getItem('token')
@@ -52,6 +66,14 @@ function AdminDashboard() {
     fetchArticles()
   }
 
+  const handleFilterChange = (e) => {
+    const { name, value } = e.target
+    setFilters(prev => ({ ...prev, [name]: value }))
+    setPage(1)
+  }
+
+  const pageCount = Math.max(1, Math.ceil(total / PAGE_SIZE))
+
   const handleLogout = () => {
     localStorage.removeItem('token')
     navigate('/admin/login')
@@ -61,9 +83,11 @@ function AdminDashboard() {
     setRunningAutomation(true)
     try {
       const response = await adminApi.runAutomation()
+      const job = await adminApi.waitForJob(response.data.job_id)
       fetchArticles()
-      const created = response.data?.created || {}
-      alert(`Automation completed. AI: ${created.ai || 0}, Sports: ${created.sports || 0}`)
+      if (job.status === 'failed') throw new Error(job.error)
+      const created = job.stats || {}
+      alert(`Automation completed. AI: ${created.ai || 0}, Sports: ${created.cricket || 0}`)
     } catch (error) {
       alert('Error running automation: ' + (error.response?.data?.detail || error.message))
     } finally {
@@ -75,8 +99,10 @@ function AdminDashboard() {
     setRefreshingImages(true)
     try {
       const response = await adminApi.refreshAutomationImages()
+      const job = await adminApi.waitForJob(response.data.job_id)
       fetchArticles()
-      const stats = response.data?.updated || {}
+      if (job.status === 'failed') throw new Error(job.error)
+      const stats = job.stats || {}
       alert(`Image refresh completed. Updated: ${stats.updated || 0}, Checked: ${stats.checked || 0}, Failed: ${stats.failed || 0}`)
     } catch (error) {
       alert('Error refreshing automation images: ' + (error.response?.data?.detail || error.message))
@@ -89,8 +115,10 @@ function AdminDashboard() {
     setRefreshingContent(true)
     try {
       const response = await adminApi.refreshAutomationContent()
+      const job = await adminApi.waitForJob(response.data.job_id)
       fetchArticles()
-      const stats = response.data?.updated || {}
+      if (job.status === 'failed') throw new Error(job.error)
+      const stats = job.stats || {}
       alert(`Content refresh completed. Updated: ${stats.updated || 0}, Checked: ${stats.checked || 0}, Failed: ${stats.failed || 0}`)
     } catch (error) {
       alert('Error refreshing automation content: ' + (error.response?.data?.detail || error.message))
@@ -110,6 +138,26 @@ function AdminDashboard() {
     }
   }
 
+  const toggleSelected = (id) => {
+    setSelected(prev => prev.includes(id) ? prev.filter(x => x !== id) : [...prev, id])
+  }
+
+  const toggleSelectAll = () => {
+    setSelected(prev => prev.length === articles.length ? [] : articles.map(article => article.id))
+  }
+
+  const handleBulk = async (operation) => {
+    if (selected.length === 0) return
+    if (operation === 'delete' && !confirm(`Delete ${selected.length} article(s)?`)) return
+
+    try {
+      await adminApi.bulkNews(selected, operation)
+      fetchArticles()
+    } catch (error) {
+      alert(`Error running bulk ${operation}: ` + (error.response?.data?.detail || error.message))
+    }
+  }
+
   const handleCreatePost = async (e) => {
     e.preventDefault()
     setCreating(true)
@@ -237,22 +285,74 @@ function AdminDashboard() {
         </div>
       </div>
 
-      <div className="mb-6 flex items-center justify-between">
+      <div className="mb-4 flex items-center justify-between">
         <h2 className="text-2xl font-bold text-gray-900">Manage Articles</h2>
         <div className="text-sm text-gray-600">
-          Total: <span className="font-semibold">{articles.length}</span> article{articles.length !== 1 ? 's' : ''}
+          Total: <span className="font-semibold">{total}</span> article{total !== 1 ? 's' : ''}
         </div>
       </div>
 
+      <div className="mb-6 flex flex-wrap items-center gap-3 text-sm">
+        <select name="published" value={filters.published} onChange={handleFilterChange} className="px-3 py-2 border border-gray-300 rounded-lg">
+          <option value="">All statuses</option>
+          <option value="true">Published</option>
+          <option value="false">Drafts</option>
+        </select>
+        <select name="automated" value={filters.automated} onChange={handleFilterChange} className="px-3 py-2 border border-gray-300 rounded-lg">
+          <option value="">Automated and manual</option>
+          <option value="true">Automated</option>
+          <option value="false">Manual</option>
+        </select>
+        <input
+          type="text"
+          name="tag"
+          value={filters.tag}
+          onChange={handleFilterChange}
+          placeholder="Tag"
+          className="px-3 py-2 border border-gray-300 rounded-lg"
+        />
+        <label className="flex items-center gap-2 text-gray-600">
+          From
+          <input type="date" name="created_from" value={filters.created_from} onChange={handleFilterChange} className="px-3 py-2 border border-gray-300 rounded-lg" />
+        </label>
+        <label className="flex items-center gap-2 text-gray-600">
+          To
+          <input type="date" name="created_to" value={filters.created_to} onChange={handleFilterChange} className="px-3 py-2 border border-gray-300 rounded-lg" />
+        </label>
+      </div>
+
+      {selected.length > 0 && (
+        <div className="mb-4 flex items-center gap-3 px-4 py-3 bg-blue-50 rounded-lg text-sm">
+          <span className="font-medium text-blue-900">{selected.length} selected</span>
+          <button onClick={() => handleBulk('publish')} className="px-3 py-1 bg-green-600 text-white rounded hover:bg-green-700">
+            Publish
+          </button>
+          <button onClick={() => handleBulk('unpublish')} className="px-3 py-1 bg-gray-600 text-white rounded hover:bg-gray-700">
+            Unpublish
+          </button>
+          <button onClick={() => handleBulk('delete')} className="px-3 py-1 bg-red-600 text-white rounded hover:bg-red-700">
+            Delete
+          </button>
+        </div>
+      )}
+
       {articles.length === 0 ? (
         <div className="text-center py-20 bg-white rounded-xl shadow">
-          <p className="text-gray-500 text-xl">No articles yet</p>
+          <p className="text-gray-500 text-xl">{total === 0 && page === 1 ? 'No articles found' : 'No articles on this page'}</p>
         </div>
       ) : (
         <div className="bg-white rounded-xl shadow overflow-hidden">
           <table className="w-full">
             <thead className="bg-gray-50">
               <tr>
+                <th className="pl-6 py-3 text-left">
+                  <input
+                    type="checkbox"
+                    checked={selected.length === articles.length}
+                    onChange={toggleSelectAll}
+                    className="w-4 h-4"
+                  />
+                </th>
                 <th className="px-6 py-3 text-left text-sm font-medium text-gray-500">Image</th>
                 <th className="px-6 py-3 text-left text-sm font-medium text-gray-500">Title</th>
                 <th className="px-6 py-3 text-left text-sm font-medium text-gray-500">Status</th>
@@ -263,6 +363,14 @@ function AdminDashboard() {
             <tbody className="divide-y divide-gray-200">
               {articles.map(article => (
                 <tr key={article.id} className="hover:bg-gray-50">
+                  <td className="pl-6 py-4">
+                    <input
+                      type="checkbox"
+                      checked={selected.includes(article.id)}
+                      onChange={() => toggleSelected(article.id)}
+                      className="w-4 h-4"
+                    />
+                  </td>
                   <td className="px-6 py-4">
                     <div className="w-16 h-12 bg-gray-100 rounded overflow-hidden">
                       {article.image_url ? (
@@ -307,6 +415,27 @@ function AdminDashboard() {
               ))}
             </tbody>
           </table>
+          <div className="px-6 py-3 flex items-center justify-between border-t text-sm text-gray-600">
+            <span>Page {page} of {pageCount}</span>
+            <div className="flex gap-2">
+              <button
+                onClick={() => setPage(p => Math.max(1, p - 1))}
+                disabled={page <= 1}
+                className="p-2 border border-gray-300 rounded-lg hover:bg-gray-50 disabled:opacity-50"
+                title="Previous page"
+              >
+                <ChevronLeft className="w-4 h-4" />
+              </button>
+              <button
+                onClick={() => setPage(p => Math.min(pageCount, p + 1))}
+                disabled={page >= pageCount}
+                className="p-2 border border-gray-300 rounded-lg hover:bg-gray-50 disabled:opacity-50"
+                title="Next page"
+              >
+                <ChevronRight className="w-4 h-4" />
+              </button>
+            </div>
+          </div>
         </div>
       )}
 